@@ -5,20 +5,31 @@ Explores the GraphQL API to understand available data and structure.
 """
 
 import json
-import urllib.request
-import urllib.parse
-import ssl
-from typing import Dict, Any, Optional
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Iterator
 import os
 import sys
 
 # Import shared utilities
 sys.path.insert(0, os.path.dirname(__file__))
 from utils import get_api_key
+import http_client
 
 # API endpoint
 API_URL = "https://api-op.grid.gg/central-data/graphql"
 
+# Nodes requested per page by the paginators (the API defaults to 10)
+DEFAULT_PAGE_SIZE = 50
+
+class GraphQLError(Exception):
+    """A GraphQL response that came back with errors instead of data."""
+
+    def __init__(self, errors):
+        messages = "; ".join(error.get("message", "Unknown error") for error in errors)
+        super().__init__(messages)
+        self.errors = errors
+
 # Headers - add API key if available
 def get_headers(api_key: Optional[str] = None) -> Dict[str, str]:
     """Get request headers with optional API key."""
@@ -32,104 +43,216 @@ def get_headers(api_key: Optional[str] = None) -> Dict[str, str]:
         headers["Authorization"] = f"Bearer {api_key}"
     return headers
 
-def query_graphql(query: str, variables: Optional[Dict] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
-    """Execute a GraphQL query."""
+def query_graphql(query: str, variables: Optional[Dict] = None, api_key: Optional[str] = None,
+                  use_cache: bool = True) -> Dict[str, Any]:
+    """Execute a GraphQL query (use_cache=False bypasses the response cache, e.g. for syncs)."""
     payload = {"query": query}
     if variables:
         payload["variables"] = variables
     
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(
-        API_URL,
-        data=data,
-        headers=get_headers(api_key),
-        method='POST'
-    )
-    
-    # Create SSL context (handles certificate verification)
-    # Try default context first, fallback to unverified if needed
-    ssl_context = ssl.create_default_context()
-    
     try:
-        with urllib.request.urlopen(req, context=ssl_context) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return result
-    except (ssl.SSLError, urllib.error.URLError) as e:
-        # Check if it's an SSL certificate error
-        if 'CERTIFICATE_VERIFY_FAILED' in str(e) or 'certificate' in str(e).lower():
-            # Fallback to unverified context if default fails (for testing)
-            print("⚠️  SSL certificate verification failed, using unverified context...")
-            ssl_context = ssl._create_unverified_context()
-            with urllib.request.urlopen(req, context=ssl_context) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                return result
-        else:
-            raise
+        return http_client.post_json(API_URL, payload, get_headers(api_key), use_cache=use_cache)
     except urllib.error.HTTPError as e:
         error_body = e.read().decode('utf-8')
         print(f"HTTP Error {e.code}: {error_body}")
         raise
 
-def get_titles(api_key: Optional[str] = None) -> Dict[str, Any]:
+def get_titles(api_key: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
     """Get all available titles."""
     query = """
     query Titles {
         titles {
             id
             name
+            nameShortened
         }
     }
     """
-    return query_graphql(query, api_key=api_key)
+    return query_graphql(query, api_key=api_key, use_cache=use_cache)
 
-def get_tournaments(title_id: str, api_key: Optional[str] = None) -> Dict[str, Any]:
-    """Get tournaments for a specific title."""
-    query = """
-    query Tournaments($titleId: [ID!]!) {
-        tournaments(filter: { title: { id: { in: $titleId } } }) {
-            totalCount
-            edges {
-                node {
-                    id
-                    name
+def paginate_pages(query: str, connection: str, variables: Optional[Dict] = None,
+                   api_key: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                   prefetch: bool = True, use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every page of a connection field, following pageInfo cursors.
+
+    The query must declare $first: Int and $after: Cursor, pass them to the
+    connection field and select pageInfo { endCursor hasNextPage }. With
+    prefetch, the next page is requested while the current one is consumed.
+    With use_cache=False every page is fetched fresh (needed for incremental
+    syncs, where a cached page could hide recent changes).
+    """
+    def fetch(after: Optional[str]) -> Dict[str, Any]:
+        page_variables = dict(variables or {}, first=page_size)
+        if after:
+            page_variables["after"] = after
+        result = query_graphql(query, page_variables, api_key=api_key, use_cache=use_cache)
+        if result.get("errors"):
+            raise GraphQLError(result["errors"])
+        return ((result.get("data") or {}).get(connection)) or {}
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="grid-page") as executor:
+        future = executor.submit(fetch, None)
+        while future is not None:
+            page = future.result()
+            page_info = page.get("pageInfo") or {}
+            has_next = page_info.get("hasNextPage") and page_info.get("endCursor") and page.get("edges")
+            future = None
+            if has_next and prefetch:
+                future = executor.submit(fetch, page_info["endCursor"])
+            yield page
+            if has_next and not prefetch:
+                future = executor.submit(fetch, page_info["endCursor"])
+
+def paginate(query: str, connection: str, variables: Optional[Dict] = None,
+             api_key: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE,
+             prefetch: bool = True, use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+    """Yield every node of a connection field across all pages (see paginate_pages)."""
+    for page in paginate_pages(query, connection, variables, api_key, page_size, prefetch, use_cache):
+        for edge in page.get("edges") or []:
+            yield edge["node"]
+
+def collect_pages(query: str, connection: str, variables: Optional[Dict] = None,
+                  api_key: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+    """
+    Fetch all pages and return them merged into a single response,
+    shaped like an unpaginated query ({"data": {connection: {"totalCount", "edges", "pageInfo"}}}).
+    """
+    merged = {"totalCount": 0, "edges": [], "pageInfo": {"endCursor": None, "hasNextPage": False}}
+    try:
+        for page in paginate_pages(query, connection, variables, api_key, page_size):
+            merged["edges"].extend(page.get("edges") or [])
+            merged["totalCount"] = page.get("totalCount", len(merged["edges"]))
+            merged["pageInfo"]["endCursor"] = (page.get("pageInfo") or {}).get("endCursor")
+    except GraphQLError as e:
+        return {"errors": e.errors, "data": None}
+    return {"data": {connection: merged}}
+
+TOURNAMENTS_QUERY = """
+query Tournaments($filter: TournamentFilter, $first: Int, $after: Cursor) {
+    tournaments(filter: $filter, first: $first, after: $after) {
+        totalCount
+        edges {
+            node {
+                id
+                name
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+ALL_SERIES_QUERY = """
+query AllSeries($tournamentId: [ID!]!, $first: Int, $after: Cursor) {
+    allSeries(
+        filter: { tournament: { id: { in: $tournamentId }, includeChildren: { equals: true } } }
+        orderBy: StartTimeScheduled
+        first: $first
+        after: $after
+    ) {
+        totalCount
+        edges {
+            node {
+                id
+                startTimeScheduled
+                teams {
+                    baseInfo {
+                        id
+                        name
+                    }
                 }
             }
         }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
     }
-    """
-    variables = {"titleId": [title_id]}
-    return query_graphql(query, variables, api_key=api_key)
+}
+"""
 
-def get_all_series(tournament_id: int, api_key: Optional[str] = None) -> Dict[str, Any]:
-    """Get all series for a tournament."""
-    query = """
-    query AllSeries($tournamentId: [ID!]!) {
-        allSeries(
-            filter: { tournament: { id: { in: $tournamentId }, includeChildren: { equals: true } } }
-            orderBy: StartTimeScheduled
-        ) {
-            totalCount
-            edges {
-                node {
+PLAYERS_QUERY = """
+query Players($filter: PlayerFilter, $first: Int, $after: Cursor) {
+    players(filter: $filter, first: $first, after: $after) {
+        totalCount
+        edges {
+            node {
+                id
+                nickname
+                team {
                     id
-                    startTimeScheduled
-                    teams {
-                        baseInfo {
-                            id
-                            name
-                        }
-                    }
+                    name
                 }
             }
-            pageInfo {
-                endCursor
-                hasNextPage
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+TEAMS_QUERY = """
+query Teams($filter: TeamFilter, $first: Int, $after: Cursor) {
+    teams(filter: $filter, first: $first, after: $after) {
+        totalCount
+        edges {
+            node {
+                id
+                name
+                nameShortened
             }
         }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
     }
-    """
+}
+"""
+
+def _tournament_filter(title_id: str, name_contains: Optional[str] = None) -> Dict[str, Any]:
+    tournament_filter = {"title": {"id": {"in": [title_id]}}}
+    if name_contains:
+        tournament_filter["name"] = {"contains": name_contains}
+    return tournament_filter
+
+def iter_tournaments(title_id: str, api_key: Optional[str] = None, name_contains: Optional[str] = None,
+                     page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield every tournament of a title (optionally only names containing a string)."""
+    variables = {"filter": _tournament_filter(title_id, name_contains)}
+    return paginate(TOURNAMENTS_QUERY, "tournaments", variables, api_key, page_size)
+
+def iter_all_series(tournament_id: int, api_key: Optional[str] = None,
+                    page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield every series of a tournament, including its child tournaments."""
+    variables = {"tournamentId": [tournament_id]}
+    return paginate(ALL_SERIES_QUERY, "allSeries", variables, api_key, page_size)
+
+def iter_players(title_id: str, api_key: Optional[str] = None,
+                 page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield every player of a title."""
+    return paginate(PLAYERS_QUERY, "players", {"filter": {"titleId": title_id}}, api_key, page_size)
+
+def iter_teams(title_id: str, api_key: Optional[str] = None,
+               page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield every team of a title."""
+    return paginate(TEAMS_QUERY, "teams", {"filter": {"titleId": title_id}}, api_key, page_size)
+
+def get_tournaments(title_id: str, api_key: Optional[str] = None) -> Dict[str, Any]:
+    """Get all tournaments for a specific title (every page)."""
+    variables = {"filter": _tournament_filter(title_id)}
+    return collect_pages(TOURNAMENTS_QUERY, "tournaments", variables, api_key)
+
+def get_all_series(tournament_id: int, api_key: Optional[str] = None) -> Dict[str, Any]:
+    """Get all series for a tournament (every page)."""
     variables = {"tournamentId": [tournament_id]}
-    return query_graphql(query, variables, api_key=api_key)
+    return collect_pages(ALL_SERIES_QUERY, "allSeries", variables, api_key)
 
 def explore_schema(api_key: Optional[str] = None) -> Dict[str, Any]:
     """Get GraphQL schema introspection to see what's available."""
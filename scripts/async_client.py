@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Asyncio Client for Grid.gg APIs
+Runs Series State, Central Data and File Download queries concurrently
+under a configurable concurrency limit.
+
+The blocking clients are run on a thread pool over the shared keep-alive
+transport (http_client), so no third-party async HTTP library is needed.
+"""
+
+import asyncio
+import functools
+import time
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+import http_client
+from rate_limiter import scheduler
+from response_cache import cache
+from singleflight import inflight
+import api_explorer
+import series_state_api
+import file_download_api
+from utils import get_api_key
+
+# Default number of in-flight requests
+DEFAULT_CONCURRENCY = 32
+
+class AsyncGridClient:
+    """
+    Asyncio-native wrapper around the Grid.gg API clients.
+
+    Usage:
+        async with AsyncGridClient(api_key, concurrency=100) as client:
+            states = await client.get_series_states(series_ids)
+    """
+
+    def __init__(self, api_key: Optional[str] = None, concurrency: int = DEFAULT_CONCURRENCY):
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="grid-async")
+        # Keep one idle connection per worker so concurrent requests reuse sockets
+        http_client.ensure_pool_size(concurrency)
+
+    async def __aenter__(self) -> "AsyncGridClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking client call on the worker pool, bounded by the semaphore."""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _gather(self, func, keys: List[str]) -> Dict[str, Any]:
+        """Run func(key) for every key; failures are returned as exceptions, not raised."""
+        results = await asyncio.gather(*(func(key) for key in keys), return_exceptions=True)
+        return dict(zip(keys, results))
+
+    # Central Data API
+    async def query_central_data(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
+        """Execute a Central Data GraphQL query."""
+        return await self._run(api_explorer.query_graphql, query, variables, api_key=self.api_key)
+
+    async def get_titles(self) -> Dict[str, Any]:
+        """Get all available titles."""
+        return await self._run(api_explorer.get_titles, self.api_key)
+
+    async def get_tournaments(self, title_id: str) -> Dict[str, Any]:
+        """Get tournaments for a specific title."""
+        return await self._run(api_explorer.get_tournaments, title_id, self.api_key)
+
+    async def get_all_series(self, tournament_id: int) -> Dict[str, Any]:
+        """Get all series for a tournament."""
+        return await self._run(api_explorer.get_all_series, tournament_id, self.api_key)
+
+    # Series State API
+    async def query_series_state(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
+        """Execute a Series State GraphQL query."""
+        return await self._run(series_state_api.query_graphql, query, variables, api_key=self.api_key)
+
+    async def get_series_state(self, series_id: str) -> Dict[str, Any]:
+        """Get complete series state for a Series ID."""
+        return await self._run(series_state_api.get_series_state, series_id, self.api_key)
+
+    async def get_series_states(self, series_ids: List[str]) -> Dict[str, Any]:
+        """Get series states for many Series IDs concurrently."""
+        return await self._gather(self.get_series_state, series_ids)
+
+    async def get_series_states_batched(self, series_ids: List[str],
+                                        batch_size: int = series_state_api.DEFAULT_BATCH_SIZE) -> Dict[str, Any]:
+        """Get series states for many Series IDs, packed into aliased batch queries run concurrently."""
+        batches = series_state_api.plan_batches(list(dict.fromkeys(series_ids)), batch_size=batch_size)
+        results = await asyncio.gather(*(self._run(series_state_api.fetch_batch, batch, self.api_key)
+                                         for batch in batches))
+        merged = {}
+        for batch_results in results:
+            merged.update(batch_results)
+        return merged
+
+    # File Download API
+    async def list_files(self, series_id: str) -> Dict[str, Any]:
+        """List all available files for a series."""
+        return await self._run(file_download_api.list_files, series_id, self.api_key)
+
+    async def list_files_many(self, series_ids: List[str]) -> Dict[str, Any]:
+        """List available files for many series concurrently."""
+        return await self._gather(self.list_files, series_ids)
+
+async def fetch_series_states(series_ids: List[str], api_key: Optional[str] = None,
+                              concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, Any]:
+    """Convenience wrapper: fetch series states for many series concurrently."""
+    async with AsyncGridClient(api_key, concurrency) as client:
+        return await client.get_series_states(series_ids)
+
+def main():
+    # Get API key (prioritizes .env file, then env var, then command line)
+    api_key = get_api_key()
+
+    args = sys.argv[1:]
+    concurrency = DEFAULT_CONCURRENCY
+    if "--concurrency" in args:
+        index = args.index("--concurrency")
+        concurrency = int(args[index + 1])
+        del args[index:index + 2]
+
+    series_ids = [arg for arg in args if arg.isdigit()]
+    if not series_ids:
+        print("Usage: python3 async_client.py <series-id> [<series-id> ...] [--concurrency N]")
+        return
+
+    print(f"🔍 Fetching {len(series_ids)} series states (concurrency {concurrency})...")
+    started = time.perf_counter()
+    results = asyncio.run(fetch_series_states(series_ids, api_key, concurrency))
+    elapsed = time.perf_counter() - started
+
+    failed = 0
+    for series_id, result in results.items():
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"  ❌ {series_id}: {result}")
+            continue
+        state = (result.get("data") or {}).get("seriesState")
+        if not state:
+            failed += 1
+            print(f"  ❌ {series_id}: no series data")
+            continue
+        teams = " vs ".join(t.get("name", "Unknown") for t in state.get("teams", []))
+        status = "Finished" if state.get("finished") else "In Progress" if state.get("started") else "Not Started"
+        print(f"  ✅ {series_id}: {teams} ({status})")
+
+    print()
+    print(f"✅ {len(results) - failed}/{len(results)} series in {elapsed:.2f}s "
+          f"({len(results) / max(elapsed, 1e-9):.1f} req/s)")
+    scheduler.print_stats()
+    cache.print_stats()
+    inflight.print_stats()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Bulk File Download
+Downloads events and end-state files for many series in parallel.
+
+Series IDs can come from a file (one per line), stdin, or a tournament ID.
+Files that already exist locally are skipped.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Optional, List
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+import http_client
+from api_explorer import iter_all_series
+from file_download_api import list_files, download_file, events_file_url, end_state_file_url
+from rate_limiter import scheduler
+from utils import get_api_key
+
+# Default number of parallel workers
+DEFAULT_WORKERS = 8
+
+def local_filename(series_id: str, file_info: Dict[str, Any]) -> str:
+    """Local file name for a listed file (matches file_download_api naming)."""
+    file_id = file_info.get("id")
+    if file_id == "events-grid":
+        return f"events_{series_id}_grid.jsonl.zip"
+    if file_id == "state-grid":
+        return f"end_state_{series_id}_grid.json"
+    return file_info.get("fileName") or f"{file_id}_{series_id}"
+
+def download_url(series_id: str, file_info: Dict[str, Any]) -> Optional[str]:
+    """Download URL for a listed file."""
+    file_id = file_info.get("id")
+    if file_id == "events-grid":
+        return events_file_url(series_id)
+    if file_id == "state-grid":
+        return end_state_file_url(series_id)
+    return file_info.get("fullURL")
+
+def read_series_ids(path: str) -> List[str]:
+    """Read series IDs, one per line, from a file or '-' for stdin."""
+    handle = sys.stdin if path == "-" else open(path, 'r')
+    try:
+        ids = []
+        for line in handle:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                ids.append(line)
+        return ids
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+def tournament_series_ids(tournament_id: str, api_key: Optional[str] = None) -> List[str]:
+    """Get the series IDs of a tournament (including child tournaments)."""
+    return [series["id"] for series in iter_all_series(int(tournament_id), api_key)]
+
+class BulkDownloader:
+    """Fans list_files and downloads for many series out over a bounded worker pool."""
+
+    def __init__(self, api_key: Optional[str] = None, output_dir: str = ".",
+                 workers: int = DEFAULT_WORKERS, file_ids: Optional[List[str]] = None):
+        self.api_key = api_key
+        self.output_dir = output_dir
+        self.workers = workers
+        self.file_ids = file_ids or ["events-grid", "state-grid"]
+        self.downloaded: List[str] = []
+        self.skipped: List[str] = []
+        self.failed: List[str] = []
+        self.bytes_downloaded = 0
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        http_client.ensure_pool_size(workers)
+
+    def _download(self, series_id: str, file_info: Dict[str, Any], path: str):
+        try:
+            download_file(download_url(series_id, file_info), self.api_key, path)
+        except Exception as e:
+            print(f"  ❌ {series_id} {file_info.get('id')}: {e}")
+            with self._lock:
+                self.failed.append(path)
+            return
+        size = os.path.getsize(path)
+        print(f"  ✅ {os.path.basename(path)} ({size:,} bytes)")
+        with self._lock:
+            self.downloaded.append(path)
+            self.bytes_downloaded += size
+
+    def _list(self, series_id: str, executor: ThreadPoolExecutor):
+        try:
+            files = list_files(series_id, self.api_key).get("files", [])
+        except Exception as e:
+            print(f"  ❌ {series_id}: could not list files ({e})")
+            with self._lock:
+                self.failed.append(series_id)
+            return
+
+        for file_info in files:
+            if file_info.get("id") not in self.file_ids:
+                continue
+            if file_info.get("status") != "ready":
+                print(f"  ⏳ {series_id} {file_info.get('id')}: {file_info.get('status')}")
+                continue
+            path = os.path.join(self.output_dir, local_filename(series_id, file_info))
+            if os.path.exists(path):
+                with self._lock:
+                    self.skipped.append(path)
+                continue
+            with self._lock:
+                self._pending.append(executor.submit(self._download, series_id, file_info, path))
+
+    def run(self, series_ids: List[str]) -> Dict[str, Any]:
+        """Download all ready files for the given series. Returns a summary."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            listings = [executor.submit(self._list, series_id, executor) for series_id in series_ids]
+            for future in listings:
+                future.result()
+            # Listing jobs have all finished, so no more downloads will be queued
+            for future in list(self._pending):
+                future.result()
+
+        elapsed = time.perf_counter() - started
+        return {
+            "series": len(series_ids),
+            "downloaded": len(self.downloaded),
+            "skipped": len(self.skipped),
+            "failed": len(self.failed),
+            "bytes": self.bytes_downloaded,
+            "seconds": elapsed,
+        }
+
+def print_summary(summary: Dict[str, Any]):
+    """Print aggregate throughput for a bulk run."""
+    seconds = max(summary["seconds"], 1e-9)
+    print("=" * 70)
+    print("✅ Bulk Download Summary:")
+    print(f"  Series: {summary['series']}")
+    print(f"  Files: {summary['downloaded']} downloaded | {summary['skipped']} skipped (exist) | {summary['failed']} failed")
+    print(f"  Data: {summary['bytes'] / 1e6:,.1f} MB in {summary['seconds']:.1f}s")
+    print(f"  Throughput: {summary['bytes'] / 1e6 / seconds:.2f} MB/s | "
+          f"{summary['downloaded'] / seconds:.2f} files/s | {summary['series'] / seconds:.2f} series/s")
+
+def main():
+    # Get API key (prioritizes .env file, then env var, then command line)
+    api_key = get_api_key()
+
+    args = sys.argv[1:]
+
+    def option(name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in args:
+            return args[args.index(name) + 1]
+        return default
+
+    workers = int(option("--workers", str(DEFAULT_WORKERS)))
+    output_dir = option("--output-dir", ".")
+    if option("--rate"):
+        # Override the File Download API rate limit (requests per second)
+        rate = float(option("--rate"))
+        scheduler.configure("file-download", rate, max(1, int(rate * 2)))
+
+    if option("--file"):
+        series_ids = read_series_ids(option("--file"))
+    elif "--stdin" in args:
+        series_ids = read_series_ids("-")
+    elif option("--tournament"):
+        print(f"🔍 Fetching series for tournament {option('--tournament')}...")
+        series_ids = tournament_series_ids(option("--tournament"), api_key)
+    else:
+        print("Usage: python3 bulk_download.py (--file ids.txt | --stdin | --tournament ID) "
+              "[--workers N] [--output-dir DIR] [--rate REQ_PER_SEC]")
+        return
+
+    # De-duplicate while keeping order
+    series_ids = list(dict.fromkeys(series_ids))
+    if not series_ids:
+        print("❌ No Series IDs provided")
+        return
+
+    print(f"📥 Downloading files for {len(series_ids)} series with {workers} workers...")
+    print()
+
+    summary = BulkDownloader(api_key, output_dir, workers).run(series_ids)
+    print()
+    print_summary(summary)
+    scheduler.print_stats()
+
+if __name__ == "__main__":
+    main()
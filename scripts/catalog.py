@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+Local Central Data Catalog
+SQLite mirror of titles, tournaments (with their parent/child tree), series,
+teams, players and player roles, so lookups are local queries instead of
+discovery chains against the Central Data API.
+
+`sync` only fetches entities whose updatedAt is at or after the newest
+updatedAt seen by the previous sync of the same title; --full refetches
+everything.
+
+Settings (environment variables):
+    GRID_CATALOG_DB=path   database file (default: <project root>/.cache/catalog.sqlite)
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from typing import Dict, Any, Optional, Iterable, List
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from api_explorer import query_graphql, paginate, get_titles, GraphQLError, DEFAULT_PAGE_SIZE
+from utils import get_api_key
+
+# Default database file (project root, gitignored)
+DEFAULT_CATALOG_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  ".cache", "catalog.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS titles (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_shortened TEXT
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id TEXT PRIMARY KEY,
+    title_id TEXT,
+    name TEXT NOT NULL,
+    name_shortened TEXT,
+    parent_id TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS series (
+    id TEXT PRIMARY KEY,
+    title_id TEXT,
+    tournament_id TEXT,
+    start_time_scheduled TEXT,
+    format TEXT,
+    type TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS series_teams (
+    series_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (series_id, team_id)
+);
+CREATE TABLE IF NOT EXISTS teams (
+    id TEXT PRIMARY KEY,
+    title_id TEXT,
+    name TEXT NOT NULL,
+    name_shortened TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS players (
+    id TEXT PRIMARY KEY,
+    title_id TEXT,
+    nickname TEXT NOT NULL,
+    team_id TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS roles (
+    id TEXT PRIMARY KEY,
+    title_id TEXT,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS player_roles (
+    player_id TEXT NOT NULL,
+    role_id TEXT NOT NULL,
+    PRIMARY KEY (player_id, role_id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    entity TEXT NOT NULL,
+    title_id TEXT NOT NULL,
+    updated_at TEXT,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (entity, title_id)
+);
+CREATE INDEX IF NOT EXISTS titles_name ON titles (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS tournaments_title ON tournaments (title_id, name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS tournaments_parent ON tournaments (parent_id);
+CREATE INDEX IF NOT EXISTS series_tournament ON series (tournament_id, start_time_scheduled);
+CREATE INDEX IF NOT EXISTS series_title_time ON series (title_id, start_time_scheduled);
+CREATE INDEX IF NOT EXISTS series_teams_team ON series_teams (team_id);
+CREATE INDEX IF NOT EXISTS teams_title_name ON teams (title_id, name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS players_team ON players (team_id);
+CREATE INDEX IF NOT EXISTS players_title_nickname ON players (title_id, nickname COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS player_roles_role ON player_roles (role_id);
+"""
+
+SYNC_TOURNAMENTS_QUERY = """
+query SyncTournaments($filter: TournamentFilter, $first: Int, $after: Cursor) {
+    tournaments(filter: $filter, first: $first, after: $after) {
+        edges {
+            node {
+                id
+                name
+                nameShortened
+                startDate
+                endDate
+                updatedAt
+                parent {
+                    id
+                }
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+SYNC_SERIES_QUERY = """
+query SyncSeries($filter: SeriesFilter, $first: Int, $after: Cursor) {
+    allSeries(filter: $filter, orderBy: UpdatedAt, first: $first, after: $after) {
+        edges {
+            node {
+                id
+                startTimeScheduled
+                updatedAt
+                type
+                format {
+                    nameShortened
+                }
+                tournament {
+                    id
+                }
+                teams {
+                    baseInfo {
+                        id
+                        name
+                    }
+                }
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+SYNC_TEAMS_QUERY = """
+query SyncTeams($filter: TeamFilter, $first: Int, $after: Cursor) {
+    teams(filter: $filter, first: $first, after: $after) {
+        edges {
+            node {
+                id
+                name
+                nameShortened
+                updatedAt
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+SYNC_PLAYERS_QUERY = """
+query SyncPlayers($filter: PlayerFilter, $first: Int, $after: Cursor) {
+    players(filter: $filter, first: $first, after: $after) {
+        edges {
+            node {
+                id
+                nickname
+                updatedAt
+                team {
+                    id
+                }
+                roles {
+                    id
+                    name
+                }
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+ROLES_QUERY = """
+query PlayerRoles {
+    playerRoles {
+        id
+        name
+        title {
+            id
+        }
+    }
+}
+"""
+
+# Entities synced per title, in dependency order: (entity, query, connection, filter builder)
+SYNC_ENTITIES = [
+    ("tournaments", SYNC_TOURNAMENTS_QUERY, "tournaments",
+     lambda title_id: {"title": {"id": {"in": [title_id]}}}),
+    ("teams", SYNC_TEAMS_QUERY, "teams", lambda title_id: {"titleId": title_id}),
+    ("players", SYNC_PLAYERS_QUERY, "players", lambda title_id: {"titleId": title_id}),
+    ("series", SYNC_SERIES_QUERY, "allSeries", lambda title_id: {"titleIds": {"in": [title_id]}}),
+]
+
+class Catalog:
+    """
+    The local catalog database.
+
+    Usage:
+        catalog = Catalog()
+        catalog.sync(api_key, ["valorant"])
+        title = catalog.find_title("valorant")
+        for tournament in catalog.tournaments(title["id"], name_contains="Americas"):
+            ...
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("GRID_CATALOG_DB") or DEFAULT_CATALOG_DB
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    # --- Sync ---------------------------------------------------------------
+
+    def sync_titles(self, api_key: Optional[str] = None) -> int:
+        """Refresh the (small) titles and player roles lists."""
+        # Titles are cached forever by the response cache, so always bypass it here
+        result = get_titles(api_key, use_cache=False)
+        if result.get("errors"):
+            raise GraphQLError(result["errors"])
+        titles = (result.get("data") or {}).get("titles") or []
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO titles (id, name, name_shortened) VALUES (?, ?, ?)",
+                [(t["id"], t["name"], t.get("nameShortened")) for t in titles])
+
+        roles = query_graphql(ROLES_QUERY, api_key=api_key, use_cache=False)
+        if not roles.get("errors"):
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO roles (id, title_id, name) VALUES (?, ?, ?)",
+                    [(r["id"], (r.get("title") or {}).get("id"), r["name"])
+                     for r in (roles.get("data") or {}).get("playerRoles") or []])
+        return len(titles)
+
+    def last_synced(self, entity: str, title_id: str) -> Optional[str]:
+        """Newest updatedAt stored by the previous sync of an entity for a title."""
+        row = self.db.execute("SELECT updated_at FROM sync_state WHERE entity = ? AND title_id = ?",
+                              (entity, title_id)).fetchone()
+        return row["updated_at"] if row else None
+
+    def sync_title(self, title_id: str, api_key: Optional[str] = None, full: bool = False,
+                   page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, int]:
+        """Fetch the tournaments, teams, players and series of a title changed since the last sync."""
+        counts = {}
+        for entity, query, connection, make_filter in SYNC_ENTITIES:
+            entity_filter = make_filter(title_id)
+            since = None if full else self.last_synced(entity, title_id)
+            if since:
+                entity_filter["updatedAt"] = {"gte": since}
+
+            newest = since
+            count = 0
+            batch: List[Dict[str, Any]] = []
+            # A cached page could hide changes and let the watermark skip past them
+            for node in paginate(query, connection, {"filter": entity_filter}, api_key, page_size,
+                                 use_cache=False):
+                batch.append(node)
+                if node.get("updatedAt") and (newest is None or node["updatedAt"] > newest):
+                    newest = node["updatedAt"]
+                if len(batch) >= 500:
+                    self._store(entity, title_id, batch)
+                    count += len(batch)
+                    batch = []
+            self._store(entity, title_id, batch)
+            count += len(batch)
+
+            # Only advance the watermark once the whole entity list was stored
+            with self.db:
+                self.db.execute("INSERT OR REPLACE INTO sync_state (entity, title_id, updated_at, synced_at) "
+                                "VALUES (?, ?, ?, ?)", (entity, title_id, newest, time.time()))
+            counts[entity] = count
+        return counts
+
+    def sync(self, api_key: Optional[str] = None, titles: Optional[Iterable[str]] = None,
+             full: bool = False) -> Dict[str, Dict[str, int]]:
+        """
+        Sync titles and roles, then each requested title (names or IDs; default:
+        every title that was synced before).
+        """
+        self.sync_titles(api_key)
+        if titles:
+            title_ids = []
+            for name in titles:
+                title = self.find_title(name)
+                if title is None:
+                    raise ValueError(f"Unknown title: {name}")
+                title_ids.append(title["id"])
+        else:
+            title_ids = [row["title_id"] for row in
+                         self.db.execute("SELECT DISTINCT title_id FROM sync_state")]
+        return {title_id: self.sync_title(title_id, api_key, full) for title_id in title_ids}
+
+    def _store(self, entity: str, title_id: str, nodes: List[Dict[str, Any]]):
+        if not nodes:
+            return
+        with self.db:
+            if entity == "tournaments":
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO tournaments (id, title_id, name, name_shortened, parent_id, "
+                    "start_date, end_date, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(n["id"], title_id, n["name"], n.get("nameShortened"), (n.get("parent") or {}).get("id"),
+                      n.get("startDate"), n.get("endDate"), n.get("updatedAt")) for n in nodes])
+            elif entity == "teams":
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO teams (id, title_id, name, name_shortened, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(n["id"], title_id, n["name"], n.get("nameShortened"), n.get("updatedAt")) for n in nodes])
+            elif entity == "players":
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO players (id, title_id, nickname, team_id, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(n["id"], title_id, n["nickname"], (n.get("team") or {}).get("id"), n.get("updatedAt"))
+                     for n in nodes])
+                self.db.executemany("DELETE FROM player_roles WHERE player_id = ?", [(n["id"],) for n in nodes])
+                roles = [(n["id"], role["id"], role["name"]) for n in nodes for role in n.get("roles") or []]
+                self.db.executemany("INSERT OR IGNORE INTO roles (id, title_id, name) VALUES (?, ?, ?)",
+                                    [(role_id, title_id, name) for _, role_id, name in roles])
+                self.db.executemany("INSERT OR IGNORE INTO player_roles (player_id, role_id) VALUES (?, ?)",
+                                    [(player_id, role_id) for player_id, role_id, _ in roles])
+            elif entity == "series":
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO series (id, title_id, tournament_id, start_time_scheduled, "
+                    "format, type, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(n["id"], title_id, (n.get("tournament") or {}).get("id"), n.get("startTimeScheduled"),
+                      (n.get("format") or {}).get("nameShortened"), n.get("type"), n.get("updatedAt"))
+                     for n in nodes])
+                self.db.executemany("DELETE FROM series_teams WHERE series_id = ?", [(n["id"],) for n in nodes])
+                participants = []
+                for n in nodes:
+                    for position, team in enumerate(n.get("teams") or []):
+                        base = team.get("baseInfo") or {}
+                        if base.get("id"):
+                            participants.append((n["id"], base["id"], position))
+                            # Teams from other titles/orgs may not be in the teams table yet
+                            self.db.execute("INSERT OR IGNORE INTO teams (id, title_id, name) VALUES (?, ?, ?)",
+                                            (base["id"], title_id, base.get("name") or ""))
+                self.db.executemany("INSERT OR IGNORE INTO series_teams (series_id, team_id, position) "
+                                    "VALUES (?, ?, ?)", participants)
+
+    # --- Lookups ------------------------------------------------------------
+
+    def is_synced(self, title_id: str, entity: str = "series") -> bool:
+        """Whether an entity of a title has been synced at least once."""
+        return self.db.execute("SELECT 1 FROM sync_state WHERE entity = ? AND title_id = ?",
+                               (entity, title_id)).fetchone() is not None
+
+    def find_title(self, name_or_id: str) -> Optional[Dict[str, Any]]:
+        """Title by ID, exact name/short name, or name substring (case-insensitive)."""
+        row = self.db.execute(
+            "SELECT id, name, name_shortened AS nameShortened FROM titles "
+            "WHERE id = ? OR name = ? COLLATE NOCASE OR name_shortened = ? COLLATE NOCASE",
+            (name_or_id, name_or_id, name_or_id)).fetchone()
+        if row is None:
+            row = self.db.execute(
+                "SELECT id, name, name_shortened AS nameShortened FROM titles WHERE name LIKE ? ORDER BY id",
+                (f"%{name_or_id}%",)).fetchone()
+        return dict(row) if row else None
+
+    def tournaments(self, title_id: str, name_contains: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Tournaments of a title (optionally only names containing a string)."""
+        sql = ("SELECT id, name, name_shortened AS nameShortened, parent_id AS parentId, "
+               "start_date AS startDate, end_date AS endDate FROM tournaments WHERE title_id = ?")
+        params: List[Any] = [title_id]
+        if name_contains:
+            sql += " AND name LIKE ?"
+            params.append(f"%{name_contains}%")
+        return [dict(row) for row in self.db.execute(sql + " ORDER BY id", params)]
+
+    def tournament_tree(self, tournament_id: str) -> List[str]:
+        """IDs of a tournament and all of its descendants."""
+        rows = self.db.execute(
+            "WITH RECURSIVE tree(id) AS (SELECT ? UNION SELECT t.id FROM tournaments t "
+            "JOIN tree ON t.parent_id = tree.id) SELECT id FROM tree", (str(tournament_id),))
+        return [row["id"] for row in rows]
+
+    def series(self, tournament_id: str, include_children: bool = True) -> List[Dict[str, Any]]:
+        """
+        Series of a tournament (and its child tournaments), ordered by scheduled start,
+        shaped like allSeries nodes: {"id", "startTimeScheduled", "teams": [{"baseInfo": {...}}]}.
+        """
+        ids = self.tournament_tree(tournament_id) if include_children else [str(tournament_id)]
+        placeholders = ",".join("?" * len(ids))
+        rows = self.db.execute(
+            f"SELECT id, start_time_scheduled, format, type, tournament_id FROM series "
+            f"WHERE tournament_id IN ({placeholders}) ORDER BY start_time_scheduled, id", ids).fetchall()
+        return self._series_nodes(rows)
+
+    def team_series(self, team_id: str, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Series a team played, optionally within [start, end] (ISO timestamps)."""
+        sql = ("SELECT s.id, s.start_time_scheduled, s.format, s.type, s.tournament_id FROM series s "
+               "JOIN series_teams st ON st.series_id = s.id WHERE st.team_id = ?")
+        params: List[Any] = [str(team_id)]
+        if start:
+            sql += " AND s.start_time_scheduled >= ?"
+            params.append(start)
+        if end:
+            sql += " AND s.start_time_scheduled <= ?"
+            params.append(end)
+        return self._series_nodes(self.db.execute(sql + " ORDER BY s.start_time_scheduled, s.id", params).fetchall())
+
+    def _series_nodes(self, rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
+        if not rows:
+            return []
+        ids = [row["id"] for row in rows]
+        teams: Dict[str, List[Dict[str, Any]]] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            for row in self.db.execute(
+                    f"SELECT st.series_id, t.id, t.name FROM series_teams st JOIN teams t ON t.id = st.team_id "
+                    f"WHERE st.series_id IN ({','.join('?' * len(chunk))}) ORDER BY st.series_id, st.position",
+                    chunk):
+                teams.setdefault(row["series_id"], []).append({"baseInfo": {"id": row["id"], "name": row["name"]}})
+        return [{
+            "id": row["id"],
+            "startTimeScheduled": row["start_time_scheduled"],
+            "format": row["format"],
+            "type": row["type"],
+            "tournamentId": row["tournament_id"],
+            "teams": teams.get(row["id"], []),
+        } for row in rows]
+
+    def find_team(self, name: str, title_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Team by ID, exact name/short name, or name substring (case-insensitive)."""
+        title_clause = " AND title_id = ?" if title_id else ""
+        extra = [title_id] if title_id else []
+        row = self.db.execute(
+            "SELECT id, name, name_shortened AS nameShortened FROM teams "
+            "WHERE (id = ? OR name = ? COLLATE NOCASE OR name_shortened = ? COLLATE NOCASE)" + title_clause,
+            [name, name, name] + extra).fetchone()
+        if row is None:
+            row = self.db.execute(
+                "SELECT id, name, name_shortened AS nameShortened FROM teams WHERE name LIKE ?" + title_clause +
+                " ORDER BY id", [f"%{name}%"] + extra).fetchone()
+        return dict(row) if row else None
+
+    def players(self, team_id: str) -> List[Dict[str, Any]]:
+        """Current players of a team with their role names."""
+        rows = self.db.execute(
+            "SELECT p.id, p.nickname, group_concat(r.name, ',') AS roles FROM players p "
+            "LEFT JOIN player_roles pr ON pr.player_id = p.id LEFT JOIN roles r ON r.id = pr.role_id "
+            "WHERE p.team_id = ? GROUP BY p.id ORDER BY p.nickname COLLATE NOCASE", (str(team_id),))
+        return [{"id": row["id"], "nickname": row["nickname"],
+                 "roles": row["roles"].split(",") if row["roles"] else []} for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        return {table: self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("titles", "tournaments", "series", "teams", "players", "roles")}
+
+def main():
+    args = sys.argv[1:]
+    commands = ("sync", "title", "tournaments", "series", "team", "stats")
+    if not args or args[0] not in commands:
+        print("Usage: python3 catalog.py sync [--title NAME|ID ...] [--full]")
+        print("       python3 catalog.py title <name>")
+        print("       python3 catalog.py tournaments <title> [name-contains]")
+        print("       python3 catalog.py series <tournament-id>")
+        print("       python3 catalog.py team <name>")
+        print("       python3 catalog.py stats")
+        return
+
+    command, args = args[0], args[1:]
+    catalog = Catalog()
+    print(f"🗂️  Catalog: {catalog.path}")
+
+    if command == "sync":
+        # Get API key (prioritizes .env file, then env var, then command line)
+        api_key = get_api_key()
+        titles = [args[i + 1] for i, arg in enumerate(args) if arg == "--title" and i + 1 < len(args)]
+        started = time.perf_counter()
+        try:
+            synced = catalog.sync(api_key, titles or None, full="--full" in args)
+        except (GraphQLError, ValueError) as e:
+            print(f"❌ Sync failed: {e}")
+            return
+        for title_id, counts in synced.items():
+            title = catalog.find_title(title_id)
+            changed = ", ".join(f"{count} {entity}" for entity, count in counts.items())
+            print(f"  ✅ {title['name'] if title else title_id}: {changed}")
+        if not synced:
+            print("  ℹ️  Titles synced; add --title NAME to mirror a title's tournaments, series, teams and players")
+        print(f"⏱️  Synced in {time.perf_counter() - started:.1f}s")
+        return
+
+    started = time.perf_counter()
+    if command == "title" and args:
+        rows = [catalog.find_title(args[0])]
+    elif command == "tournaments" and args:
+        title = catalog.find_title(args[0])
+        rows = catalog.tournaments(title["id"], args[1] if len(args) > 1 else None) if title else []
+    elif command == "series" and args:
+        rows = catalog.series(args[0])
+    elif command == "team" and args:
+        team = catalog.find_team(args[0])
+        rows = [dict(team, players=catalog.players(team["id"]))] if team else []
+    else:
+        rows = [catalog.counts()]
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    for row in rows:
+        print(f"  {row}")
+    if not rows or rows == [None]:
+        print("  ❌ Not found (run: python3 catalog.py sync --title <title>)")
+    print(f"⏱️  {elapsed_ms:.2f} ms")
+
+if __name__ == "__main__":
+    main()
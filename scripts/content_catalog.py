@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Content Catalog Store
+Downloads each content catalog version (champions/characters, items, maps)
+once, every page of it, and keeps it on disk. A published version never
+changes, so its file is written once and only read after that. Lookups by
+entity ID and by name are dict lookups.
+
+Settings (environment variables):
+    GRID_CONTENT_CATALOG_DIR=path   directory (default: <project root>/.cache/content_catalog)
+"""
+
+import json
+import os
+import sys
+import threading
+from typing import Dict, Any, Optional, List
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from api_explorer import paginate, GraphQLError, DEFAULT_PAGE_SIZE
+from utils import get_api_key
+
+# Default directory (project root, gitignored)
+DEFAULT_CONTENT_CATALOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                           ".cache", "content_catalog")
+
+# League of Legends title ID
+LOL_TITLE_ID = "3"
+
+VERSIONS_QUERY = """
+query ContentCatalogVersions($filter: ContentCatalogVersionFilter, $first: Int, $after: Cursor) {
+    contentCatalogVersions(filter: $filter, first: $first, after: $after) {
+        edges {
+            node {
+                id
+                name
+                publishedOn
+                title {
+                    id
+                }
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+ENTITIES_QUERY = """
+query ContentCatalogEntities($versionId: ID, $first: Int, $after: Cursor) {
+    contentCatalogEntities(contentCatalogVersionId: $versionId, first: $first, after: $after) {
+        edges {
+            node {
+                __typename
+                id
+                name
+                imageUrl
+                ... on ContentCatalogItem {
+                    cost
+                }
+                ... on ContentCatalogMap {
+                    bounds {
+                        min { x y }
+                        max { x y }
+                    }
+                }
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+# GraphQL type -> entity type
+ENTITY_TYPES = {
+    "ContentCatalogCharacter": "CHARACTER",
+    "ContentCatalogItem": "ITEM",
+    "ContentCatalogMap": "MAP",
+}
+
+def _name_key(name: str) -> str:
+    """Lookup key for names: case- and punctuation-insensitive ("Kai'Sa" == "kaisa")."""
+    return "".join(ch for ch in name.casefold() if ch.isalnum())
+
+class ContentCatalog:
+    """One catalog version with ID and name indexes."""
+
+    def __init__(self, version: Dict[str, Any], entities: List[Dict[str, Any]]):
+        self.version = version
+        self.entities = entities
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        # (type, name key) -> entity; a name can exist as both a character and an item
+        self.by_name: Dict[tuple, Dict[str, Any]] = {}
+        for entity in entities:
+            self.by_id[entity["id"]] = entity
+            self.by_name.setdefault((entity["type"], _name_key(entity["name"])), entity)
+            self.by_name.setdefault((None, _name_key(entity["name"])), entity)
+
+    @property
+    def id(self) -> str:
+        return self.version["id"]
+
+    @property
+    def name(self) -> str:
+        return self.version.get("name", "")
+
+    def get(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Entity by ID."""
+        return self.by_id.get(str(entity_id))
+
+    def find(self, name: str, entity_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Entity by name (case/punctuation-insensitive), optionally of one type (CHARACTER/ITEM/MAP)."""
+        return self.by_name.get((entity_type, _name_key(name)))
+
+    def name_of(self, entity_id: str, default: str = "Unknown") -> str:
+        entity = self.by_id.get(str(entity_id))
+        return entity["name"] if entity else default
+
+    def of_type(self, entity_type: str) -> List[Dict[str, Any]]:
+        return [entity for entity in self.entities if entity["type"] == entity_type]
+
+    def characters(self) -> List[Dict[str, Any]]:
+        return self.of_type("CHARACTER")
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+class ContentCatalogStore:
+    """
+    Downloads and caches catalog versions.
+
+    Usage:
+        catalog = content_store.latest(LOL_TITLE_ID, api_key)
+        catalog.find("Ahri", "CHARACTER")["id"]
+        catalog.name_of(character_id)
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or os.getenv("GRID_CONTENT_CATALOG_DIR") or DEFAULT_CONTENT_CATALOG_DIR
+        self._loaded: Dict[str, ContentCatalog] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, version_id: str) -> str:
+        return os.path.join(self.directory, f"{version_id}.json")
+
+    def versions(self, title_id: str = LOL_TITLE_ID, api_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Every catalog version of a title, newest first."""
+        variables = {"filter": {"title": {"id": {"in": [title_id]}}}}
+        versions = list(paginate(VERSIONS_QUERY, "contentCatalogVersions", variables, api_key))
+        versions.sort(key=lambda version: version.get("publishedOn") or "", reverse=True)
+        return versions
+
+    def load(self, version: Dict[str, Any], api_key: Optional[str] = None,
+             page_size: int = DEFAULT_PAGE_SIZE) -> ContentCatalog:
+        """
+        Catalog for a version ({"id", "name", ...} or just the ID), downloading it
+        the first time it's needed.
+        """
+        if not isinstance(version, dict):
+            version = {"id": str(version)}
+        version_id = str(version["id"])
+        with self._lock:
+            if version_id in self._loaded:
+                return self._loaded[version_id]
+
+            path = self._path(version_id)
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    data = json.load(f)
+            else:
+                data = self._download(version, api_key, page_size)
+                self._write(path, data)
+            catalog = ContentCatalog(data["version"], data["entities"])
+            self._loaded[version_id] = catalog
+            return catalog
+
+    def latest(self, title_id: str = LOL_TITLE_ID, api_key: Optional[str] = None) -> ContentCatalog:
+        """Catalog of the most recently published version of a title."""
+        versions = self.versions(title_id, api_key)
+        if not versions:
+            raise LookupError(f"No content catalog versions for title {title_id}")
+        return self.load(versions[0], api_key)
+
+    def cached_versions(self) -> List[str]:
+        """Version IDs available on disk."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name[:-len(".json")] for name in os.listdir(self.directory) if name.endswith(".json"))
+
+    def _download(self, version: Dict[str, Any], api_key: Optional[str], page_size: int) -> Dict[str, Any]:
+        entities = []
+        for node in paginate(ENTITIES_QUERY, "contentCatalogEntities", {"versionId": version["id"]},
+                             api_key, page_size):
+            entity = {
+                "id": str(node["id"]),
+                "name": node.get("name", ""),
+                "type": ENTITY_TYPES.get(node.get("__typename"), node.get("__typename")),
+                "imageUrl": node.get("imageUrl"),
+            }
+            if node.get("cost") is not None:
+                entity["cost"] = node["cost"]
+            if node.get("bounds"):
+                entity["bounds"] = node["bounds"]
+            entities.append(entity)
+        return {"version": version, "entities": entities}
+
+    def _write(self, path: str, data: Dict[str, Any]):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+# Store shared by every script in the process
+content_store = ContentCatalogStore()
+
+def main():
+    # Get API key (prioritizes .env file, then env var, then command line)
+    api_key = get_api_key()
+
+    # An API key passed on the command line is not a lookup
+    args = [arg for arg in sys.argv[1:] if arg != api_key]
+    if "--list" in args:
+        for version in content_store.versions(LOL_TITLE_ID, api_key):
+            cached = "💾" if version["id"] in content_store.cached_versions() else "  "
+            print(f"{cached} {version['id']}: {version.get('name')} ({version.get('publishedOn')})")
+        return
+
+    version_id = next((arg for arg in args if arg.startswith("--version=")), None)
+    names = [arg for arg in args if not arg.startswith("--")]
+    try:
+        if version_id:
+            catalog = content_store.load(version_id.split("=", 1)[1], api_key)
+        else:
+            catalog = content_store.latest(LOL_TITLE_ID, api_key)
+    except (GraphQLError, LookupError) as e:
+        print(f"❌ Could not load content catalog: {e}")
+        return
+
+    counts = {}
+    for entity in catalog.entities:
+        counts[entity["type"]] = counts.get(entity["type"], 0) + 1
+    print(f"📚 Content catalog {catalog.name or catalog.id}: "
+          + ", ".join(f"{count} {kind.lower()}s" for kind, count in sorted(counts.items())))
+
+    for name in names:
+        entity = catalog.get(name) or catalog.find(name)
+        print(f"  {name}: {entity if entity else '❌ not found'}")
+
+    if not names:
+        print("Usage: python3 content_catalog.py [--list] [--version=ID] [name-or-id ...]")
+
+if __name__ == "__main__":
+    main()
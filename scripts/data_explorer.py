@@ -18,6 +18,45 @@ from api_explorer import query_graphql as query_central_data, API_URL
 from series_state_api import query_graphql as query_series_state, SERIES_STATE_API_URL
 from file_download_api import list_files, FILE_DOWNLOAD_BASE_URL
 from utils import get_api_key
+from response_cache import cache
+from singleflight import inflight
+from content_catalog import content_store
+from query_builder import central_series_query, series_state_query
+
+# Fields pulled by explore_central_data's series query (see query_builder)
+EXPLORE_CENTRAL_SERIES_FIELDS = [
+    "startTimeScheduled", "format", "type", "title",
+    "tournament.id", "tournament.name", "tournament.nameShortened",
+    "tournament.startDate", "tournament.endDate",
+    "teams.baseInfo.id", "teams.baseInfo.name", "teams.baseInfo.nameShortened",
+    "teams.baseInfo.logoUrl", "teams.baseInfo.colorPrimary", "teams.baseInfo.colorSecondary",
+    "teams.baseInfo.rating", "teams.scoreAdvantage",
+    "players.id", "players.nickname", "players.fullName", "players.age", "players.nationality",
+    "players.team", "players.roles", "players.externalLinks",
+]
+
+# Fields pulled by explore_series_state's seriesState query (see query_builder)
+EXPLORE_SERIES_STATE_FIELDS = [
+    "version", "title", "format", "started", "startedAt", "duration",
+    "teams.name", "teams.score", "teams.won", "teams.kills", "teams.deaths",
+    "teams.damageDealt", "teams.damageTaken", "teams.visionScore", "teams.kdaRatio",
+    "teams.totalMoneyEarned", "teams.moneyPerMinute", "teams.damagePerMinute", "teams.baronPowerPlays",
+    "teams.players.name", "teams.players.kills", "teams.players.deaths", "teams.players.killAssistsGiven",
+    "teams.players.damageDealt", "teams.players.damageTaken", "teams.players.damagePercentage",
+    "teams.players.visionScore", "teams.players.visionScorePerMinute", "teams.players.kdaRatio",
+    "teams.players.totalMoneyEarned", "teams.players.moneyPerMinute", "teams.players.damagePerMinute",
+    "teams.players.killParticipation", "teams.players.forwardPercentage", "teams.players.character",
+    "games.sequenceNumber", "games.started", "games.finished", "games.startedAt", "games.duration", "games.map",
+    "games.teams.name", "games.teams.side", "games.teams.won", "games.teams.score",
+    "games.teams.kills", "games.teams.deaths",
+    "games.teams.damageDealt", "games.teams.damageTaken", "games.teams.visionScore", "games.teams.baronPowerPlays",
+    "games.teams.players.name", "games.teams.players.kills", "games.teams.players.deaths",
+    "games.teams.players.killAssistsGiven", "games.teams.players.character",
+    "games.teams.players.damageDealt", "games.teams.players.damageTaken", "games.teams.players.damagePercentage",
+    "games.teams.players.visionScore", "games.teams.players.kdaRatio", "games.teams.players.totalMoneyEarned",
+    "games.teams.players.respawnClock",
+    "games.draftActions",
+]
 
 def explore_central_data(api_key: str, series_id: str = "2616372"):
     """Explore Central Data API for detailed information."""
@@ -30,73 +69,10 @@ def explore_central_data(api_key: str, series_id: str = "2616372"):
     
     # 1. Get detailed series information
     print("1️⃣  Getting detailed Series information...")
-    query = """
-    query DetailedSeries {
-        series(id: "%s") {
-            id
-            startTimeScheduled
-            format {
-                id
-                name
-                nameShortened
-            }
-            type
-            title {
-                id
-                name
-                nameShortened
-            }
-            tournament {
-                id
-                name
-                nameShortened
-                startDate
-                endDate
-            }
-            teams {
-                baseInfo {
-                    id
-                    name
-                    nameShortened
-                    logoUrl
-                    colorPrimary
-                    colorSecondary
-                    rating
-                }
-                scoreAdvantage
-            }
-            players {
-                id
-                nickname
-                fullName
-                age
-                nationality {
-                    code
-                    name
-                }
-                team {
-                    id
-                    name
-                }
-                roles {
-                    id
-                    name
-                }
-                externalLinks {
-                    dataProvider {
-                        name
-                    }
-                    externalEntity {
-                        id
-                    }
-                }
-            }
-        }
-    }
-    """ % series_id
+    query = central_series_query(EXPLORE_CENTRAL_SERIES_FIELDS)
     
     try:
-        result = query_central_data(query, api_key=api_key)
+        result = query_central_data(query, {"seriesId": series_id}, api_key=api_key)
         if "data" in result and result["data"].get("series"):
             series = result["data"]["series"]
             results["series"] = series
@@ -240,32 +216,12 @@ def explore_central_data(api_key: str, series_id: str = "2616372"):
                 results["content_catalog_version"] = version
                 print(f"   ✅ Latest version: {version.get('name')} (Published: {version.get('publishedOn')})")
                 
-                # Get characters (champions)
-                char_query = """
-                query Characters {
-                    contentCatalogEntities(
-                        contentCatalogVersionId: "%s"
-                        filter: { entityType: { in: [CHARACTER] } }
-                        first: 10
-                    ) {
-                        edges {
-                            node {
-                                id
-                                name
-                                imageUrl
-                            }
-                        }
-                        totalCount
-                    }
-                }
-                """ % version["id"]
-                
-                char_result = query_central_data(char_query, api_key=api_key)
-                if "data" in char_result and char_result["data"].get("contentCatalogEntities"):
-                    chars = char_result["data"]["contentCatalogEntities"]
-                    results["characters"] = chars
-                    print(f"   ✅ Found {chars.get('totalCount', 0)} champions/characters")
-                    print(f"   Sample: {', '.join([e['node']['name'] for e in chars.get('edges', [])[:5]])}")
+                # Get characters (champions) - every page, cached on disk per version
+                catalog = content_store.load(version, api_key)
+                chars = catalog.characters()
+                results["characters"] = chars
+                print(f"   ✅ Found {len(chars)} champions/characters")
+                print(f"   Sample: {', '.join([c['name'] for c in chars[:5]])}")
     except Exception as e:
         print(f"   ❌ Error: {e}")
     
@@ -284,136 +240,10 @@ def explore_series_state(api_key: str, series_id: str = "2616372"):
     
     # Get comprehensive series state
     print("1️⃣  Getting comprehensive Series State...")
-    query = """
-    query ComprehensiveSeriesState {
-        seriesState(id: "%s") {
-            id
-            version
-            title {
-                nameShortened
-            }
-            format
-            started
-            finished
-            startedAt
-            duration
-            teams {
-                id
-                name
-                score
-                won
-                kills
-                deaths
-                ... on SeriesTeamStateLol {
-                    damageDealt
-                    damageTaken
-                    visionScore
-                    kdaRatio
-                    totalMoneyEarned
-                    moneyPerMinute
-                    damagePerMinute
-                    baronPowerPlays {
-                        id
-                        value
-                    }
-                }
-                players {
-                    id
-                    name
-                    kills
-                    deaths
-                    killAssistsGiven
-                    ... on SeriesPlayerStateLol {
-                        damageDealt
-                        damageTaken
-                        damagePercentage
-                        visionScore
-                        visionScorePerMinute
-                        kdaRatio
-                        totalMoneyEarned
-                        moneyPerMinute
-                        damagePerMinute
-                        killParticipation
-                        forwardPercentage
-                        character {
-                            id
-                            name
-                        }
-                    }
-                }
-            }
-            games {
-                id
-                sequenceNumber
-                started
-                finished
-                startedAt
-                duration
-                map {
-                    name
-                }
-                teams {
-                    id
-                    name
-                    side
-                    won
-                    score
-                    kills
-                    deaths
-                    ... on GameTeamStateLol {
-                        damageDealt
-                        damageTaken
-                        visionScore
-                        baronPowerPlays {
-                            id
-                            value
-                        }
-                    }
-                    players {
-                        id
-                        name
-                        kills
-                        deaths
-                        killAssistsGiven
-                        character {
-                            id
-                            name
-                        }
-                        ... on GamePlayerStateLol {
-                            damageDealt
-                            damageTaken
-                            damagePercentage
-                            visionScore
-                            kdaRatio
-                            totalMoneyEarned
-                            respawnClock {
-                                ticking
-                                currentSeconds
-                            }
-                        }
-                    }
-                }
-                draftActions {
-                    id
-                    type
-                    sequenceNumber
-                    drafter {
-                        id
-                        type
-                    }
-                    draftable {
-                        id
-                        type
-                        name
-                    }
-                }
-            }
-        }
-    }
-    """ % series_id
+    query = series_state_query(EXPLORE_SERIES_STATE_FIELDS)
     
     try:
-        result = query_series_state(query, api_key=api_key)
+        result = query_series_state(query, {"seriesId": series_id}, api_key=api_key)
         if "data" in result and result["data"].get("seriesState"):
             state = result["data"]["seriesState"]
             results["series_state"] = state
@@ -665,6 +495,8 @@ def main():
     print("=" * 80)
     print(f"💾 Full exploration data saved to: {filename}")
     print("=" * 80)
+    cache.print_stats()
+    inflight.print_stats()
 
 if __name__ == "__main__":
     main()
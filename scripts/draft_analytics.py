@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Draft Analytics
+Aggregates pick/ban drafts and game results over many series into dense
+champion x champion NumPy matrices:
+
+    synergy        picked together on the same team (games, wins)
+    counter        picked against each other (games, wins for the row champion)
+    ban_together   banned by the same team in the same game
+    pick_order     how often a champion is taken at each draft step
+
+Each player's champion pool (games and wins per champion) and each team's
+latest roster are kept alongside, so a team's comfort picks can be looked up.
+
+The count matrices grow in place as series arrive (games already counted are
+skipped), and the smoothed rate matrices derived from them are rebuilt once
+after each update, so queries such as "best picks given this partial draft"
+are a few vector operations over precomputed tables.
+
+Requires NumPy (optional dependency: pip install numpy).
+
+Settings (environment variables):
+    GRID_DRAFT_STATS=path   stats file (default: <project root>/.cache/draft_stats.npz)
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, Any, Optional, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from query_builder import build_selection, DRAFT_FIELDS
+from series_models import SeriesState, GameState, decode_series_states
+from series_state_api import get_series_states
+from utils import get_api_key
+
+# Default stats file (project root, gitignored)
+DEFAULT_DRAFT_STATS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                        ".cache", "draft_stats.npz")
+
+# Bump when the saved layout changes
+STATS_VERSION = 2
+
+# Draft steps tracked in pick_order (a pro draft has 20: 10 bans, 10 picks)
+MAX_DRAFT_STEPS = 20
+
+# Pseudo-games at a 50% win rate added to every rate, so a champion with
+# one win in one game doesn't top the tables
+PRIOR_GAMES = 10.0
+
+# Room for this many champions before the matrices are grown
+INITIAL_CAPACITY = 192
+
+# Count matrices (champions x champions) and vectors (champions)
+MATRICES = ("synergy_games", "synergy_wins", "counter_games", "counter_wins", "ban_together")
+VECTORS = ("picks", "wins", "bans")
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("draft_analytics requires NumPy: pip install numpy")
+
+def _smoothed(wins, games):
+    """Win rate pulled towards 50% by PRIOR_GAMES pseudo-games."""
+    return (wins + PRIOR_GAMES / 2) / (games + PRIOR_GAMES)
+
+def game_draft(game: GameState) -> Optional[Dict[str, Any]]:
+    """
+    Picks and bans of one game per team, in draft order:
+    {"teams": [id, id], "won": [bool, bool], "picks": [[...], [...]], "bans": [[...], [...]],
+     "order": [(step, "pick"/"ban", team index, champion id, champion name), ...]}
+    None if the game has no usable draft or result.
+    """
+    team_ids = [team.id for team in game.teams]
+    if len(team_ids) != 2 or not game.draft_actions:
+        return None
+    draft = {"teams": team_ids, "won": [team.won for team in game.teams],
+             "picks": [[], []], "bans": [[], []], "order": []}
+    for action in sorted(game.draft_actions, key=lambda a: a.sequence_number):
+        kind = (action.type or "").lower()
+        if kind not in ("pick", "ban") or not action.draftable_id or action.drafter_id not in team_ids:
+            continue
+        side = team_ids.index(action.drafter_id)
+        draft["picks" if kind == "pick" else "bans"][side].append(action.draftable_id)
+        draft["order"].append((action.sequence_number, kind, side, action.draftable_id, action.draftable_name))
+    if not any(draft["picks"]) or draft["won"][0] == draft["won"][1]:
+        return None
+    return draft
+
+class DraftStats:
+    """
+    Champion x champion draft tables.
+
+    Usage:
+        stats = DraftStats.load()
+        stats.add_series(SeriesState.from_response(result))
+        stats.best_picks(allies=["Ahri"], enemies=["Zed"], banned=["Azir"], k=5)
+        stats.save()
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        _require_numpy()
+        self.champions: List[str] = []          # index -> champion ID
+        self.names: List[str] = []              # index -> champion name
+        self.index: Dict[str, int] = {}         # champion ID -> index
+        self.by_name: Dict[str, int] = {}       # lower-case name -> index
+        self.seen_games: set = set()
+        self.games = 0
+        self.player_pools: Dict[str, Dict[str, List[int]]] = {}     # player ID -> champion ID -> [games, wins]
+        self.rosters: Dict[str, Tuple[str, List[str]]] = {}         # team ID -> (startedAt, player IDs)
+        self.counts: Dict[str, Any] = {}
+        for name in MATRICES:
+            self.counts[name] = np.zeros((capacity, capacity), dtype=np.int32)
+        for name in VECTORS:
+            self.counts[name] = np.zeros(capacity, dtype=np.int32)
+        self.counts["pick_order"] = np.zeros((capacity, MAX_DRAFT_STEPS), dtype=np.int32)
+        self._derived: Optional[Dict[str, Any]] = None
+
+    def __len__(self) -> int:
+        return len(self.champions)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _champion(self, champion_id: str, name: Optional[str]) -> int:
+        index = self.index.get(champion_id)
+        if index is None:
+            index = len(self.champions)
+            if index == len(self.counts["picks"]):
+                self._grow(2 * index)
+            self.champions.append(champion_id)
+            self.names.append(name or champion_id)
+            self.index[champion_id] = index
+            self.by_name.setdefault((name or champion_id).lower(), index)
+        return index
+
+    def _grow(self, capacity: int):
+        for name, counts in self.counts.items():
+            shape = (capacity,) + tuple(capacity if name in MATRICES else size for size in counts.shape[1:])
+            grown = np.zeros(shape, dtype=counts.dtype)
+            grown[tuple(slice(0, size) for size in counts.shape)] = counts
+            self.counts[name] = grown
+
+    def add_game(self, game: GameState) -> bool:
+        """Count one game's draft. Returns False if it was already counted or has no draft."""
+        if game.id is not None and game.id in self.seen_games:
+            return False
+        draft = game_draft(game)
+        if draft is None:
+            return False
+
+        names = {champion: name for _, _, _, champion, name in draft["order"]}
+        picks = [np.array([self._champion(c, names.get(c)) for c in side], dtype=np.int64)
+                 for side in draft["picks"]]
+        bans = [np.array([self._champion(c, names.get(c)) for c in side], dtype=np.int64)
+                for side in draft["bans"]]
+        counts = self.counts
+        for side in (0, 1):
+            own, other = picks[side], picks[1 - side]
+            won = int(draft["won"][side])
+            counts["picks"][own] += 1
+            counts["wins"][own] += won
+            counts["bans"][bans[side]] += 1
+            # Champions are unique within a draft, so fancy-index += never hits a cell twice
+            counts["synergy_games"][np.ix_(own, own)] += 1
+            counts["synergy_wins"][np.ix_(own, own)] += won
+            counts["counter_games"][np.ix_(own, other)] += 1
+            counts["counter_wins"][np.ix_(own, other)] += won
+            counts["ban_together"][np.ix_(bans[side], bans[side])] += 1
+
+        for step, (_, _, _, champion, _) in enumerate(draft["order"][:MAX_DRAFT_STEPS]):
+            counts["pick_order"][self.index[champion], step] += 1
+        self._add_pools(game)
+
+        if game.id is not None:
+            self.seen_games.add(game.id)
+        self.games += 1
+        self._derived = None
+        return True
+
+    def _add_pools(self, game: GameState):
+        for team in game.teams:
+            players = [player for player in team.players if player.id and player.character_id]
+            for player in players:
+                self._champion(player.character_id, player.character_name)
+                record = self.player_pools.setdefault(player.id, {}).setdefault(player.character_id, [0, 0])
+                record[0] += 1
+                record[1] += int(team.won)
+            started_at = game.started_at or ""
+            if players and team.id and started_at >= self.rosters.get(team.id, ("", []))[0]:
+                self.rosters[team.id] = (started_at, [player.id for player in players])
+
+    def add_series(self, state: SeriesState) -> int:
+        """Count every finished game of a series. Returns the number of new games."""
+        return sum(self.add_game(game) for game in state.games if game.finished)
+
+    # ------------------------------------------------------------------
+    # Precomputed tables
+    # ------------------------------------------------------------------
+
+    @property
+    def derived(self) -> Dict[str, Any]:
+        """
+        Smoothed rate tables, rebuilt once after an update:
+            win_rate[c]        win rate of c
+            synergy[a, b]      pair win rate minus the pair's mean solo win rate
+            counter[a, b]      a's win rate against b minus a's overall win rate
+            presence[c]        share of games in which c was picked or banned
+        """
+        if self._derived is None:
+            n = len(self.champions)
+            c = {name: counts[:n, :n] if name in MATRICES else counts[:n] for name, counts in self.counts.items()}
+            win_rate = _smoothed(c["wins"], c["picks"])
+            synergy = _smoothed(c["synergy_wins"], c["synergy_games"]) - (win_rate[:, None] + win_rate[None, :]) / 2
+            counter = _smoothed(c["counter_wins"], c["counter_games"]) - win_rate[:, None]
+            np.fill_diagonal(synergy, 0.0)
+            np.fill_diagonal(counter, 0.0)
+            games = max(self.games, 1)
+            self._derived = {
+                "win_rate": win_rate,
+                "synergy": synergy,
+                "counter": counter,
+                "presence": (c["picks"] + c["bans"]) / games,
+                "ban_together": c["ban_together"] / games,
+                "pick_order": c["pick_order"] / np.maximum(c["pick_order"].sum(axis=1, keepdims=True), 1),
+            }
+        return self._derived
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def resolve(self, champion: str) -> Optional[int]:
+        """Index of a champion ID or name (case-insensitive)."""
+        if champion in self.index:
+            return self.index[champion]
+        return self.by_name.get(champion.lower())
+
+    def _indexes(self, champions: Iterable[str]) -> List[int]:
+        indexes = [self.resolve(champion) for champion in champions]
+        return [index for index in indexes if index is not None]
+
+    def pick_scores(self, allies: Iterable[str] = (), enemies: Iterable[str] = (),
+                    banned: Iterable[str] = ()):
+        """
+        Score of every champion as the next pick for the allied team:
+        win rate + mean synergy with allies + mean advantage against enemies.
+        Unavailable champions score -inf.
+        """
+        derived = self.derived
+        allies, enemies = self._indexes(allies), self._indexes(enemies)
+        scores = derived["win_rate"].copy()
+        if allies:
+            scores += derived["synergy"][:, allies].mean(axis=1)
+        if enemies:
+            scores += derived["counter"][:, enemies].mean(axis=1)
+        taken = allies + enemies + self._indexes(banned)
+        scores[taken] = -np.inf
+        return scores
+
+    def best_picks(self, allies: Iterable[str] = (), enemies: Iterable[str] = (),
+                   banned: Iterable[str] = (), k: int = 5) -> List[Tuple[str, float]]:
+        """Top-k (champion name, score) picks for the allied team given a partial draft."""
+        return self._top(self.pick_scores(allies, enemies, banned), k)
+
+    def best_bans(self, allies: Iterable[str] = (), enemies: Iterable[str] = (),
+                  banned: Iterable[str] = (), k: int = 5) -> List[Tuple[str, float]]:
+        """Top-k bans: the best picks for the enemy team, weighted by how often they're drafted."""
+        scores = self.pick_scores(enemies, allies, banned)
+        return self._top(scores * np.sqrt(self.derived["presence"]), k)
+
+    def _top(self, scores, k: int) -> List[Tuple[str, float]]:
+        k = min(k, int(np.isfinite(scores).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.names[i], float(scores[i])) for i in top.tolist()]
+
+    def pool(self, team_id: Optional[str]):
+        """
+        Games each champion was played by the team's current roster (the most
+        games of any one player), indexed like the matrices; zeros if unknown.
+        """
+        games = np.zeros(len(self.champions), dtype=np.float64)
+        for player_id in self.rosters.get(team_id, ("", []))[1]:
+            for champion, (played, _) in self.player_pools.get(player_id, {}).items():
+                index = self.index[champion]
+                games[index] = max(games[index], played)
+        return games
+
+    def partners(self, champion: str, table: str = "synergy", k: int = 5) -> List[Tuple[str, float]]:
+        """Top-k champions for one champion in a derived table (synergy, counter, ban_together)."""
+        index = self.resolve(champion)
+        if index is None:
+            return []
+        row = self.derived[table][index].astype(np.float64)
+        row[index] = -np.inf
+        return self._top(row, k)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Optional[str] = None) -> str:
+        path = path or os.getenv("GRID_DRAFT_STATS") or DEFAULT_DRAFT_STATS_PATH
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        n = len(self.champions)
+        arrays = {name: counts[:n, :n] if name in MATRICES else counts[:n] for name, counts in self.counts.items()}
+        meta = {"version": STATS_VERSION, "champions": self.champions, "names": self.names,
+                "games": self.games, "seen_games": sorted(self.seen_games),
+                "player_pools": self.player_pools, "rosters": self.rosters}
+        # np.savez appends .npz unless the name already ends with it
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, meta=np.array(json.dumps(meta)), **arrays)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "DraftStats":
+        """Stats saved by save(), or empty stats if there are none (or they're from another version)."""
+        path = path or os.getenv("GRID_DRAFT_STATS") or DEFAULT_DRAFT_STATS_PATH
+        if not os.path.exists(path):
+            return cls()
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != STATS_VERSION:
+                return cls()
+            stats = cls(max(INITIAL_CAPACITY, 2 * len(meta["champions"])))
+            n = len(meta["champions"])
+            for name in stats.counts:
+                target = stats.counts[name]
+                target[tuple(slice(0, size) for size in data[name].shape)] = data[name]
+        stats.champions = meta["champions"]
+        stats.names = meta["names"]
+        stats.index = {champion: i for i, champion in enumerate(stats.champions)}
+        for i, name in enumerate(stats.names[:n]):
+            stats.by_name.setdefault(name.lower(), i)
+        stats.games = meta["games"]
+        stats.seen_games = set(meta["seen_games"])
+        stats.player_pools = meta["player_pools"]
+        stats.rosters = {team: (started_at, players) for team, (started_at, players) in meta["rosters"].items()}
+        return stats
+
+def fetch_drafts(series_ids: List[str], api_key: Optional[str] = None) -> Dict[str, SeriesState]:
+    """Series states with only the draft fields (picks, bans, sides, results, players' champions)."""
+    selection = build_selection(DRAFT_FIELDS + ["games.finished", "games.startedAt", "games.teams.players.character"])
+    results = get_series_states(series_ids, api_key, fields=selection.fields, fragments=selection.fragment_text)
+    return decode_series_states(results)
+
+def main():
+    # Get API key (prioritizes .env file, then env var, then command line)
+    api_key = get_api_key()
+
+    args = [arg for arg in sys.argv[1:] if arg != api_key]
+
+    def option(name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in args:
+            return args[args.index(name) + 1]
+        return default
+
+    def champions(name: str) -> List[str]:
+        return [c.strip() for c in (option(name) or "").split(",") if c.strip()]
+
+    if np is None:
+        print("❌ NumPy is required: pip install numpy")
+        return
+
+    stats = DraftStats.load(option("--stats"))
+
+    # Positional arguments (not option values) are series IDs
+    values = {i + 1 for i, arg in enumerate(args) if arg in ("--ally", "--enemy", "--ban", "--k", "--stats")}
+    series_ids = [arg for i, arg in enumerate(args) if i not in values and not arg.startswith("--")]
+    if "--stdin" in args:
+        series_ids += [line.split('#', 1)[0].strip() for line in sys.stdin if line.split('#', 1)[0].strip()]
+    if series_ids:
+        started = time.perf_counter()
+        states = fetch_drafts(list(dict.fromkeys(series_ids)), api_key)
+        added = sum(stats.add_series(state) for state in states.values())
+        path = stats.save(option("--stats"))
+        print(f"✅ Added {added} new games from {len(states)} series in {time.perf_counter() - started:.1f}s "
+              f"({stats.games} games, {len(stats)} champions) → {path}")
+
+    if not stats.games:
+        print("Usage: python3 draft_analytics.py [series-id ...] [--stdin] "
+              "[--ally A,B] [--enemy C] [--ban D,E] [--k 5] [--stats path.npz]")
+        print("Example: python3 tournament_crawler.py --title lol --region LCS | "
+              "python3 draft_analytics.py --stdin")
+        return
+
+    k = int(option("--k", "5"))
+    allies, enemies, banned = champions("--ally"), champions("--enemy"), champions("--ban")
+    unknown = [c for c in allies + enemies + banned if stats.resolve(c) is None]
+    if unknown:
+        print(f"⚠️  Never drafted (ignored): {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    picks = stats.best_picks(allies, enemies, banned, k)
+    bans = stats.best_bans(allies, enemies, banned, k)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print(f"\n📊 Draft stats: {stats.games} games, {len(stats)} champions")
+    print("🎯 Best picks: " + ", ".join(f"{name} ({score:.3f})" for name, score in picks))
+    print("🚫 Best bans: " + ", ".join(f"{name} ({score:.3f})" for name, score in bans))
+    for champion in allies[:1]:
+        print(f"🤝 Best partners for {champion}: "
+              + ", ".join(f"{name} ({score:+.3f})" for name, score in stats.partners(champion)))
+    print(f"⏱️  Queries answered in {elapsed_ms:.2f} ms")
+
+if __name__ == "__main__":
+    main()
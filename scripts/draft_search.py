@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Draft Recommendation Search
+Suggests the next pick or ban for a partial draft from the precomputed
+draft_analytics tables (win rates, synergy, counters) and the drafting
+teams' champion pools.
+
+The search looks a few draft steps ahead (each side choosing its best
+option in turn) but only expands the top few candidates at every step, as
+ranked by a vectorised one-step score over all champions. Subtree values
+are memoised by the set of picks and bans (as integer bitmasks, which the
+garbage collector doesn't have to scan), so the same position reached in a
+different order - or asked again at the next step of the same draft - is
+not searched twice.
+
+Requires NumPy (optional dependency: pip install numpy).
+
+Usage:
+    python3 draft_search.py --draft Azir,Zed,... [--blue TEAM_ID] [--red TEAM_ID]
+    python3 draft_search.py --benchmark <series-id ...> | --stdin
+"""
+
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from draft_analytics import DraftStats, fetch_drafts, game_draft
+from utils import get_api_key
+
+# Standard tournament draft: (side, action) per step; side 0 is blue (first to act)
+DRAFT_ORDER = (
+    (0, "ban"), (1, "ban"), (0, "ban"), (1, "ban"), (0, "ban"), (1, "ban"),
+    (0, "pick"), (1, "pick"), (1, "pick"), (0, "pick"), (0, "pick"), (1, "pick"),
+    (1, "ban"), (0, "ban"), (1, "ban"), (0, "ban"),
+    (1, "pick"), (0, "pick"), (0, "pick"), (1, "pick"),
+)
+
+# Draft steps searched ahead and candidates expanded per step (root / below)
+DEFAULT_DEPTH = 3
+DEFAULT_ROOT_WIDTH = 16
+DEFAULT_WIDTH = 6
+
+# Weight of a comfort pick: POOL_WEIGHT * log(1 + games on the champion)
+POOL_WEIGHT = 0.02
+
+# Weight of the best pick still open to each side when a search stops mid-draft
+POTENTIAL_WEIGHT = 0.5
+
+# Memoised positions kept (least recently used are dropped first)
+MEMO_SIZE = 200_000
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("draft_search requires NumPy: pip install numpy")
+
+class DraftSearch:
+    """
+    Pruned look-ahead over the remaining draft steps.
+
+    Values are from blue's point of view: each pick adds the champion's win
+    rate (relative to 50%), comfort in the team's pool, synergy with the
+    team's earlier picks and its advantage against the enemy's picks.
+
+    Usage:
+        search = DraftSearch(DraftStats.load())
+        search.recommend([("ban", 0, "Azir"), ("ban", 1, "Zed")], blue_team="47", red_team="53")
+    """
+
+    def __init__(self, stats: DraftStats, depth: int = DEFAULT_DEPTH, root_width: int = DEFAULT_ROOT_WIDTH,
+                 width: int = DEFAULT_WIDTH):
+        _require_numpy()
+        self.stats = stats
+        self.depth = depth
+        self.root_width = root_width
+        self.width = width
+        derived = stats.derived
+        self.base = derived["win_rate"] - 0.5
+        self.synergy = derived["synergy"]
+        # Antisymmetric matchup: how much better a does against b than b against a
+        self.matchup = (derived["counter"] - derived["counter"].T) / 2
+        self.presence = derived["presence"]
+        # Row c is how every champion's gains change once c is picked (own side / other side)
+        self.synergy_columns = np.ascontiguousarray(self.synergy.T)
+        self.matchup_columns = np.ascontiguousarray(self.matchup.T)
+        self.memo: "OrderedDict[tuple, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._pools: Dict[Optional[str], Any] = {}
+
+    def _pool(self, team_id: Optional[str]):
+        if team_id not in self._pools:
+            self._pools[team_id] = self.base + POOL_WEIGHT * np.log1p(self.stats.pool(team_id))
+        return self._pools[team_id]
+
+    def _gains(self, own: Tuple[int, ...], other: Tuple[int, ...], unit):
+        """Value each champion would add to a team with picks own facing other (vector)."""
+        gains = unit.copy()
+        if own:
+            gains += self.synergy[:, own].sum(axis=1)
+        if other:
+            gains += self.matchup[:, other].sum(axis=1)
+        return gains
+
+    def _candidates(self, gains, blocked, width: int):
+        """Indexes of the top-width available champions by gains (blocked is -inf where taken)."""
+        scores = gains + blocked
+        width = min(width, int(np.isfinite(scores).sum()))
+        if width <= 0:
+            return np.zeros(0, dtype=np.int64)
+        top = np.argpartition(-scores, width - 1)[:width]
+        return top[np.argsort(-scores[top])]
+
+    def _potential(self, gains_blue, gains_red, blocked):
+        """Leaf value: each side's best open pick (rows of a 2-D batch are separate positions)."""
+        best_blue = np.max(gains_blue + blocked, axis=-1)
+        best_red = np.max(gains_red + blocked, axis=-1)
+        return POTENTIAL_WEIGHT * (np.where(np.isfinite(best_blue), best_blue, 0.0)
+                                   - np.where(np.isfinite(best_red), best_red, 0.0))
+
+    def _search(self, masks: Tuple[int, int, int], step: int, depth: int, units, gains, blocked) -> float:
+        """
+        Value (for blue) of the rest of the draft with both sides choosing their
+        best option for depth steps. masks are the blue picks, red picks and bans
+        as bitmasks of champion indexes.
+        """
+        key = masks + (step, depth, id(units[0]), id(units[1]))
+        value = self.memo.get(key)
+        if value is not None:
+            self.hits += 1
+            self.memo.move_to_end(key)
+            return value
+        self.misses += 1
+
+        if step >= len(DRAFT_ORDER):
+            value = 0.0
+        elif depth == 0:
+            # Stopped mid-draft: credit each side with its best open pick
+            value = float(self._potential(gains[0], gains[1], blocked))
+        else:
+            value = self._options(masks, step, depth, units, gains, blocked, self.width)[0][1]
+
+        self.memo[key] = value
+        if len(self.memo) > MEMO_SIZE:
+            self.memo.popitem(last=False)
+        return value
+
+    def _options(self, masks: Tuple[int, int, int], step: int, depth: int, units, gains, blocked,
+                 width: int) -> List[Tuple[int, float]]:
+        """(champion, value for blue of the rest of the draft) per candidate, best for the side to move first."""
+        side, action = DRAFT_ORDER[step]
+        sign = 1.0 if side == 0 else -1.0
+        # Picks: the side's own best gains; bans: what the other side would most like to pick
+        candidates = self._candidates(gains[side] if action == "pick" else gains[1 - side], blocked, width)
+        if not len(candidates):
+            return [(-1, 0.0)]
+
+        if depth == 1 and step + 1 < len(DRAFT_ORDER):
+            # The children are leaves: score them all at once, one row per candidate
+            rows = np.arange(len(candidates))
+            after_blocked = np.repeat(blocked[None, :], len(candidates), axis=0)
+            after_blocked[rows, candidates] = -np.inf
+            after = [gains[0][None, :], gains[1][None, :]]
+            values = np.zeros(len(candidates))
+            if action == "pick":
+                after[side] = after[side] + self.synergy_columns[candidates]
+                after[1 - side] = after[1 - side] + self.matchup_columns[candidates]
+                values += sign * gains[side][candidates]
+            values += self._potential(after[0], after[1], after_blocked)
+            options = list(zip(candidates.tolist(), values.tolist()))
+        else:
+            options = []
+            for champion in candidates.tolist():
+                after_blocked = blocked.copy()
+                after_blocked[champion] = -np.inf
+                if action == "pick":
+                    after = list(masks)
+                    after[side] |= 1 << champion
+                    # A pick changes every champion's gains by its synergy/matchup column
+                    after_gains = [None, None]
+                    after_gains[side] = gains[side] + self.synergy_columns[champion]
+                    after_gains[1 - side] = gains[1 - side] + self.matchup_columns[champion]
+                    value = sign * gains[side][champion] + self._search(
+                        tuple(after), step + 1, depth - 1, units, tuple(after_gains), after_blocked)
+                else:
+                    after = (masks[0], masks[1], masks[2] | 1 << champion)
+                    value = self._search(after, step + 1, depth - 1, units, gains, after_blocked)
+                options.append((champion, value))
+        options.sort(key=lambda option: sign * option[1], reverse=True)
+        return options
+
+    def recommend(self, actions: Iterable[Tuple[str, int, str]], blue_team: Optional[str] = None,
+                  red_team: Optional[str] = None, k: int = 5) -> Dict[str, Any]:
+        """
+        Top-k next actions for a partial draft.
+
+        Args:
+            actions: (action "pick"/"ban", side 0=blue/1=red, champion ID or name) in draft order
+            blue_team/red_team: team IDs whose rosters' champion pools count as comfort picks
+
+        Returns:
+            {"step", "side", "action", "options": [(champion name, score), ...]}, where score is
+            the side's expected advantage over the searched steps (higher is better for that side)
+        """
+        picks: Tuple[List[int], List[int]] = ([], [])
+        bans = set()
+        step = 0
+        for action, side, champion in actions:
+            index = self.stats.resolve(champion)
+            step += 1
+            if index is None:
+                continue
+            if action == "pick":
+                picks[side].append(index)
+            else:
+                bans.add(index)
+        if step >= len(DRAFT_ORDER):
+            return {"step": step, "side": None, "action": None, "options": []}
+
+        units = (self._pool(blue_team), self._pool(red_team))
+        blocked = np.zeros(len(self.base), dtype=np.float64)
+        blocked[picks[0] + picks[1] + list(bans)] = -np.inf
+        gains = (self._gains(tuple(picks[0]), tuple(picks[1]), units[0]),
+                 self._gains(tuple(picks[1]), tuple(picks[0]), units[1]))
+        masks = tuple(sum(1 << index for index in set(indexes)) for indexes in (picks[0], picks[1], bans))
+        options = self._options(masks, step, self.depth, units, gains, blocked, max(self.root_width, k))
+        side, action = DRAFT_ORDER[step]
+        sign = 1.0 if side == 0 else -1.0
+        return {"step": step, "side": side, "action": action,
+                "options": [(self.stats.names[champion], sign * value) for champion, value in options[:k]
+                            if champion >= 0]}
+
+def draft_actions(draft: Dict[str, Any]) -> Tuple[List[Tuple[str, int, str]], str, str]:
+    """
+    (actions, blue team ID, red team ID) for a game_draft(), where actions are
+    (action, side, champion ID) in draft order and blue is the first to act.
+    """
+    first = draft["order"][0][2] if draft["order"] else 0
+    actions = [(action, side if first == 0 else 1 - side, champion)
+               for _, action, side, champion, _ in draft["order"]]
+    return actions, draft["teams"][first], draft["teams"][1 - first]
+
+def benchmark(search: DraftSearch, drafts: List[Tuple[List[Tuple[str, int, str]], Optional[str], Optional[str]]],
+              k: int = 5) -> Dict[str, Any]:
+    """
+    Replay drafts step by step, timing each recommendation and checking
+    whether the action actually taken was in the top-k.
+    """
+    latencies = []
+    hits = 0
+    for actions, blue_team, red_team in drafts:
+        for step in range(min(len(actions), len(DRAFT_ORDER))):
+            started = time.perf_counter()
+            result = search.recommend(actions[:step], blue_team, red_team, k)
+            latencies.append((time.perf_counter() - started) * 1000)
+            chosen = actions[step][2]
+            hits += any(search.stats.resolve(chosen) == search.stats.resolve(name) for name, _ in result["options"])
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] if latencies else 0.0
+
+    return {
+        "drafts": len(drafts),
+        "requests": len(latencies),
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "top_k_hit_rate": hits / len(latencies) if latencies else 0.0,
+        "memo_hit_rate": search.hits / max(search.hits + search.misses, 1),
+    }
+
+def main():
+    # Get API key (prioritizes .env file, then env var, then command line)
+    api_key = get_api_key()
+
+    args = [arg for arg in sys.argv[1:] if arg != api_key]
+
+    def option(name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in args:
+            return args[args.index(name) + 1]
+        return default
+
+    if np is None:
+        print("❌ NumPy is required: pip install numpy")
+        return
+
+    stats = DraftStats.load(option("--stats"))
+    if not stats.games:
+        print("❌ No draft stats yet; build them with: python3 draft_analytics.py <series-id ...>")
+        return
+    search = DraftSearch(stats, int(option("--depth", str(DEFAULT_DEPTH))),
+                         width=int(option("--width", str(DEFAULT_WIDTH))))
+    k = int(option("--k", "5"))
+
+    if "--benchmark" in args:
+        values = {i + 1 for i, arg in enumerate(args) if arg in ("--stats", "--depth", "--width", "--k")}
+        series_ids = [arg for i, arg in enumerate(args) if i not in values and not arg.startswith("--")]
+        if "--stdin" in args:
+            series_ids += [line.split('#', 1)[0].strip() for line in sys.stdin if line.split('#', 1)[0].strip()]
+        states = fetch_drafts(list(dict.fromkeys(series_ids)), api_key)
+        drafts = []
+        for state in states.values():
+            for game in state.games:
+                draft = game_draft(game)
+                if draft:
+                    drafts.append(draft_actions(draft))
+        if not drafts:
+            print("❌ No drafts to replay")
+            return
+        print(f"⏱️  Replaying {len(drafts)} drafts (depth {search.depth}, width {search.width})...")
+        result = benchmark(search, drafts, k)
+        print(f"✅ {result['requests']} recommendations: p50 {result['p50_ms']:.2f} ms, "
+              f"p95 {result['p95_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, max {result['max_ms']:.2f} ms")
+        print(f"🎯 Actual action in top {k}: {result['top_k_hit_rate'] * 100:.1f}%, "
+              f"memo hits: {result['memo_hit_rate'] * 100:.1f}%")
+        return
+
+    if option("--draft") is None:
+        print("Usage: python3 draft_search.py --draft CHAMP,CHAMP,... [--blue TEAM_ID] [--red TEAM_ID] [--k 5]")
+        print("       python3 draft_search.py --benchmark <series-id ...> [--stdin] [--depth N] [--width N]")
+        return
+
+    champions = [c.strip() for c in option("--draft").split(",") if c.strip()]
+    actions = [(action, side, champion) for (side, action), champion in zip(DRAFT_ORDER, champions)]
+    started = time.perf_counter()
+    result = search.recommend(actions, option("--blue"), option("--red"), k)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if result["action"] is None:
+        print("✅ Draft is complete")
+        return
+    side = "Blue" if result["side"] == 0 else "Red"
+    print(f"🎯 Step {result['step'] + 1}: {side} {result['action']} ({elapsed_ms:.1f} ms)")
+    for name, score in result["options"]:
+        print(f"  {name}: {score:+.3f}")
+
+if __name__ == "__main__":
+    main()
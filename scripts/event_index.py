@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Events Index
+Builds a sidecar index (events_<id>_grid.jsonl.idx.json) next to an extracted
+events JSONL file. It maps event type, game sequence number and timestamp
+buckets to byte offsets, so queries seek straight to the lines they need
+instead of decoding the whole file.
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Any, Optional, Iterable, Iterator, List
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from events import event_types, event_timestamp, parse_timestamp, extract_jsonl, GameTracker
+
+# Bump when the index layout changes (older sidecars are rebuilt)
+INDEX_VERSION = 2
+
+# Default width of a timestamp bucket (seconds)
+DEFAULT_BUCKET_SECONDS = 60
+
+def index_path(jsonl_path: str) -> str:
+    """Sidecar index file for an events JSONL file."""
+    return jsonl_path + ".idx.json"
+
+class EventIndex:
+    """
+    Byte-offset index over one events JSONL file.
+
+    Usage:
+        index = EventIndex.load("events_2616372_grid.jsonl")
+        for event in index.query(types=["kill"], game=2):
+            ...
+    """
+
+    def __init__(self, path: str, data: Dict[str, Any]):
+        self.path = path
+        self.data = data
+        self.bucket_seconds = data["bucket_seconds"]
+        self.types: Dict[str, List[int]] = data["types"]
+        self.games: Dict[str, List[int]] = data["games"]
+        # Offset of every non-empty line (type-less queries must include lines without an event type)
+        self.lines: List[int] = data["offsets"]
+        # Bucket start (epoch seconds) -> offset of the first line in that bucket
+        self.buckets: Dict[int, int] = {int(k): v for k, v in data["buckets"].items()}
+
+    @classmethod
+    def build(cls, path: str, bucket_seconds: int = DEFAULT_BUCKET_SECONDS) -> "EventIndex":
+        """Scan a JSONL file once and build its index."""
+        types: Dict[str, List[int]] = {}
+        games: Dict[str, List[int]] = {}
+        buckets: Dict[str, int] = {}
+        line_offsets: List[int] = []
+        tracker = GameTracker()
+        offset = 0
+
+        with open(path, 'rb') as f:
+            for line in f:
+                line_offset = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                line_offsets.append(line_offset)
+
+                for event_type in event_types(event):
+                    types.setdefault(event_type, []).append(line_offset)
+
+                game = tracker.game_of(event)
+                if game is not None:
+                    games.setdefault(str(game), []).append(line_offset)
+
+                seconds = parse_timestamp(event_timestamp(event))
+                if seconds is not None:
+                    bucket = str(int(seconds // bucket_seconds * bucket_seconds))
+                    buckets.setdefault(bucket, line_offset)
+
+        stat = os.stat(path)
+        data = {
+            "version": INDEX_VERSION,
+            "source_size": stat.st_size,
+            "source_mtime": stat.st_mtime,
+            "bucket_seconds": bucket_seconds,
+            "lines": len(line_offsets),
+            "offsets": line_offsets,
+            "types": types,
+            "games": games,
+            "buckets": buckets,
+        }
+        return cls(path, data)
+
+    def save(self) -> str:
+        """Write the index next to its JSONL file. Returns the sidecar path."""
+        sidecar = index_path(self.path)
+        tmp_path = sidecar + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, separators=(',', ':'))
+        os.replace(tmp_path, sidecar)
+        return sidecar
+
+    def is_current(self) -> bool:
+        """Check the index still matches the JSONL file it was built from."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (self.data.get("version") == INDEX_VERSION
+                and self.data.get("source_size") == stat.st_size
+                and self.data.get("source_mtime") == stat.st_mtime)
+
+    @classmethod
+    def load(cls, path: str, bucket_seconds: int = DEFAULT_BUCKET_SECONDS) -> "EventIndex":
+        """Load the sidecar index for a JSONL file, building it if missing or stale."""
+        sidecar = index_path(path)
+        if os.path.exists(sidecar):
+            try:
+                with open(sidecar, 'r') as f:
+                    index = cls(path, json.load(f))
+                if index.is_current():
+                    return index
+            except (ValueError, KeyError):
+                pass
+        index = cls.build(path, bucket_seconds)
+        index.save()
+        return index
+
+    def _time_range(self, start: Optional[float], end: Optional[float]) -> Optional[tuple]:
+        """Byte range [first, last) that can hold events between start and end."""
+        if start is None and end is None:
+            return None
+        keys = sorted(self.buckets)
+        # Past the last bucket means nothing can match
+        first = self.data["source_size"]
+        last = None
+        for key in keys:
+            if start is not None and key + self.bucket_seconds <= start:
+                continue
+            first = self.buckets[key]
+            break
+        if end is not None:
+            for key in keys:
+                if key > end:
+                    last = self.buckets[key]
+                    break
+        return first, last
+
+    def offsets(self, types: Optional[Iterable[str]] = None, game: Optional[int] = None,
+                start: Optional[float] = None, end: Optional[float] = None) -> List[int]:
+        """
+        Byte offsets of the lines that can match a query, in file order.
+        Time filtering here is bucket-granular; query() applies it exactly.
+        """
+        candidates = None
+        if types is not None:
+            candidates = set()
+            for event_type in types:
+                candidates.update(self.types.get(event_type, []))
+        if game is not None:
+            game_offsets = set(self.games.get(str(game), []))
+            candidates = game_offsets if candidates is None else candidates & game_offsets
+
+        if candidates is None:
+            candidates = set(self.lines)
+
+        time_range = self._time_range(start, end)
+        if time_range is not None:
+            first, last = time_range
+            candidates = {o for o in candidates if o >= first and (last is None or o < last)}
+        return sorted(candidates)
+
+    def read(self, offsets: Iterable[int]) -> Iterator[Dict[str, Any]]:
+        """Seek to each offset and decode just that line."""
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+    def _read_window(self, first: int, last: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Decode every line in a byte range."""
+        with open(self.path, 'rb') as f:
+            f.seek(first)
+            while last is None or f.tell() < last:
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    yield json.loads(line)
+
+    def query(self, types: Optional[Iterable[str]] = None, game: Optional[int] = None,
+              start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the events matching every given filter.
+
+        Args:
+            types: Event types to include
+            game: Game sequence number within the series
+            start, end: ISO timestamps bounding the events (inclusive)
+        """
+        start_seconds = parse_timestamp(start)
+        end_seconds = parse_timestamp(end)
+
+        if types is None and game is None and (start_seconds is not None or end_seconds is not None):
+            # Only a time filter - read the window sequentially instead of seeking per line
+            first, last = self._time_range(start_seconds, end_seconds)
+            events = self._read_window(first, last)
+        else:
+            events = self.read(self.offsets(types, game, start_seconds, end_seconds))
+
+        for event in events:
+            if start_seconds is not None or end_seconds is not None:
+                seconds = parse_timestamp(event_timestamp(event))
+                if seconds is None:
+                    continue
+                if start_seconds is not None and seconds < start_seconds:
+                    continue
+                if end_seconds is not None and seconds > end_seconds:
+                    continue
+            yield event
+
+def index_events_file(path: str, bucket_seconds: int = DEFAULT_BUCKET_SECONDS) -> Optional[EventIndex]:
+    """Index an events file, extracting the JSONL next to it first if given a zip."""
+    if path.endswith('.zip'):
+        jsonl_path = path[:-len('.zip')]
+        if not os.path.exists(jsonl_path):
+            jsonl_path = extract_jsonl(path, os.path.dirname(path) or ".")
+            if not jsonl_path:
+                return None
+        path = jsonl_path
+    return EventIndex.load(path, bucket_seconds)
+
+def main():
+    args = sys.argv[1:]
+
+    def option(name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in args:
+            index = args.index(name)
+            value = args[index + 1]
+            del args[index:index + 2]
+            return value
+        return default
+
+    types = option("--type")
+    game = option("--game")
+    start = option("--start")
+    end = option("--end")
+
+    if not args:
+        print("Usage: python3 event_index.py <events_<id>_grid.jsonl[.zip]> "
+              "[--type TYPE[,TYPE]] [--game N] [--start ISO] [--end ISO]")
+        return
+
+    index = index_events_file(args[0])
+    if index is None:
+        return
+
+    if not (types or game or start or end):
+        print(f"📇 {index_path(index.path)}")
+        print(f"  Lines: {index.data['lines']:,}")
+        print(f"  Games: {', '.join(sorted(index.games, key=int)) or 'none'}")
+        print(f"  Time buckets: {len(index.buckets)} x {index.bucket_seconds}s")
+        print("  Event types:")
+        for event_type, offsets in sorted(index.types.items(), key=lambda item: -len(item[1])):
+            print(f"    {event_type}: {len(offsets):,}")
+        return
+
+    count = 0
+    for event in index.query(types.split(",") if types else None,
+                             int(game) if game else None, start, end):
+        count += 1
+        print(json.dumps(event))
+    print(f"✅ {count} matching events", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Columnar Event Store
+Converts a series events file into typed NumPy arrays on disk
+(events_<id>_grid.columns/), one .npy file per column plus dictionaries for
+the string columns. Loading memory-maps the arrays, so aggregations over many
+series run as vectorised NumPy code instead of Python loops over dicts.
+
+Requires NumPy (optional dependency: pip install numpy).
+"""
+
+import array
+import json
+import os
+import sys
+from typing import Dict, Any, Optional, Iterable, Iterator, List
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from events import (iter_events, flatten_events, event_types, event_timestamp, parse_timestamp,
+                    event_actor, event_target, event_team, event_position, event_game, GameTracker,
+                    GAME_START_TYPES)
+
+# Bump when the on-disk layout changes
+STORE_VERSION = 3
+
+# Column name -> (NumPy dtype, array.array typecode used while converting)
+COLUMNS = {
+    "timestamp_ms": ("int64", "q"),   # epoch milliseconds (-1 if unknown)
+    "game": ("int16", "h"),           # game sequence number (-1 if unknown)
+    "type": ("int32", "i"),           # code into strings["types"]
+    "actor": ("int32", "i"),          # code into strings["ids"] (-1 if none)
+    "target": ("int32", "i"),         # code into strings["ids"] (-1 if none)
+    "team": ("int32", "i"),           # actor's team, code into strings["ids"] (-1 if unknown)
+    "x": ("float32", "f"),            # map position (NaN if none)
+    "y": ("float32", "f"),
+    "gold": ("float32", "f"),         # actor's gold delta from the event (0 if none)
+    "damage": ("float32", "f"),       # actor's damage delta from the event (0 if none)
+    "xp": ("float32", "f"),           # actor's experience delta from the event (0 if none)
+}
+
+# actor.stateDelta fields read for the gold / damage / xp delta columns
+# (GRID events carry per-event changes there; actor.state holds running totals)
+GOLD_KEYS = ("money", "gold")
+DAMAGE_KEYS = ("damageDealt", "damage")
+XP_KEYS = ("experiencePoints", "experience", "xp")
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("event_store requires NumPy: pip install numpy")
+
+def store_path(events_path: str) -> str:
+    """Columnar store directory for an events file."""
+    base = events_path
+    for suffix in (".zip", ".jsonl"):
+        if base.endswith(suffix):
+            base = base[:-len(suffix)]
+    return base + ".columns"
+
+def _delta(event: Dict[str, Any], keys: Iterable[str]) -> float:
+    """First numeric field of keys in the actor's stateDelta (0 if none)."""
+    actor = event.get("actor")
+    delta = actor.get("stateDelta") if isinstance(actor, dict) else None
+    if not isinstance(delta, dict):
+        return 0.0
+    for key in keys:
+        value = delta.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return 0.0
+
+class StringDictionary:
+    """Dictionary encoding for a string column (value -> dense int code)."""
+
+    def __init__(self, values: Optional[List[str]] = None):
+        self.values: List[str] = list(values or [])
+        self.codes: Dict[str, int] = {value: code for code, value in enumerate(self.values)}
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return self.values[code] if code >= 0 else None
+
+class EventColumns:
+    """
+    Typed column arrays for the events of one series.
+
+    Usage:
+        columns = EventColumns.load("events_2616372_grid.columns")
+        kills = columns.mask("kill")
+        gold_per_minute = columns.per_minute("gold")
+    """
+
+    def __init__(self, arrays: Dict[str, Any], strings: Dict[str, List[str]],
+                 meta: Optional[Dict[str, Any]] = None):
+        _require_numpy()
+        self.arrays = arrays
+        self.types = StringDictionary(strings.get("types"))
+        self.ids = StringDictionary(strings.get("ids"))
+        self.meta = meta or {}
+
+    def __len__(self) -> int:
+        return len(self.arrays["type"])
+
+    def __getitem__(self, column: str):
+        return self.arrays[column]
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]], track_games: bool = True) -> "EventColumns":
+        """
+        Encode an iterable of event lines (e.g. iter_events(path)) into columns.
+
+        With track_games=False only game numbers carried by the events
+        themselves are stored; use this for chunks that are merged later
+        with concat(), which numbers the games over the whole series.
+        """
+        _require_numpy()
+        buffers = {name: array.array(typecode) for name, (_, typecode) in COLUMNS.items()}
+        types = StringDictionary()
+        ids = StringDictionary()
+        tracker = GameTracker()
+        nan = float("nan")
+
+        for line in events:
+            for event in flatten_events(line):
+                seconds = parse_timestamp(event_timestamp(event))
+                game = tracker.game_of(event) if track_games else event_game(event)
+                position = event_position(event)
+                event_type = event.get("type") or next(iter(sorted(event_types(event))), None)
+
+                buffers["timestamp_ms"].append(int(seconds * 1000) if seconds is not None else -1)
+                buffers["game"].append(game if game is not None else -1)
+                buffers["type"].append(types.encode(event_type))
+                buffers["actor"].append(ids.encode(event_actor(event)))
+                buffers["target"].append(ids.encode(event_target(event)))
+                buffers["team"].append(ids.encode(event_team(event)))
+                buffers["x"].append(position[0] if position else nan)
+                buffers["y"].append(position[1] if position else nan)
+                buffers["gold"].append(_delta(event, GOLD_KEYS))
+                buffers["damage"].append(_delta(event, DAMAGE_KEYS))
+                buffers["xp"].append(_delta(event, XP_KEYS))
+
+        arrays = {name: np.frombuffer(buffers[name], dtype=dtype).copy()
+                  for name, (dtype, _) in COLUMNS.items()}
+        return cls(arrays, {"types": types.values, "ids": ids.values})
+
+    @classmethod
+    def concat(cls, parts: List["EventColumns"], track_games: bool = False) -> "EventColumns":
+        """
+        Join column batches in order, merging their string dictionaries.
+
+        With track_games=True the game column is renumbered across the joined
+        rows the same way GameTracker does for a single pass.
+        """
+        _require_numpy()
+        types = StringDictionary()
+        ids = StringDictionary()
+        pieces = {name: [] for name in COLUMNS}
+
+        for part in parts:
+            # Map the part's local codes to the merged dictionaries (-1 stays -1)
+            type_map = np.array([types.encode(v) for v in part.types.values] + [-1], dtype=np.int32)
+            id_map = np.array([ids.encode(v) for v in part.ids.values] + [-1], dtype=np.int32)
+            for name in COLUMNS:
+                column = np.asarray(part.arrays[name])
+                if name == "type":
+                    column = type_map[column]
+                elif name in ("actor", "target", "team"):
+                    column = id_map[column]
+                pieces[name].append(column)
+
+        arrays = {name: (np.concatenate(pieces[name]) if pieces[name] else np.zeros(0, dtype=dtype))
+                  for name, (dtype, _) in COLUMNS.items()}
+        columns = cls(arrays, {"types": types.values, "ids": ids.values})
+        if track_games:
+            columns._number_games()
+        return columns
+
+    def _number_games(self):
+        """Fill in game numbers from game-start events where the events carry none."""
+        games = np.array(self.arrays["game"], dtype=np.int16)
+        starts = set(self.type_codes(GAME_START_TYPES))
+        current = -1
+        for row, (game, code) in enumerate(zip(games.tolist(), np.asarray(self.arrays["type"]).tolist())):
+            if game >= 0:
+                current = game
+            elif code in starts:
+                current = max(current, 0) + 1
+            games[row] = current
+        self.arrays["game"] = games
+
+    @classmethod
+    def from_file(cls, events_path: str) -> "EventColumns":
+        """Encode an events zip or JSONL file."""
+        columns = cls.from_events(iter_events(events_path))
+        columns.meta["source"] = os.path.basename(events_path)
+        return columns
+
+    def save(self, path: str) -> str:
+        """Write the columns to a store directory. Returns the directory."""
+        os.makedirs(path, exist_ok=True)
+        for name in COLUMNS:
+            np.save(os.path.join(path, f"{name}.npy"), self.arrays[name])
+        meta = dict(self.meta, version=STORE_VERSION, rows=len(self))
+        with open(os.path.join(path, "strings.json"), 'w') as f:
+            json.dump({"types": self.types.values, "ids": self.ids.values, "meta": meta}, f)
+        return path
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "EventColumns":
+        """Load a store directory, memory-mapping the arrays by default."""
+        _require_numpy()
+        with open(os.path.join(path, "strings.json"), 'r') as f:
+            strings = json.load(f)
+        if strings.get("meta", {}).get("version") != STORE_VERSION:
+            raise ValueError(f"{path} was written by a different event_store version")
+        mode = 'r' if mmap else None
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode) for name in COLUMNS}
+        return cls(arrays, strings, strings.get("meta"))
+
+    def type_codes(self, types: Iterable[str]) -> List[int]:
+        """Codes of the given event types (unknown types are ignored)."""
+        return [self.types.codes[t] for t in types if t in self.types.codes]
+
+    def mask(self, *types: str):
+        """Boolean row mask for events of any of the given types."""
+        return np.isin(self.arrays["type"], self.type_codes(types))
+
+    def game_minutes(self):
+        """Minutes since the first event of each row's game (float32, NaN if unknown)."""
+        timestamps = np.asarray(self.arrays["timestamp_ms"])
+        games = np.asarray(self.arrays["game"])
+        minutes = np.full(len(self), np.nan, dtype=np.float32)
+        for game in np.unique(games):
+            rows = (games == game) & (timestamps >= 0)
+            if rows.any():
+                minutes[rows] = (timestamps[rows] - timestamps[rows].min()) / 60000.0
+        return minutes
+
+    def per_minute(self, column: str, types: Optional[Iterable[str]] = None, game: Optional[int] = None):
+        """Sum of a numeric column per game minute (index = minute), optionally filtered."""
+        minutes = self.game_minutes()
+        rows = ~np.isnan(minutes)
+        if types is not None:
+            rows &= self.mask(*types)
+        if game is not None:
+            rows &= np.asarray(self.arrays["game"]) == game
+        if not rows.any():
+            return np.zeros(0, dtype=np.float64)
+        buckets = minutes[rows].astype(np.int64)
+        return np.bincount(buckets, weights=np.asarray(self.arrays[column])[rows].astype(np.float64))
+
+    def counts_by_type(self) -> Dict[str, int]:
+        """Number of events per type."""
+        counts = np.bincount(np.asarray(self.arrays["type"])[np.asarray(self.arrays["type"]) >= 0],
+                             minlength=len(self.types.values))
+        return {self.types.values[code]: int(count) for code, count in enumerate(counts) if count}
+
+def convert(events_path: str, output_path: Optional[str] = None) -> str:
+    """Convert an events file to a columnar store. Returns the store directory."""
+    return EventColumns.from_file(events_path).save(output_path or store_path(events_path))
+
+def load_events(events_path: str, mmap: bool = True) -> EventColumns:
+    """Load the columnar store for an events file, converting it on first use."""
+    path = store_path(events_path) if not events_path.endswith(".columns") else events_path
+    if not os.path.isdir(path):
+        convert(events_path, path)
+    try:
+        return EventColumns.load(path, mmap)
+    except ValueError:
+        if events_path.endswith(".columns"):
+            raise
+        # Written by an older event_store - convert again
+        convert(events_path, path)
+        return EventColumns.load(path, mmap)
+
+def iter_stores(paths: Iterable[str], mmap: bool = True) -> Iterator[EventColumns]:
+    """Load many series' stores one at a time (e.g. a whole season)."""
+    for path in paths:
+        yield load_events(path, mmap)
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print("Usage: python3 event_store.py <events_<id>_grid.jsonl[.zip]> [...]")
+        return
+
+    if np is None:
+        print("❌ NumPy is required: pip install numpy")
+        return
+
+    for events_path in args:
+        if not os.path.exists(events_path):
+            print(f"❌ File not found: {events_path}")
+            continue
+        path = convert(events_path)
+        columns = EventColumns.load(path)
+        size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+        print(f"✅ {path}")
+        print(f"  Rows: {len(columns):,} | Types: {len(columns.types.values)} | "
+              f"IDs: {len(columns.ids.values)} | {size:,} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Series Events Reader
+Streams events straight out of events_<id>_grid.jsonl.zip (or an already
+extracted .jsonl) one line at a time, so nothing has to be unpacked to disk
+before it can be read.
+"""
+
+import contextlib
+import datetime
+import json
+import os
+import sys
+import zipfile
+from collections import Counter
+from typing import Dict, Any, Optional, Iterable, Iterator, IO, Set
+
+# Event types that mark the start of a new game within a series
+GAME_START_TYPES = {"game_start", "series-started-game"}
+
+def events_member(zip_ref: zipfile.ZipFile) -> str:
+    """Name of the JSONL member inside an events zip."""
+    for name in zip_ref.namelist():
+        if name.endswith('.jsonl'):
+            return name
+    raise ValueError(f"No JSONL file found in {zip_ref.filename}")
+
+def extract_jsonl(zip_path: str, output_dir: str = ".") -> Optional[str]:
+    """Extract JSONL file from zip."""
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            # Find JSONL file in zip
+            jsonl_files = [f for f in zip_ref.namelist() if f.endswith('.jsonl')]
+            if not jsonl_files:
+                print("⚠️  No JSONL file found in zip")
+                return None
+            
+            jsonl_file = jsonl_files[0]
+            output_path = os.path.join(output_dir, os.path.basename(jsonl_file))
+            zip_ref.extract(jsonl_file, output_dir)
+            
+            # Rename if needed
+            if os.path.basename(jsonl_file) != os.path.basename(output_path):
+                os.rename(os.path.join(output_dir, jsonl_file), output_path)
+            
+            return output_path
+    except Exception as e:
+        print(f"❌ Error extracting zip: {e}")
+        return None
+
+@contextlib.contextmanager
+def open_events(path: str) -> Iterator[IO[bytes]]:
+    """
+    Open an events file for binary line-by-line reading.
+    Zip archives are read through ZipFile.open, which decompresses on the fly.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path, 'r') as zip_ref:
+            with zip_ref.open(events_member(zip_ref)) as f:
+                yield f
+    else:
+        with open(path, 'rb') as f:
+            yield f
+
+def event_types(event: Dict[str, Any]) -> Set[str]:
+    """
+    Event types carried by one JSONL line.
+    Covers both flat events ({"type": "kill", ...}) and GRID transaction
+    lines that wrap several events ({"events": [{"type": ...}, ...]}).
+    """
+    types = set()
+    if event.get("type"):
+        types.add(event["type"])
+    for inner in event.get("events") or []:
+        if isinstance(inner, dict) and inner.get("type"):
+            types.add(inner["type"])
+    return types
+
+def event_timestamp(event: Dict[str, Any]) -> Optional[str]:
+    """ISO timestamp of an event line."""
+    return event.get("timestamp") or event.get("occurredAt")
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """Parse an ISO timestamp ("2024-01-17T08:05:23Z") into epoch seconds."""
+    if not value:
+        return None
+    try:
+        when = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return when.timestamp()
+
+def event_game(event: Dict[str, Any]) -> Optional[int]:
+    """Game sequence number an event carries itself, if any."""
+    game = event.get("game")
+    if isinstance(game, dict) and game.get("sequenceNumber") is not None:
+        return int(game["sequenceNumber"])
+    if event.get("gameSequenceNumber") is not None:
+        return int(event["gameSequenceNumber"])
+    return None
+
+class GameTracker:
+    """
+    Assigns a game sequence number to each event of a series, in file order.
+    Uses the number on the event when present, otherwise counts game starts.
+    """
+
+    def __init__(self):
+        self.current: Optional[int] = None
+
+    def game_of(self, event: Dict[str, Any]) -> Optional[int]:
+        game = event_game(event)
+        if game is not None:
+            self.current = game
+        elif event_types(event) & GAME_START_TYPES:
+            self.current = (self.current or 0) + 1
+        return self.current
+
+def entity_id(value: Any) -> Optional[str]:
+    """ID of a player/team reference, which may be a bare ID or an object with an id."""
+    if isinstance(value, dict):
+        value = value.get("id")
+    return str(value) if value is not None else None
+
+def event_actor(event: Dict[str, Any]) -> Optional[str]:
+    """ID of whoever performed the event."""
+    for key in ("actor", "player", "team"):
+        if event.get(key) is not None:
+            return entity_id(event[key])
+    return None
+
+def event_team(event: Dict[str, Any]) -> Optional[str]:
+    """ID of the team the event's actor plays for (or the actor itself if it is a team)."""
+    actor = event.get("actor")
+    if isinstance(actor, dict):
+        if actor.get("type") == "team":
+            return entity_id(actor)
+        team = (actor.get("state") or {}).get("team") or actor.get("team")
+        if team is not None:
+            return entity_id(team)
+    if event.get("team") is not None:
+        return entity_id(event["team"])
+    return None
+
+def event_target(event: Dict[str, Any]) -> Optional[str]:
+    """ID of whoever/whatever the event was done to."""
+    for key in ("target", "victim"):
+        if event.get(key) is not None:
+            return entity_id(event[key])
+    return None
+
+def event_position(event: Dict[str, Any]) -> Optional[tuple]:
+    """(x, y) map position of an event, if it has one."""
+    position = event.get("position")
+    if position is None and isinstance(event.get("actor"), dict):
+        position = (event["actor"].get("state") or {}).get("position")
+    if isinstance(position, dict) and position.get("x") is not None and position.get("y") is not None:
+        return float(position["x"]), float(position["y"])
+    return None
+
+def flatten_events(line: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the individual events of one JSONL line.
+    GRID transaction lines are split into their nested events, which inherit
+    the line's timestamp; flat events are yielded as they are.
+    """
+    inner = line.get("events")
+    if not isinstance(inner, list):
+        yield line
+        return
+    timestamp = event_timestamp(line)
+    for event in inner:
+        if not isinstance(event, dict):
+            continue
+        if timestamp and not event_timestamp(event):
+            event = dict(event, timestamp=timestamp)
+        yield event
+
+def iter_events(path: str, types: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield parsed events lazily, one JSONL line at a time.
+
+    Args:
+        path: events_<id>_grid.jsonl.zip or an extracted .jsonl file
+        types: Only yield events of these types. Lines that cannot contain
+            one of them are skipped before JSON decoding.
+    """
+    with open_events(path) as f:
+        yield from parse_lines(f, types)
+
+def parse_lines(lines: Iterable[bytes], types: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Decode raw JSONL lines, skipping blanks and (optionally) other event types."""
+    wanted = set(types) if types else None
+    needles = [t.encode('utf-8') for t in wanted] if wanted else None
+
+    for line in lines:
+        if needles and not any(needle in line for needle in needles):
+            continue
+        line = line.strip()
+        if not line:
+            continue
+        event = json.loads(line)
+        if wanted and not (event_types(event) & wanted):
+            continue
+        yield event
+
+def count_event_types(path: str) -> Counter:
+    """Count events per type in one forward pass."""
+    counts = Counter()
+    for event in iter_events(path):
+        counts.update(event_types(event))
+    return counts
+
+def main():
+    args = sys.argv[1:]
+    types = []
+    while "--type" in args:
+        index = args.index("--type")
+        types.append(args[index + 1])
+        del args[index:index + 2]
+
+    if not args:
+        print("Usage: python3 events.py <events_<id>_grid.jsonl.zip> [--type TYPE ...]")
+        return
+
+    path = args[0]
+    if not os.path.exists(path):
+        print(f"❌ File not found: {path}")
+        return
+
+    if types:
+        count = 0
+        for event in iter_events(path, types):
+            count += 1
+            print(json.dumps(event))
+        print(f"✅ {count} events of type {', '.join(types)}", file=sys.stderr)
+        return
+
+    counts = count_event_types(path)
+    print(f"📄 {os.path.basename(path)}")
+    print("=" * 70)
+    for event_type, count in counts.most_common():
+        print(f"  {event_type}: {count:,}")
+    print(f"  Total: {sum(counts.values()):,}")
+
+if __name__ == "__main__":
+    main()
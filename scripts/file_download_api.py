@@ -5,12 +5,9 @@ Lists and downloads event files and end state files for series.
 """
 
 import json
-import urllib.request
-import urllib.parse
-import ssl
+import urllib.error
 import os
 import sys
-import zipfile
 from typing import Dict, Any, Optional
 
 # File Download API base URL
@@ -19,6 +16,9 @@ FILE_DOWNLOAD_BASE_URL = "https://api.grid.gg/file-download"
 # Import shared utilities
 sys.path.insert(0, os.path.dirname(__file__))
 from utils import get_api_key
+from events import extract_jsonl
+from event_index import EventIndex
+import http_client
 
 def get_headers(api_key: Optional[str] = None) -> Dict[str, str]:
     """Get request headers with API key."""
@@ -31,29 +31,15 @@ def get_headers(api_key: Optional[str] = None) -> Dict[str, str]:
 
 def make_request(url: str, api_key: Optional[str] = None, accept_binary: bool = False):
     """Make HTTP GET request and return response body and headers."""
-    req = urllib.request.Request(url, headers=get_headers(api_key))
+    headers = get_headers(api_key)
     
     if accept_binary:
-        req.add_header("Accept", "application/zip, application/json, */*")
-    
-    ssl_context = ssl.create_default_context()
+        headers["Accept"] = "application/zip, application/json, */*"
     
     try:
-        with urllib.request.urlopen(req, context=ssl_context) as response:
-            body = response.read()
-            headers = dict(response.headers)
-            return body, headers
-    except (ssl.SSLError, urllib.error.URLError) as e:
-        if 'CERTIFICATE_VERIFY_FAILED' in str(e) or 'certificate' in str(e).lower():
-            ssl_context = ssl._create_unverified_context()
-            with urllib.request.urlopen(req, context=ssl_context) as response:
-                body = response.read()
-                headers = dict(response.headers)
-                return body, headers
-        else:
-            raise
+        return http_client.get(url, headers)
     except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
+        error_body = e.read().decode('utf-8', errors='replace')
         print(f"HTTP Error {e.code}: {error_body}")
         raise
 
@@ -63,33 +49,57 @@ def list_files(series_id: str, api_key: Optional[str] = None) -> Dict[str, Any]:
     body, _ = make_request(url, api_key)
     return json.loads(body.decode('utf-8'))
 
+def filename_from_headers(url: str, headers: Dict[str, str]) -> str:
+    """Get filename from Content-Disposition header or URL."""
+    content_disposition = headers.get("Content-Disposition", "")
+    if "filename=" in content_disposition:
+        return os.path.basename(content_disposition.split("filename=")[1].strip('"\''))
+    return filename_from_url(url)
+
+def filename_from_url(url: str) -> str:
+    """Extract a filename from a URL."""
+    filename = url.split("/")[-1]
+    if "?" in filename:
+        filename = filename.split("?")[0]
+    return filename or "downloaded_file"
+
 def download_file(url: str, api_key: Optional[str] = None, output_path: Optional[str] = None) -> str:
-    """Download a file from a URL."""
-    body, headers = make_request(url, api_key, accept_binary=True)
+    """
+    Download a file from a URL.
+    Streams to disk in chunks and resumes interrupted transfers (see http_client.download).
+    """
+    headers = get_headers(api_key)
+    headers["Accept"] = "application/zip, application/json, */*"
     
-    # Get filename from Content-Disposition header or URL
-    filename = output_path
-    if not filename:
-        content_disposition = headers.get("Content-Disposition", "")
-        if "filename=" in content_disposition:
-            filename = content_disposition.split("filename=")[1].strip('"\'')
-        else:
-            # Extract from URL
-            filename = url.split("/")[-1]
-            if "?" in filename:
-                filename = filename.split("?")[0]
+    filename = output_path or filename_from_url(url)
     
-    if not filename:
-        filename = "downloaded_file"
+    try:
+        response_headers = http_client.download(url, filename, headers)
+    except urllib.error.HTTPError as e:
+        error_body = e.read().decode('utf-8', errors='replace')
+        print(f"HTTP Error {e.code}: {error_body}")
+        raise
     
-    with open(filename, 'wb') as f:
-        f.write(body)
+    if not output_path:
+        # Prefer the server's name for the file when it provides one
+        server_filename = filename_from_headers(url, response_headers)
+        if server_filename != filename:
+            os.replace(filename, server_filename)
+            filename = server_filename
     
     return filename
 
+def events_file_url(series_id: str) -> str:
+    """Download URL of a series' Events JSONL zip file."""
+    return f"{FILE_DOWNLOAD_BASE_URL}/events/grid/series/{series_id}"
+
+def end_state_file_url(series_id: str) -> str:
+    """Download URL of a series' End State JSON file."""
+    return f"{FILE_DOWNLOAD_BASE_URL}/end-state/grid/series/{series_id}"
+
 def download_events_file(series_id: str, api_key: Optional[str] = None, output_dir: str = ".") -> Optional[str]:
     """Download the Series Events JSONL zip file."""
-    url = f"{FILE_DOWNLOAD_BASE_URL}/events/grid/series/{series_id}"
+    url = events_file_url(series_id)
     output_path = os.path.join(output_dir, f"events_{series_id}_grid.jsonl.zip")
     
     try:
@@ -102,7 +112,7 @@ def download_events_file(series_id: str, api_key: Optional[str] = None, output_d
 
 def download_end_state_file(series_id: str, api_key: Optional[str] = None, output_dir: str = ".") -> Optional[str]:
     """Download the Series End State JSON file."""
-    url = f"{FILE_DOWNLOAD_BASE_URL}/end-state/grid/series/{series_id}"
+    url = end_state_file_url(series_id)
     output_path = os.path.join(output_dir, f"end_state_{series_id}_grid.json")
     
     try:
@@ -113,29 +123,6 @@ def download_end_state_file(series_id: str, api_key: Optional[str] = None, outpu
             print(f"❌ End state file not found for Series {series_id}")
         return None
 
-def extract_jsonl(zip_path: str, output_dir: str = ".") -> Optional[str]:
-    """Extract JSONL file from zip."""
-    try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # Find JSONL file in zip
-            jsonl_files = [f for f in zip_ref.namelist() if f.endswith('.jsonl')]
-            if not jsonl_files:
-                print("⚠️  No JSONL file found in zip")
-                return None
-            
-            jsonl_file = jsonl_files[0]
-            output_path = os.path.join(output_dir, os.path.basename(jsonl_file))
-            zip_ref.extract(jsonl_file, output_dir)
-            
-            # Rename if needed
-            if os.path.basename(jsonl_file) != os.path.basename(output_path):
-                os.rename(os.path.join(output_dir, jsonl_file), output_path)
-            
-            return output_path
-    except Exception as e:
-        print(f"❌ Error extracting zip: {e}")
-        return None
-
 def print_file_status(file_info: Dict[str, Any]):
     """Print formatted file information."""
     file_id = file_info.get("id", "unknown")
@@ -233,6 +220,10 @@ def main():
                         if jsonl_path:
                             print(f"  ✅ Extracted: {jsonl_path}")
                             downloaded_files.append(jsonl_path)
+                            
+                            # Sidecar byte-offset index for fast event queries
+                            index = EventIndex.build(jsonl_path)
+                            print(f"  📇 Indexed: {index.save()}")
             
             elif file_id == "state-grid":
                 filename = download_end_state_file(series_id, api_key)
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Game State Reconstruction
+Replays a series events file into per-game state (players' gold, level,
+K/D/A and position; team totals; objectives taken) and stores checkpoints of
+that state every 30 seconds of game time in a sidecar file
+(events_<id>_grid.jsonl.checkpoints.json).
+
+Seeking to "game 2 at 14:30" loads the nearest earlier checkpoint and replays
+only the events after it, instead of replaying the game from the start.
+
+Game time is measured from the first event of each game.
+"""
+
+import bisect
+import copy
+import json
+import os
+import sys
+from typing import Dict, Any, Optional, List
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from events import (flatten_events, event_timestamp, parse_timestamp, event_actor, event_target,
+                    event_position, entity_id, extract_jsonl, GameTracker)
+from event_store import GOLD_KEYS, XP_KEYS
+
+# Bump when the checkpoint layout or the reducer changes (older sidecars are rebuilt)
+CHECKPOINT_VERSION = 5
+
+# Default game time between checkpoints (seconds)
+DEFAULT_INTERVAL = 30
+
+# Event types containing one of these words count as objectives for the actor (and its team)
+OBJECTIVE_WORDS = ("tower", "turret", "inhibitor", "dragon", "drake", "baron", "herald", "grub", "nexus")
+
+def checkpoints_path(jsonl_path: str) -> str:
+    """Sidecar checkpoint file for an events JSONL file."""
+    return jsonl_path + ".checkpoints.json"
+
+def parse_clock(value: str) -> float:
+    """Game time from "14:30", "1:02:05" or plain seconds ("870")."""
+    seconds = 0.0
+    for part in value.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+def format_clock(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+def _number(event: Dict[str, Any], keys) -> Optional[float]:
+    for key in keys:
+        value = event.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+    return None
+
+def new_state(game: Optional[int]) -> Dict[str, Any]:
+    """Empty state of a game."""
+    return {"game": game, "clock": 0.0, "events": 0, "players": {}, "teams": {}}
+
+def _entity(state: Dict[str, Any], kind: str, entity: str) -> Dict[str, Any]:
+    if kind == "team":
+        return state["teams"].setdefault(entity, {"id": entity, "kills": 0, "deaths": 0, "gold": 0,
+                                                  "objectives": {}})
+    return state["players"].setdefault(entity, {"id": entity, "team": None, "gold": 0, "xp": 0, "level": 1,
+                                                "kills": 0, "deaths": 0, "assists": 0, "position": None,
+                                                "objectives": {}})
+
+def _kind(event: Dict[str, Any], keys) -> str:
+    """"team" or "player" for whoever event_actor/event_target picked from keys."""
+    for key in keys:
+        value = event.get(key)
+        if value is None:
+            continue
+        if key == "team" or (isinstance(value, dict) and value.get("type") == "team"):
+            return "team"
+        return "player"
+    return "player"
+
+# GRID state field -> record field
+STATE_FIELDS = {**{key: "gold" for key in GOLD_KEYS}, **{key: "xp" for key in XP_KEYS}}
+
+def _merge(record: Dict[str, Any], values: Dict[str, Any], delta: bool = False):
+    """
+    Fold a GRID actor.state snapshot (absolute values) or, with delta=True,
+    an actor.stateDelta (numbers added to the running values) into a record.
+    Callers must not add a delta for fields the same event's state already set.
+    """
+    for key, value in values.items():
+        if key == "position" and isinstance(value, dict):
+            if value.get("x") is not None and value.get("y") is not None:
+                record["position"] = [float(value["x"]), float(value["y"])]
+        elif key == "team":
+            record["team"] = entity_id(value)
+        elif value is None or isinstance(value, (int, float, str, bool)):
+            field = STATE_FIELDS.get(key, key)
+            current = record.get(field)
+            if (delta and isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and (current is None or isinstance(current, (int, float)) and not isinstance(current, bool))):
+                record[field] = (current or 0) + value
+            else:
+                record[field] = value
+
+def _carries(event: Dict[str, Any], roles, field: str) -> bool:
+    """True if the actor/target object of the event carries field in its state or stateDelta."""
+    for role in roles:
+        ref = event.get(role)
+        if isinstance(ref, dict):
+            return any(isinstance(ref.get(key), dict) and field in ref[key] for key in ("state", "stateDelta"))
+    return False
+
+def apply_event(state: Dict[str, Any], event: Dict[str, Any]):
+    """
+    Fold one (flattened) event into a game state.
+
+    An event carrying both state and stateDelta counts once:
+    >>> game = new_state(1)
+    >>> apply_event(game, {"type": "player-killed-player",
+    ...     "actor": {"type": "player", "id": "p1", "state": {"money": 1800, "kills": 3},
+    ...               "stateDelta": {"money": 300, "kills": 1}},
+    ...     "target": {"type": "player", "id": "p2", "state": {"deaths": 2}, "stateDelta": {"deaths": 1}}})
+    >>> game["players"]["p1"]["gold"], game["players"]["p1"]["kills"], game["players"]["p2"]["deaths"]
+    (1800, 3, 2)
+
+    Team gold is the sum of its players' gold, from state or stateDelta alike:
+    >>> apply_event(game, {"type": "player-gained-gold",
+    ...     "actor": {"type": "player", "id": "p3", "state": {"money": 500, "team": {"id": "t1"}}}})
+    >>> apply_event(game, {"type": "player-gained-gold",
+    ...     "actor": {"type": "player", "id": "p4", "state": {"team": {"id": "t1"}}, "stateDelta": {"money": 200}}})
+    >>> game["teams"]["t1"]["gold"]
+    700
+    """
+    state["events"] += 1
+    event_type = event.get("type") or ""
+
+    # Snapshots carried on the actor/target objects
+    touched = set()
+    for role in ("actor", "target"):
+        ref = event.get(role)
+        if isinstance(ref, dict) and ref.get("id") is not None:
+            kind = "team" if ref.get("type") == "team" else "player"
+            record = _entity(state, kind, str(ref["id"]))
+            snapshot = ref["state"] if isinstance(ref.get("state"), dict) else {}
+            _merge(record, snapshot)
+            if isinstance(ref.get("stateDelta"), dict):
+                # state already holds the totals after the event; only apply deltas for fields it lacks
+                covered = {STATE_FIELDS.get(key, key) for key in snapshot}
+                _merge(record, {key: value for key, value in ref["stateDelta"].items()
+                                if STATE_FIELDS.get(key, key) not in covered}, delta=True)
+            touched.add(record["id"] if kind == "team" else record.get("team"))
+
+    # Team gold is always the sum of its players' current gold (a team's own money field is not used)
+    for team_id in touched - {None}:
+        _entity(state, "team", team_id)["gold"] = sum(player["gold"] for player in state["players"].values()
+                                                      if player.get("team") == team_id)
+
+    actor_id = event_actor(event)
+    if actor_id is None:
+        return
+    actor_kind = _kind(event, ("actor", "player", "team"))
+    actor = _entity(state, actor_kind, actor_id)
+    team = _entity(state, "team", actor["team"]) if actor.get("team") else None
+
+    level = _number(event, ("level",))
+    if level is not None:
+        actor["level"] = level
+    position = event_position(event)
+    if position is not None:
+        actor["position"] = list(position)
+
+    target_id = event_target(event)
+    if "kill" in event_type and target_id is not None and _kind(event, ("target", "victim")) == "player":
+        # Counts carried in the actor/target state are the source of truth; only count the event otherwise
+        if not _carries(event, ("actor", "player"), "kills"):
+            actor["kills"] += 1
+        victim = _entity(state, "player", target_id)
+        if not _carries(event, ("target", "victim"), "deaths"):
+            victim["deaths"] += 1
+        if team is not None:
+            team["kills"] += 1
+        if victim.get("team"):
+            _entity(state, "team", victim["team"])["deaths"] += 1
+        for assist in event.get("assists") or event.get("assistants") or []:
+            assistant = entity_id(assist)
+            if assistant is not None:
+                _entity(state, "player", assistant)["assists"] += 1
+    elif any(word in event_type for word in OBJECTIVE_WORDS):
+        actor["objectives"][event_type] = actor["objectives"].get(event_type, 0) + 1
+        if team is not None and team is not actor:
+            team["objectives"][event_type] = team["objectives"].get(event_type, 0) + 1
+
+class GameTimeline:
+    """
+    Checkpointed game states for one events JSONL file.
+
+    Usage:
+        timeline = GameTimeline.load("events_2616372_grid.jsonl")
+        state = timeline.seek(game=2, seconds=parse_clock("14:30"))
+    """
+
+    def __init__(self, path: str, data: Dict[str, Any]):
+        self.path = path
+        self.data = data
+        self.interval = data["interval"]
+        # game (str) -> {"start": epoch seconds, "end_offset": int|None, "checkpoints": [...]}
+        self.games: Dict[str, Dict[str, Any]] = data["games"]
+        self._clocks = {game: [cp["clock"] for cp in info["checkpoints"]] for game, info in self.games.items()}
+
+    @classmethod
+    def build(cls, path: str, interval: int = DEFAULT_INTERVAL) -> "GameTimeline":
+        """Replay the whole file once, recording a checkpoint every interval seconds of game time."""
+        games: Dict[str, Dict[str, Any]] = {}
+        tracker = GameTracker()
+        current = None
+        state = None
+        next_boundary = 0.0
+        offset = 0
+
+        with open(path, 'rb') as f:
+            for raw in f:
+                line_offset = offset
+                offset += len(raw)
+                if not raw.strip():
+                    continue
+                line = json.loads(raw)
+                game = tracker.game_of(line)
+                if game is None:
+                    continue
+                seconds = parse_timestamp(event_timestamp(line))
+
+                if game != current:
+                    if current is not None:
+                        games[str(current)]["end_offset"] = line_offset
+                    current = game
+                    state = new_state(game)
+                    games[str(game)] = {"start": seconds, "end_offset": None, "checkpoints": [
+                        {"clock": 0.0, "offset": line_offset, "state": copy.deepcopy(state)}]}
+                    next_boundary = float(interval)
+
+                info = games[str(game)]
+                if info["start"] is None and seconds is not None:
+                    info["start"] = seconds
+                clock = seconds - info["start"] if seconds is not None and info["start"] is not None else state["clock"]
+                if clock >= next_boundary:
+                    # State so far covers every event before this boundary
+                    boundary = clock // interval * interval
+                    info["checkpoints"].append({"clock": boundary, "offset": line_offset,
+                                                "state": dict(copy.deepcopy(state), clock=boundary)})
+                    next_boundary = boundary + interval
+
+                state["clock"] = max(state["clock"], clock)
+                for event in flatten_events(line):
+                    apply_event(state, event)
+
+        stat = os.stat(path)
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "source_size": stat.st_size,
+            "source_mtime": stat.st_mtime,
+            "interval": interval,
+            "games": games,
+        }
+        return cls(path, data)
+
+    def save(self) -> str:
+        """Write the checkpoints next to the JSONL file. Returns the sidecar path."""
+        sidecar = checkpoints_path(self.path)
+        tmp_path = sidecar + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, separators=(',', ':'))
+        os.replace(tmp_path, sidecar)
+        return sidecar
+
+    def is_current(self) -> bool:
+        """Check the checkpoints still match the JSONL file they were built from."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (self.data.get("version") == CHECKPOINT_VERSION
+                and self.data.get("source_size") == stat.st_size
+                and self.data.get("source_mtime") == stat.st_mtime)
+
+    @classmethod
+    def load(cls, path: str, interval: int = DEFAULT_INTERVAL) -> "GameTimeline":
+        """Load the checkpoints for a JSONL file, building them if missing or stale."""
+        sidecar = checkpoints_path(path)
+        if os.path.exists(sidecar):
+            try:
+                with open(sidecar, 'r') as f:
+                    timeline = cls(path, json.load(f))
+                if timeline.is_current() and timeline.interval == interval:
+                    return timeline
+            except (ValueError, KeyError):
+                pass
+        timeline = cls.build(path, interval)
+        timeline.save()
+        return timeline
+
+    def game_numbers(self) -> List[int]:
+        return sorted(int(game) for game in self.games)
+
+    def duration(self, game: int) -> float:
+        """Game time of the last checkpoint (a lower bound on the game's length)."""
+        return self.games[str(game)]["checkpoints"][-1]["clock"]
+
+    def seek(self, game: int, seconds: float) -> Dict[str, Any]:
+        """State of a game after every event up to `seconds` of game time."""
+        info = self.games.get(str(game))
+        if info is None:
+            raise KeyError(f"Game {game} not found (games: {self.game_numbers()})")
+        index = max(bisect.bisect_right(self._clocks[str(game)], seconds) - 1, 0)
+        checkpoint = info["checkpoints"][index]
+        state = copy.deepcopy(checkpoint["state"])
+        end_offset = info["end_offset"]
+
+        stopped = False
+        with open(self.path, 'rb') as f:
+            f.seek(checkpoint["offset"])
+            while end_offset is None or f.tell() < end_offset:
+                raw = f.readline()
+                if not raw:
+                    break
+                if not raw.strip():
+                    continue
+                line = json.loads(raw)
+                line_seconds = parse_timestamp(event_timestamp(line))
+                if line_seconds is not None and info["start"] is not None:
+                    clock = line_seconds - info["start"]
+                    if clock > seconds:
+                        stopped = True
+                        break
+                    state["clock"] = max(state["clock"], clock)
+                for event in flatten_events(line):
+                    apply_event(state, event)
+        if stopped:
+            # The game was still going at the requested time
+            state["clock"] = seconds
+        return state
+
+def load_timeline(path: str, interval: int = DEFAULT_INTERVAL) -> Optional[GameTimeline]:
+    """Checkpointed timeline for an events file, extracting the JSONL next to it first if given a zip."""
+    if path.endswith('.zip'):
+        jsonl_path = path[:-len('.zip')]
+        if not os.path.exists(jsonl_path):
+            jsonl_path = extract_jsonl(path, os.path.dirname(path) or ".")
+            if not jsonl_path:
+                return None
+        path = jsonl_path
+    return GameTimeline.load(path, interval)
+
+def print_state(state: Dict[str, Any]):
+    """Print a game state as a scoreboard."""
+    print(f"🎮 Game {state['game']} at {format_clock(state['clock'])} ({state['events']:,} events replayed)")
+    for team in state["teams"].values():
+        objectives = ", ".join(f"{name} x{count}" for name, count in sorted(team["objectives"].items()))
+        print(f"  🏆 {team.get('name', team['id'])}: {team['kills']} kills, {team['gold']:,.0f} gold"
+              + (f" | {objectives}" if objectives else ""))
+    for player in sorted(state["players"].values(), key=lambda p: (str(p.get("team")), p["id"])):
+        position = player.get("position")
+        where = f" @ ({position[0]:.0f}, {position[1]:.0f})" if position else ""
+        print(f"  {player.get('name', player['id'])}: {player['kills']}/{player['deaths']}/{player['assists']} "
+              f"| lvl {player['level']} | {player['gold']:,.0f} gold{where}")
+
+def main():
+    args = sys.argv[1:]
+
+    def option(name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in args:
+            index = args.index(name)
+            value = args[index + 1]
+            del args[index:index + 2]
+            return value
+        return default
+
+    game = option("--game")
+    at = option("--at")
+    interval = int(option("--interval", str(DEFAULT_INTERVAL)))
+
+    if not args:
+        print("Usage: python3 game_state.py <events_<id>_grid.jsonl[.zip]> [--game N --at MM:SS] "
+              "[--interval SECONDS]")
+        return
+
+    timeline = load_timeline(args[0], interval)
+    if timeline is None:
+        return
+
+    if game is None or at is None:
+        print(f"⏱️  {checkpoints_path(timeline.path)}")
+        for number in timeline.game_numbers():
+            count = len(timeline.games[str(number)]["checkpoints"])
+            print(f"  Game {number}: {count} checkpoints, ~{format_clock(timeline.duration(number))}")
+        return
+
+    try:
+        state = timeline.seek(int(game), parse_clock(at))
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return
+    print_state(state)
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,8 @@ import sys
 import os
 import random
 sys.path.insert(0, os.path.dirname(__file__))
-from api_explorer import query_graphql, API_URL, get_headers
+from api_explorer import query_graphql, API_URL, get_headers, iter_tournaments, iter_all_series, GraphQLError
+from catalog import Catalog
 from utils import get_api_key
 import urllib.request
 import ssl
@@ -22,140 +23,73 @@ def main():
     
     # 1. Find Valorant title ID
     print("1. Getting Valorant title ID...")
-    query = """
-    query Titles {
-        titles {
-            id
-            name
-        }
-    }
-    """
-    
-    result = query_graphql(query, api_key=api_key)
-    if "data" in result:
-        titles = result["data"].get("titles", [])
-        valorant_title = next((t for t in titles if "valorant" in t.get("name", "").lower()), None)
-        if not valorant_title:
-            print("❌ Valorant title not found")
+    catalog = Catalog()
+    valorant_title = catalog.find_title("valorant")
+    if not valorant_title:
+        # First run: mirror the titles list locally
+        try:
+            catalog.sync_titles(api_key)
+        except GraphQLError as e:
+            print(f"❌ Could not get titles: {e}")
             return
-        valorant_id = valorant_title["id"]
-        print(f"   ✅ Valorant title ID: {valorant_id}")
-    else:
-        print("❌ Could not get titles")
+        valorant_title = catalog.find_title("valorant")
+    if not valorant_title:
+        print("❌ Valorant title not found")
         return
+    valorant_id = valorant_title["id"]
+    print(f"   ✅ Valorant title ID: {valorant_id}")
+    
+    # Tournaments and series come from the local catalog once the title has been synced
+    mirrored = catalog.is_synced(valorant_id)
+    if not mirrored:
+        print("   ℹ️  Using the live API (run: python3 catalog.py sync --title valorant for local lookups)")
     
     print()
     
     # 2. Find Americas tournaments
     print("2. Finding Valorant Americas tournaments...")
-    query = """
-    query Tournaments {
-        tournaments(
-            filter: { 
-                title: { id: { in: ["%s"] } }
-                name: { contains: "Americas" }
-            }
-            first: 20
-        ) {
-            edges {
-                node {
-                    id
-                    name
-                }
-            }
-            totalCount
-        }
-    }
-    """ % valorant_id
-    
-    result = query_graphql(query, api_key=api_key)
-    if "data" in result:
-        tournaments = result["data"].get("tournaments", {})
-        tournament_edges = tournaments.get("edges", [])
-        print(f"   ✅ Found {tournaments.get('totalCount', 0)} tournaments")
+    try:
+        if mirrored:
+            tournaments = catalog.tournaments(valorant_id, name_contains="Americas")
+        else:
+            tournaments = list(iter_tournaments(valorant_id, api_key, name_contains="Americas"))
+        print(f"   ✅ Found {len(tournaments)} tournaments")
         
-        if not tournament_edges:
+        if not tournaments:
             print("   ⚠️  No tournaments found, trying without 'Americas' filter...")
-            # Try without Americas filter
-            query2 = """
-            query Tournaments {
-                tournaments(
-                    filter: { title: { id: { in: ["%s"] } } }
-                    first: 50
-                ) {
-                    edges {
-                        node {
-                            id
-                            name
-                        }
-                    }
-                }
-            }
-            """ % valorant_id
-            result2 = query_graphql(query2, api_key=api_key)
-            if "data" in result2:
-                tournament_edges = result2["data"].get("tournaments", {}).get("edges", [])
-                # Filter for Americas manually
-                tournament_edges = [t for t in tournament_edges if "americas" in t["node"]["name"].lower()]
+            # Try without Americas filter and filter for Americas manually
+            all_tournaments = catalog.tournaments(valorant_id) if mirrored else iter_tournaments(valorant_id, api_key)
+            tournaments = [t for t in all_tournaments if "americas" in t["name"].lower()]
         
-        if not tournament_edges:
+        if not tournaments:
             print("   ❌ No Americas tournaments found")
             return
         
         # Pick a random tournament
-        tournament = random.choice(tournament_edges)["node"]
+        tournament = random.choice(tournaments)
         tournament_id = tournament["id"]
         print(f"   ✅ Selected tournament: {tournament['name']} (ID: {tournament_id})")
-    else:
-        print("❌ Could not get tournaments")
+    except GraphQLError as e:
+        print(f"❌ Could not get tournaments: {e}")
         return
     
     print()
     
     # 3. Get series from tournament
     print("3. Getting series from tournament...")
-    query = """
-    query AllSeries {
-        allSeries(
-            filter: { 
-                tournament: { 
-                    id: { in: [%s] }, 
-                    includeChildren: { equals: true } 
-                } 
-            }
-            orderBy: StartTimeScheduled
-            first: 50
-        ) {
-            edges {
-                node {
-                    id
-                    startTimeScheduled
-                    teams {
-                        baseInfo {
-                            name
-                        }
-                    }
-                }
-            }
-            totalCount
-        }
-    }
-    """ % tournament_id
-    
-    result = query_graphql(query, api_key=api_key)
-    if "data" in result:
-        all_series = result["data"].get("allSeries", {})
-        series_edges = all_series.get("edges", [])
-        total_count = all_series.get("totalCount", 0)
-        
-        print(f"   ✅ Found {total_count} series")
+    try:
+        if mirrored:
+            series_list = catalog.series(tournament_id)
+        else:
+            series_list = list(iter_all_series(tournament_id, api_key))
+        print(f"   ✅ Found {len(series_list)} series")
         
-        if not series_edges:
+        if not series_list:
             print("   ❌ No series found in this tournament")
             return
         
         # Pick a random series
-        series = random.choice(series_edges)["node"]
+        series = random.choice(series_list)
         series_id = series["id"]
         teams = [t["baseInfo"]["name"] for t in series.get("teams", [])]
         
@@ -173,8 +107,8 @@ def main():
         print("Test it with:")
         print(f"  python3 series_state_api.py [api-key] {series_id}")
         print(f"  python3 file_download_api.py [api-key] {series_id}")
-    else:
-        print("❌ Could not get series")
+    except GraphQLError as e:
+        print(f"❌ Could not get series: {e}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP transport for Grid.gg API scripts.
+Keeps persistent keep-alive connections per host and a cached SSL context,
+so repeated queries skip the TCP + TLS handshake. All requests are paced
+and retried by the shared scheduler in rate_limiter, GraphQL responses
+go through the on-disk cache in response_cache, and identical concurrent
+GETs/queries are coalesced into one request by singleflight.
+"""
+
+import http.client
+import io
+import json
+import ssl
+import threading
+import urllib.error
+import urllib.parse
+import os
+import sys
+from typing import Dict, Any, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+from rate_limiter import scheduler, ThrottledError, is_throttled_result
+from response_cache import cache
+from singleflight import inflight, request_key
+
+# Default socket timeout (seconds) for pooled connections
+DEFAULT_TIMEOUT = 60
+
+# Idle connections kept per host
+DEFAULT_POOL_SIZE = 16
+
+# Chunk size for streamed downloads (peak memory per download)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Redirect hops followed before giving up (same limit as urllib)
+MAX_REDIRECTS = 10
+
+# Statuses that are followed via their Location header
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Headers that are not forwarded to a different host on redirect
+_CREDENTIAL_HEADERS = ("x-api-key", "authorization", "cookie")
+
+# Errors that mean a kept-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_ssl_context: Optional[ssl.SSLContext] = None
+_ssl_verify = True
+_ssl_lock = threading.Lock()
+
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the shared SSL context, creating it on first use."""
+    global _ssl_context
+    with _ssl_lock:
+        if _ssl_context is None:
+            if _ssl_verify:
+                _ssl_context = ssl.create_default_context()
+            else:
+                _ssl_context = ssl._create_unverified_context()
+        return _ssl_context
+
+def _disable_ssl_verification():
+    """Switch to an unverified SSL context (fallback for broken CA setups)."""
+    global _ssl_context, _ssl_verify
+    with _ssl_lock:
+        if not _ssl_verify:
+            return
+        print("⚠️  SSL certificate verification failed, using unverified context...")
+        _ssl_verify = False
+        _ssl_context = None
+    close_all()
+
+def _is_certificate_error(error: Exception) -> bool:
+    return 'CERTIFICATE_VERIFY_FAILED' in str(error) or 'certificate' in str(error).lower()
+
+class ConnectionPool:
+    """Pool of idle keep-alive connections to a single host."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int] = None,
+                 maxsize: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=get_ssl_context()
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def get(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused) - an idle connection if one is available."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._new_connection(), False
+
+    def put(self, conn: http.client.HTTPConnection):
+        """Return a connection to the pool once its response has been fully read."""
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+_pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def _resize_pools(maxsize: int):
+    """Apply a new idle-connection limit to every pool (caller holds _pools_lock)."""
+    global DEFAULT_POOL_SIZE
+    DEFAULT_POOL_SIZE = maxsize
+    for pool in _pools.values():
+        pool.maxsize = maxsize
+
+def set_pool_size(maxsize: int):
+    """Set how many idle connections are kept per host (e.g. to match a concurrency limit)."""
+    with _pools_lock:
+        _resize_pools(maxsize)
+
+def ensure_pool_size(maxsize: int):
+    """Keep at least maxsize idle connections per host, e.g. one per worker (never shrinks the pools)."""
+    with _pools_lock:
+        if DEFAULT_POOL_SIZE < maxsize:
+            _resize_pools(maxsize)
+
+def get_pool(url: str) -> ConnectionPool:
+    """Get (or create) the connection pool for the host of a URL."""
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.hostname, parts.port)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(parts.scheme, parts.hostname, parts.port, maxsize=DEFAULT_POOL_SIZE)
+            _pools[key] = pool
+        return pool
+
+def close_all():
+    """Close every pooled connection (pools are recreated lazily)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+def _request_path(url: str) -> str:
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    return path
+
+def _open_once(method: str, url: str, headers: Dict[str, str], body: Optional[bytes]):
+    """Send a request over a pooled connection. Returns (pool, conn, response)."""
+    path = _request_path(url)
+
+    while True:
+        pool = get_pool(url)
+        conn, reused = pool.get()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            return pool, conn, conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if reused:
+                # Server dropped an idle keep-alive connection - retry on a fresh one
+                continue
+            raise
+        except ssl.SSLError as e:
+            conn.close()
+            if _ssl_verify and _is_certificate_error(e):
+                _disable_ssl_verification()
+                continue
+            raise
+        except Exception:
+            conn.close()
+            raise
+
+def _release(pool: ConnectionPool, conn: http.client.HTTPConnection, response: http.client.HTTPResponse):
+    """Return a connection to its pool after the response body has been fully read."""
+    if response.will_close:
+        conn.close()
+    else:
+        pool.put(conn)
+
+def _redirect_request(method: str, url: str, location: str, status: int,
+                      headers: Dict[str, str], body: Optional[bytes]):
+    """
+    Build the follow-up request for a redirect, following urllib's rules:
+    301/302/303 turn a POST into a body-less GET, 307/308 are only followed
+    for GET/HEAD. Returns (method, url, headers, body), or None if the
+    redirect should not be followed.
+    """
+    if method not in ("GET", "HEAD"):
+        if status in (307, 308):
+            return None
+        method, body = "GET", None
+        headers = {k: v for k, v in headers.items()
+                   if k.lower() not in ("content-type", "content-length")}
+
+    new_url = urllib.parse.urljoin(url, location)
+    if urllib.parse.urlsplit(new_url).scheme not in ("http", "https"):
+        return None
+    if urllib.parse.urlsplit(new_url).netloc != urllib.parse.urlsplit(url).netloc:
+        headers = {k: v for k, v in headers.items() if k.lower() not in _CREDENTIAL_HEADERS}
+    return method, new_url, headers, body
+
+def _open(method: str, url: str, headers: Dict[str, str], body: Optional[bytes]):
+    """
+    Send a request, following redirects up to MAX_REDIRECTS hops.
+    Returns (pool, conn, response, url) where url is the final location.
+    A redirect that is not followed is returned as-is for _check_status.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        pool, conn, response = _open_once(method, url, headers, body)
+        location = response.getheader("Location")
+        if response.status not in _REDIRECT_STATUSES or not location:
+            return pool, conn, response, url
+
+        follow = _redirect_request(method, url, location, response.status, headers, body)
+        if follow is None:
+            return pool, conn, response, url
+        try:
+            response.read()
+        except Exception:
+            conn.close()
+            raise
+        _release(pool, conn, response)
+        method, url, headers, body = follow
+
+    raise urllib.error.HTTPError(
+        url, response.status, f"Too many redirects (more than {MAX_REDIRECTS})",
+        response.headers, io.BytesIO(b"")
+    )
+
+def _check_status(url: str, response: http.client.HTTPResponse, data: bytes):
+    """Raise HTTPError for error statuses and for redirects that were not followed."""
+    if response.status >= 300:
+        raise urllib.error.HTTPError(
+            url, response.status, response.reason,
+            response.headers, io.BytesIO(data)
+        )
+
+def _send_once(method: str, url: str, headers: Dict[str, str],
+               body: Optional[bytes]) -> Tuple[bytes, Dict[str, str]]:
+    """Send one request attempt over a pooled connection."""
+    pool, conn, response, url = _open(method, url, headers, body)
+    try:
+        data = response.read()
+    except Exception:
+        conn.close()
+        raise
+    _release(pool, conn, response)
+    _check_status(url, response, data)
+    return data, dict(response.getheaders())
+
+def request(method: str, url: str, headers: Optional[Dict[str, str]] = None,
+            body: Optional[bytes] = None) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Send an HTTP request over a pooled keep-alive connection.
+    Requests are paced and retried by the shared rate-limit scheduler.
+
+    Returns:
+        (response body, response headers)
+
+    Raises:
+        urllib.error.HTTPError for 4xx/5xx responses, so callers can keep
+        handling errors the same way as with urllib.request.urlopen.
+        Redirects are followed like urlopen does (up to MAX_REDIRECTS hops).
+    """
+    headers = dict(headers or {})
+    return scheduler.run(url, lambda: _send_once(method, url, headers, body))
+
+def get(url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Dict[str, str]]:
+    """HTTP GET over the shared transport (identical concurrent GETs share one request)."""
+    return inflight.do(request_key("GET", url, headers=headers), lambda: request("GET", url, headers))
+
+def post_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None,
+              use_cache: bool = True) -> Dict[str, Any]:
+    """
+    POST a JSON payload and decode the JSON response.
+    Responses are served from / stored in the shared response cache unless use_cache is False.
+    Identical requests already in flight are awaited instead of sent again.
+    """
+    headers = dict(headers or {})
+    if use_cache:
+        cached = cache.get(url, payload, headers)
+        if cached is not None:
+            return cached
+
+    data = json.dumps(payload).encode('utf-8')
+
+    def send() -> Dict[str, Any]:
+        body, _ = _send_once("POST", url, headers, data)
+        result = json.loads(body.decode('utf-8'))
+        if is_throttled_result(result):
+            raise ThrottledError(result)
+        return result
+
+    def fetch() -> Dict[str, Any]:
+        try:
+            result = scheduler.run(url, send)
+        except ThrottledError as e:
+            # Out of retries - hand back the throttled response like any other GraphQL error
+            return e.result
+        if use_cache:
+            cache.put(url, payload, result, headers)
+        return result
+
+    return inflight.do(request_key("POST", url, payload, headers), fetch)
+
+class IncompleteDownloadError(ConnectionError):
+    """The connection ended before the whole file arrived (retried and resumed)."""
+
+def _content_range_total(value: Optional[str]) -> Optional[int]:
+    """Total size from a Content-Range header ("bytes 100-199/1000" or "bytes */1000")."""
+    if value and "/" in value:
+        total = value.rsplit("/", 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    return None
+
+def _download_once(url: str, output_path: str, headers: Dict[str, str],
+                   chunk_size: int) -> Dict[str, str]:
+    """One download attempt: resume the .part file if present, then rename into place."""
+    part_path = output_path + ".part"
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    request_headers = dict(headers)
+    if offset:
+        request_headers["Range"] = f"bytes={offset}-"
+
+    pool, conn, response, url = _open("GET", url, request_headers, None)
+    response_headers = dict(response.getheaders())
+
+    if response.status == 416:
+        # Nothing left to fetch - the .part file is either complete or bogus
+        response.read()
+        _release(pool, conn, response)
+        if _content_range_total(response.getheader("Content-Range")) != offset:
+            os.remove(part_path)
+            raise IncompleteDownloadError(f"Partial download of {url} was invalid, restarting")
+        os.replace(part_path, output_path)
+        return response_headers
+
+    if response.status >= 300:
+        try:
+            data = response.read()
+        except Exception:
+            conn.close()
+            raise
+        _release(pool, conn, response)
+        _check_status(url, response, data)
+
+    if response.status == 206:
+        expected = _content_range_total(response.getheader("Content-Range"))
+        mode = 'ab'
+    else:
+        # Server ignored the Range header - start from scratch
+        offset = 0
+        expected = None
+        mode = 'wb'
+    length = response.getheader("Content-Length")
+    if expected is None and length is not None and length.isdigit():
+        expected = offset + int(length)
+
+    try:
+        with open(part_path, mode) as f:
+            while True:
+                chunk = response.read(chunk_size)
+                if not chunk:
+                    break
+                f.write(chunk)
+    except (http.client.IncompleteRead, OSError) as e:
+        conn.close()
+        raise IncompleteDownloadError(f"Download of {url} interrupted: {e}") from e
+    _release(pool, conn, response)
+
+    size = os.path.getsize(part_path)
+    if expected is not None and size != expected:
+        raise IncompleteDownloadError(f"Downloaded {size:,} of {expected:,} bytes from {url}")
+
+    os.replace(part_path, output_path)
+    return response_headers
+
+def download(url: str, output_path: str, headers: Optional[Dict[str, str]] = None,
+             chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Dict[str, str]:
+    """
+    Stream a file to disk without buffering it in memory.
+
+    Data is written to <output_path>.part and renamed into place once its size
+    matches Content-Length. Interrupted transfers are resumed with an HTTP
+    Range request, both on scheduler retries and on the next run.
+
+    Returns:
+        Response headers
+    """
+    headers = dict(headers or {})
+    return scheduler.run(url, lambda: _download_once(url, output_path, headers, chunk_size))
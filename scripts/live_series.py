@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Live Series Polling
+Follows in-progress series by polling the tiny seriesState { version } query
+on an adaptive interval. The full state is only fetched and processed when
+the version changes; each change is turned into a field-level patch
+(see series_delta) that is pushed to subscribers.
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Dict, Any, Optional, List, Callable
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from series_state_api import query_graphql
+from query_builder import series_state_query, SUMMARY_FIELDS
+from rate_limiter import scheduler
+from series_delta import SeriesDelta
+from utils import get_api_key
+
+# Polling interval bounds (seconds): back off while nothing changes, snap back on change
+DEFAULT_MIN_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 30.0
+BACKOFF_FACTOR = 1.5
+
+VERSION_QUERY = """
+query SeriesVersion($seriesId: ID!) {
+    seriesState(id: $seriesId) {
+        id
+        version
+        finished
+    }
+}
+"""
+
+# Subscriber callback: (series_id, patch, state)
+Subscriber = Callable[[str, Dict[str, Any], Dict[str, Any]], None]
+
+class SeriesPoller:
+    """
+    Polls one series until it finishes.
+
+    Usage:
+        poller = SeriesPoller(series_id, api_key)
+        poller.subscribe(lambda series_id, patch, state: print(patch["ops"]))
+        poller.run()
+    """
+
+    def __init__(self, series_id: str, api_key: Optional[str] = None, fields: Optional[List[str]] = None,
+                 min_interval: float = DEFAULT_MIN_INTERVAL, max_interval: float = DEFAULT_MAX_INTERVAL):
+        self.series_id = series_id
+        self.api_key = api_key
+        self.query = series_state_query(["version"] + list(fields or SUMMARY_FIELDS))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.version: Optional[str] = None
+        self.state: Optional[Dict[str, Any]] = None
+        self.delta = SeriesDelta()
+        self.finished = False
+        self.polls = 0
+        self.fetches = 0
+        self._subscribers: List[Subscriber] = []
+
+    def subscribe(self, callback: Subscriber):
+        """Register a callback for (series_id, patch, state) on every version change."""
+        self._subscribers.append(callback)
+
+    def _fetch(self, query: str) -> Optional[Dict[str, Any]]:
+        # Live data must never come from the response cache
+        result = query_graphql(query, {"seriesId": self.series_id}, self.api_key, use_cache=False)
+        if result.get("errors"):
+            return None
+        return (result.get("data") or {}).get("seriesState")
+
+    def poll_once(self) -> Optional[Dict[str, Any]]:
+        """
+        Check the version and, if it moved, fetch the state and notify subscribers.
+        Returns the patch, or None when nothing changed.
+        """
+        self.polls += 1
+        probe = self._fetch(VERSION_QUERY)
+        if probe is None:
+            self._slow_down()
+            return None
+        if probe.get("version") == self.version and self.state is not None:
+            self.finished = bool(probe.get("finished"))
+            self._slow_down()
+            return None
+
+        state = self._fetch(self.query)
+        if state is None:
+            self._slow_down()
+            return None
+        self.fetches += 1
+        patch = self.delta.update(state)
+        self.state = state
+        self.version = state.get("version")
+        self.finished = bool(state.get("finished"))
+        self.interval = self.min_interval
+
+        for callback in self._subscribers:
+            callback(self.series_id, patch, state)
+        return patch
+
+    def _slow_down(self):
+        self.interval = min(self.max_interval, self.interval * BACKOFF_FACTOR)
+
+    def run(self, stop: Optional[threading.Event] = None):
+        """Poll until the series finishes (or stop is set)."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.poll_once()
+            if self.finished:
+                break
+            stop.wait(self.interval)
+
+class LiveMonitor:
+    """Follows several series at once, one polling thread per series."""
+
+    def __init__(self, series_ids: List[str], api_key: Optional[str] = None, **poller_options):
+        self.pollers = [SeriesPoller(series_id, api_key, **poller_options) for series_id in series_ids]
+        self.stop = threading.Event()
+
+    def subscribe(self, callback: Subscriber):
+        for poller in self.pollers:
+            poller.subscribe(callback)
+
+    def run(self):
+        """Block until every series has finished (or stop is set)."""
+        threads = [threading.Thread(target=poller.run, args=(self.stop,), daemon=True,
+                                    name=f"live-{poller.series_id}") for poller in self.pollers]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            self.stop.set()
+
+def print_changes(series_id: str, patch: Dict[str, Any], state: Dict[str, Any]):
+    """Subscriber that prints the ops of one update."""
+    ops = patch["ops"]
+    if not ops:
+        return
+    stamp = time.strftime("%H:%M:%S")
+    teams = " vs ".join(f"{t.get('name', '?')} {t.get('score', 0)}" for t in state.get("teams", []))
+    print(f"[{stamp}] 🔴 {series_id} v{patch['from']} → v{patch['to']}: {teams} ({len(ops)} ops)")
+    for op in ops[:20]:
+        where = "/".join(op["path"]) or "series"
+        if op["op"] == "set":
+            print(f"     {where}.{op['field']} = {op['value']}")
+        elif op["op"] == "add":
+            print(f"     + {where}")
+        elif op["op"] == "remove":
+            print(f"     - {where}")
+    if len(ops) > 20:
+        print(f"     ... {len(ops) - 20} more")
+
+def main():
+    # Get API key (prioritizes .env file, then env var, then command line)
+    api_key = get_api_key()
+
+    args = sys.argv[1:]
+
+    def option(name: str, default: str) -> str:
+        if name in args:
+            return args[args.index(name) + 1]
+        return default
+
+    min_interval = float(option("--min-interval", str(DEFAULT_MIN_INTERVAL)))
+    max_interval = float(option("--max-interval", str(DEFAULT_MAX_INTERVAL)))
+    series_ids = [arg for arg in args if arg.isdigit()]
+    if not series_ids:
+        print("Usage: python3 live_series.py <series-id> [<series-id> ...] "
+              "[--min-interval S] [--max-interval S]")
+        return
+
+    print(f"📡 Following {len(series_ids)} series (Ctrl+C to stop)...")
+    monitor = LiveMonitor(series_ids, api_key, min_interval=min_interval, max_interval=max_interval)
+    monitor.subscribe(print_changes)
+    monitor.run()
+
+    print()
+    for poller in monitor.pollers:
+        status = "finished" if poller.finished else "stopped"
+        print(f"  {poller.series_id}: {status} after {poller.polls} polls, {poller.fetches} full fetches")
+    scheduler.print_stats()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Parallel Events Parser
+Decodes large events files on every core. An extracted .jsonl is split into
+newline-aligned byte ranges that worker processes read and decode
+themselves; for a zip, the parent decompresses and hands newline-aligned
+blocks to the workers. Results come back in file order, either as the usual
+dict stream or as one columnar batch (see event_store).
+"""
+
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Tuple
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from events import open_events, parse_lines
+
+# Target size of one unit of work (bytes of JSONL)
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+def split_ranges(path: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Tuple[int, int]]:
+    """Split a JSONL file into [start, end) byte ranges that each end on a newline."""
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, 'rb') as f:
+        while start < size:
+            end = start + chunk_bytes
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def _read_range(path: str, start: int, end: int) -> bytes:
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
+
+def _iter_blocks(f, chunk_bytes: int) -> Iterator[bytes]:
+    """Read newline-aligned blocks of about chunk_bytes from a binary stream."""
+    pending = b""
+    while True:
+        data = f.read(chunk_bytes)
+        if not data:
+            break
+        data = pending + data
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            pending = data
+            continue
+        pending = data[cut:]
+        yield data[:cut]
+    if pending:
+        yield pending
+
+def _decode(task: tuple, types: Optional[List[str]], columnar: bool):
+    """Worker: decode one range or block into a list of events or an EventColumns batch."""
+    if task[0] == "range":
+        _, path, start, end = task
+        block = _read_range(path, start, end)
+    else:
+        block = task[1]
+    events = parse_lines(block.splitlines(), types)
+    if columnar:
+        from event_store import EventColumns
+        return EventColumns.from_events(events, track_games=False)
+    return list(events)
+
+def _tasks(path: str, chunk_bytes: int) -> Iterator[tuple]:
+    """Units of work for a file: byte ranges for plain JSONL, data blocks for zips."""
+    if zipfile.is_zipfile(path):
+        with open_events(path) as f:
+            for block in _iter_blocks(f, chunk_bytes):
+                yield ("block", block)
+    else:
+        for start, end in split_ranges(path, chunk_bytes):
+            yield ("range", path, start, end)
+
+def _ordered_results(path: str, workers: Optional[int], chunk_bytes: int,
+                     types: Optional[List[str]], columnar: bool) -> Iterator[Any]:
+    """Run the tasks on a process pool, yielding results in file order."""
+    workers = workers or os.cpu_count() or 1
+    # Keep a bounded number of chunks in flight so memory stays flat
+    window = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for task in _tasks(path, chunk_bytes):
+            pending.append(executor.submit(_decode, task, types, columnar))
+            if len(pending) >= window:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+def parse_parallel(path: str, workers: Optional[int] = None, types: Optional[Iterable[str]] = None,
+                   chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the events of a file in order, decoded by a pool of worker processes.
+    Same output as events.iter_events(path, types).
+    """
+    types = sorted(types) if types else None
+    for batch in _ordered_results(path, workers, chunk_bytes, types, columnar=False):
+        yield from batch
+
+def parse_parallel_columns(path: str, workers: Optional[int] = None, types: Optional[Iterable[str]] = None,
+                           chunk_bytes: int = DEFAULT_CHUNK_BYTES):
+    """
+    Decode a file into a single EventColumns batch using a pool of worker processes.
+    Same output as event_store.EventColumns.from_file(path). Requires NumPy.
+    """
+    from event_store import EventColumns
+    types = sorted(types) if types else None
+    parts = list(_ordered_results(path, workers, chunk_bytes, types, columnar=True))
+    columns = EventColumns.concat(parts, track_games=True)
+    columns.meta["source"] = os.path.basename(path)
+    return columns
+
+def main():
+    args = sys.argv[1:]
+
+    def option(name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in args:
+            index = args.index(name)
+            value = args[index + 1]
+            del args[index:index + 2]
+            return value
+        return default
+
+    workers = int(option("--workers", "0")) or None
+    chunk_mb = float(option("--chunk-mb", str(DEFAULT_CHUNK_BYTES / (1024 * 1024))))
+    columnar = "--columns" in args
+    args = [arg for arg in args if arg != "--columns"]
+
+    if not args:
+        print("Usage: python3 parallel_parse.py <events_<id>_grid.jsonl[.zip]> "
+              "[--workers N] [--chunk-mb MB] [--columns]")
+        return
+
+    path = args[0]
+    chunk_bytes = int(chunk_mb * 1024 * 1024)
+    print(f"🔍 Parsing {path} with {workers or os.cpu_count()} workers...")
+    started = time.perf_counter()
+    if columnar:
+        columns = parse_parallel_columns(path, workers, chunk_bytes=chunk_bytes)
+        count = len(columns)
+    else:
+        count = sum(1 for _ in parse_parallel(path, workers, chunk_bytes=chunk_bytes))
+    elapsed = time.perf_counter() - started
+
+    size = os.path.getsize(path)
+    print(f"✅ {count:,} events in {elapsed:.2f}s "
+          f"({count / max(elapsed, 1e-9):,.0f} events/s, {size / 1e6 / max(elapsed, 1e-9):.1f} MB/s on disk)")
+
+if __name__ == "__main__":
+    main()
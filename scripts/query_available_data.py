@@ -14,6 +14,8 @@ sys.path.insert(0, os.path.dirname(__file__))
 from api_explorer import query_graphql as query_central_data
 from series_state_api import query_graphql as query_series_state, get_headers
 from utils import get_api_key
+from response_cache import cache
+from content_catalog import content_store
 
 def test_series_state_basic(api_key: str, series_id: str):
     """Test basic Series State query without LoL-specific fragments."""
@@ -163,30 +165,11 @@ def test_central_data_queries(api_key: str):
         if "data" in result:
             versions = result["data"].get("contentCatalogVersions", {})
             if versions.get("edges"):
-                version_id = versions["edges"][0]["node"]["id"]
                 print(f"   ✅ Found version: {versions['edges'][0]['node']['name']}")
                 
-                # Get characters
-                char_query = """
-                query Characters {
-                    contentCatalogEntities(
-                        contentCatalogVersionId: "%s"
-                        filter: { entityType: { in: [CHARACTER] } }
-                        first: 5
-                    ) {
-                        totalCount
-                        edges {
-                            node {
-                                name
-                            }
-                        }
-                    }
-                }
-                """ % version_id
-                char_result = query_central_data(char_query, api_key=api_key)
-                if "data" in char_result:
-                    chars = char_result["data"].get("contentCatalogEntities", {})
-                    print(f"   ✅ Found {chars.get('totalCount', 0)} champions")
+                # Get characters (every page, cached on disk per version)
+                catalog = content_store.load(versions["edges"][0]["node"], api_key)
+                print(f"   ✅ Found {len(catalog.characters())} champions")
     except Exception as e:
         print(f"   ❌ Error: {e}")
 
@@ -230,6 +213,8 @@ def main():
     print("\n✅ File Download API:")
     print("   - Events file: ✅")
     print("   - End state file: ✅")
+    print()
+    cache.print_stats()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+GraphQL field-selection builder
+Generates the smallest seriesState (Series State API) or series (Central Data
+API) document for the fields a caller actually uses, instead of always
+requesting the full selection set.
+
+Fields are dotted paths ("teams.score", "games.teams.players.kills").
+Title-specific fields (e.g. LoL damage and gold stats) are placed in
+reusable named fragments such as `fragment SeriesTeamStateLolFields on
+SeriesTeamStateLol`.
+"""
+
+import sys
+from typing import Dict, Any, Optional, Iterable, List, Tuple
+
+class Schema:
+    """The parts of an API schema the builder needs to know about."""
+
+    def __init__(self, root_type: str, child_types: Dict[Tuple[str, str], str],
+                 defaults: Dict[str, List[str]], required: Dict[str, List[str]],
+                 title_fields: Optional[Dict[str, Dict[str, Tuple[str, set]]]] = None):
+        self.root_type = root_type
+        # (parent type, field) -> child object type, for object fields that can carry fragments
+        self.child_types = child_types
+        # Sub-fields selected when an object field is requested without any
+        self.defaults = defaults
+        # Fields always selected on a type (stable IDs, cache/polling metadata)
+        self.required = required
+        # title -> type -> (title-specific GraphQL type, fields only available on it)
+        self.title_fields = title_fields or {}
+
+SERIES_STATE_SCHEMA = Schema(
+    root_type="SeriesState",
+    child_types={
+        ("SeriesState", "teams"): "SeriesTeamState",
+        ("SeriesTeamState", "players"): "SeriesPlayerState",
+        ("SeriesState", "games"): "GameState",
+        ("GameState", "teams"): "GameTeamState",
+        ("GameTeamState", "players"): "GamePlayerState",
+    },
+    defaults={
+        "title": ["nameShortened"],
+        "map": ["name"],
+        "character": ["id", "name"],
+        "respawnClock": ["ticking", "currentSeconds"],
+        "baronPowerPlays": ["id", "value"],
+        "teams": ["name"],
+        "players": ["name"],
+        "games": ["sequenceNumber"],
+        "draftActions": ["id", "type", "sequenceNumber", "drafter", "draftable"],
+        "drafter": ["id", "type"],
+        "draftable": ["id", "type", "name"],
+    },
+    required={
+        # finished decides whether a response can be cached forever
+        "SeriesState": ["id", "finished"],
+        "SeriesTeamState": ["id"],
+        "SeriesPlayerState": ["id"],
+        "GameState": ["id"],
+        "GameTeamState": ["id"],
+        "GamePlayerState": ["id"],
+    },
+    title_fields={
+        "lol": {
+            "SeriesTeamState": ("SeriesTeamStateLol", {
+                "damageDealt", "damageTaken", "visionScore", "kdaRatio", "totalMoneyEarned",
+                "moneyPerMinute", "damagePerMinute", "baronPowerPlays",
+            }),
+            "SeriesPlayerState": ("SeriesPlayerStateLol", {
+                "damageDealt", "damageTaken", "damagePercentage", "visionScore", "visionScorePerMinute",
+                "kdaRatio", "totalMoneyEarned", "moneyPerMinute", "damagePerMinute", "killParticipation",
+                "forwardPercentage", "character",
+            }),
+            "GameTeamState": ("GameTeamStateLol", {
+                "damageDealt", "damageTaken", "visionScore", "baronPowerPlays",
+            }),
+            "GamePlayerState": ("GamePlayerStateLol", {
+                "damageDealt", "damageTaken", "damagePercentage", "visionScore", "kdaRatio",
+                "totalMoneyEarned", "moneyPerMinute", "damagePerMinute", "respawnClock",
+            }),
+        },
+    },
+)
+
+CENTRAL_SERIES_SCHEMA = Schema(
+    root_type="Series",
+    child_types={},
+    defaults={
+        "format": ["id", "name", "nameShortened"],
+        "title": ["id", "name", "nameShortened"],
+        "tournament": ["id", "name"],
+        "teams": ["baseInfo"],
+        "baseInfo": ["id", "name"],
+        "players": ["id", "nickname"],
+        "nationality": ["code", "name"],
+        "team": ["id", "name"],
+        "roles": ["id", "name"],
+        "externalLinks": ["dataProvider", "externalEntity"],
+        "dataProvider": ["name"],
+        "externalEntity": ["id"],
+    },
+    required={"Series": ["id"]},
+)
+
+# Ready-made field sets
+SCORE_FIELDS = [
+    "started", "teams.name", "teams.score", "teams.won",
+    "games.sequenceNumber", "games.finished", "games.teams.name", "games.teams.won",
+]
+DRAFT_FIELDS = [
+    "games.sequenceNumber", "games.teams.name", "games.teams.side", "games.teams.won",
+    "games.draftActions",
+]
+SUMMARY_FIELDS = [
+    "title", "format", "started", "startedAt", "duration",
+    "teams.name", "teams.score", "teams.won", "teams.kills", "teams.deaths",
+    "teams.damageDealt", "teams.damageTaken", "teams.visionScore",
+    "teams.players.name", "teams.players.kills", "teams.players.deaths",
+    "teams.players.killAssistsGiven", "teams.players.character",
+    "games.sequenceNumber", "games.started", "games.finished", "games.map",
+    "games.teams.name", "games.teams.side", "games.teams.won", "games.teams.score",
+]
+
+def field_tree(fields: Iterable[str]) -> Dict[str, Any]:
+    """Turn dotted field paths into a nested {field: {subfield: ...}} tree."""
+    tree: Dict[str, Any] = {}
+    for path in fields:
+        node = tree
+        for part in path.split("."):
+            node = node.setdefault(part, {})
+    return tree
+
+class Selection:
+    """A rendered selection set plus the named fragments it uses."""
+
+    def __init__(self, fields: str, fragments: Dict[str, str]):
+        self.fields = fields
+        self.fragments = fragments
+
+    @property
+    def fragment_text(self) -> str:
+        return "\n".join(self.fragments[name] for name in sorted(self.fragments))
+
+def _fill_defaults(node: Dict[str, Any], schema: Schema) -> None:
+    for name, child in node.items():
+        if not child and name in schema.defaults:
+            for sub in schema.defaults[name]:
+                child.setdefault(sub, {})
+        _fill_defaults(child, schema)
+
+def _render(node: Dict[str, Any], type_name: Optional[str], schema: Schema, title: Optional[str],
+            fragments: Dict[str, str], indent: int) -> List[str]:
+    pad = " " * indent
+    node = dict(node)
+    if type_name:
+        for name in schema.required.get(type_name, []):
+            node.setdefault(name, {})
+
+    title_type, title_only = (schema.title_fields.get(title, {}).get(type_name, (None, set()))
+                              if type_name else (None, set()))
+    common, specific = [], []
+    for name, child in node.items():
+        lines = [f"{pad}{name}"]
+        if child:
+            child_type = schema.child_types.get((type_name, name)) if type_name else None
+            lines = [f"{pad}{name} {{"] + _render(child, child_type, schema, title, fragments, indent + 4) + [f"{pad}}}"]
+        if name in title_only:
+            specific.append((name, lines))
+        else:
+            common.extend(lines)
+
+    if specific:
+        fragment_name = f"{title_type}Fields"
+        body = []
+        for _, lines in specific:
+            # Re-indent the fragment body to fragment level
+            body.extend("    " + line[len(pad):] for line in lines)
+        fragments[fragment_name] = f"fragment {fragment_name} on {title_type} {{\n" + "\n".join(body) + "\n}"
+        common.append(f"{pad}...{fragment_name}")
+    return common
+
+def build_selection(fields: Iterable[str], schema: Schema = SERIES_STATE_SCHEMA,
+                    title: Optional[str] = "lol", indent: int = 12) -> Selection:
+    """
+    Build the selection set for the requested fields.
+
+    Args:
+        fields: Dotted field paths; object fields without sub-fields get sensible defaults
+        schema: SERIES_STATE_SCHEMA or CENTRAL_SERIES_SCHEMA
+        title: Title whose fragments carry title-specific fields ("lol"), or None
+    """
+    tree = field_tree(fields)
+    _fill_defaults(tree, schema)
+    if title is None:
+        _check_no_title_fields(tree, schema.root_type, schema)
+    fragments: Dict[str, str] = {}
+    lines = _render(tree, schema.root_type, schema, title, fragments, indent)
+    return Selection("\n" + "\n".join(lines), fragments)
+
+def _check_no_title_fields(node: Dict[str, Any], type_name: Optional[str], schema: Schema):
+    title_only = set()
+    for types in schema.title_fields.values():
+        if type_name in types:
+            title_only |= types[type_name][1]
+    for name, child in node.items():
+        if name in title_only:
+            raise ValueError(f"{type_name}.{name} is title-specific; pass a title (e.g. title='lol')")
+        _check_no_title_fields(child, schema.child_types.get((type_name, name)), schema)
+
+def series_state_query(fields: Iterable[str], title: Optional[str] = "lol") -> str:
+    """seriesState(id: $seriesId) document selecting only the given fields."""
+    selection = build_selection(fields, SERIES_STATE_SCHEMA, title)
+    query = ("query SeriesState($seriesId: ID!) {\n"
+             "        seriesState(id: $seriesId) {" + selection.fields + "\n        }\n    }")
+    if selection.fragments:
+        query += "\n" + selection.fragment_text
+    return query
+
+def central_series_query(fields: Iterable[str]) -> str:
+    """Central Data series(id: $seriesId) document selecting only the given fields."""
+    selection = build_selection(fields, CENTRAL_SERIES_SCHEMA, title=None)
+    return ("query Series($seriesId: ID!) {\n"
+            "        series(id: $seriesId) {" + selection.fields + "\n        }\n    }")
+
+def main():
+    args = sys.argv[1:]
+    central = "--central" in args
+    args = [arg for arg in args if arg != "--central"]
+    if not args:
+        print("Usage: python3 query_builder.py [--central] field.path [field.path ...]")
+        print("Example: python3 query_builder.py teams.score games.teams.players.kills teams.damageDealt")
+        return
+    print(central_series_query(args) if central else series_state_query(args))
+
+if __name__ == "__main__":
+    main()
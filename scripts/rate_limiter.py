@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware request scheduler shared by all Grid.gg API clients.
+
+Every request goes through a per-API token bucket. Throttled (HTTP 429,
+GraphQL ENHANCE_YOUR_CALM / TOO_MANY_REQUESTS) and transient (5xx, dropped
+connections) failures are retried with jittered exponential backoff,
+honouring Retry-After. Time spent waiting for a token, backing off and on
+the wire is tracked per API.
+"""
+
+import email.utils
+import random
+import threading
+import time
+import urllib.error
+from typing import Dict, Any, Optional, Callable
+
+# HTTP statuses worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# GraphQL errorDetail values that mean "slow down"
+THROTTLE_ERROR_DETAILS = {"ENHANCE_YOUR_CALM", "TOO_MANY_REQUESTS", "THROTTLED_CPU", "THROTTLED_CONCURRENCY"}
+
+# Default (requests per second, burst) per API
+DEFAULT_RATE_LIMITS = {
+    "central-data": (5.0, 10),
+    "series-state": (5.0, 10),
+    "file-download": (2.0, 4),
+}
+FALLBACK_RATE_LIMIT = (5.0, 10)
+
+class ThrottledError(Exception):
+    """A 200 response whose GraphQL errors say the request was rate limited."""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__("GraphQL request throttled")
+        self.result = result
+
+def is_throttled_result(result: Dict[str, Any]) -> bool:
+    """Check a GraphQL response for rate-limit errors."""
+    for error in result.get("errors") or []:
+        extensions = error.get("extensions") or {}
+        if extensions.get("errorDetail") in THROTTLE_ERROR_DETAILS:
+            return True
+    return False
+
+def api_name(url: str) -> str:
+    """Map a Grid.gg URL to the API it belongs to (used to pick a bucket)."""
+    for name in DEFAULT_RATE_LIMITS:
+        if f"/{name}" in url:
+            return name
+    return "other"
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with adaptive rate.
+
+    The rate halves on every throttle response and creeps back towards the
+    configured rate on success (AIMD), so a crawl settles just under the limit.
+    """
+
+    def __init__(self, rate: float, capacity: int, min_rate: float = 0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float):
+        """Hold back every request on this bucket for a while (e.g. Retry-After)."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def throttled(self):
+        """Multiplicative decrease after a rate-limit response."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+    def succeeded(self):
+        """Additive increase back towards the configured rate."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+class RequestStats:
+    """Per-API counters for queue wait, backoff and wire time."""
+
+    def __init__(self):
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+        self.queue_wait = 0.0
+        self.backoff_wait = 0.0
+        self.wire_time = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, **increments):
+        """Atomically add to one or more counters."""
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {name: value for name, value in vars(self).items() if not name.startswith("_")}
+
+class Scheduler:
+    """Runs requests through per-API token buckets with retry and backoff."""
+
+    def __init__(self, max_retries: int = 5, base_delay: float = 0.5, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, RequestStats] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, api: str, rate: float, burst: int):
+        """Set the rate limit (requests per second) and burst size for an API."""
+        with self._lock:
+            self._buckets[api] = TokenBucket(rate, burst)
+
+    def bucket(self, api: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(api)
+            if bucket is None:
+                rate, burst = DEFAULT_RATE_LIMITS.get(api, FALLBACK_RATE_LIMIT)
+                bucket = self._buckets[api] = TokenBucket(rate, burst)
+            return bucket
+
+    def _stats_for(self, api: str) -> RequestStats:
+        with self._lock:
+            stats = self._stats.get(api)
+            if stats is None:
+                stats = self._stats[api] = RequestStats()
+            return stats
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def run(self, url: str, send: Callable[[], Any]) -> Any:
+        """
+        Call send() once a token is available, retrying throttled and transient failures.
+
+        send() performs one attempt; it raises urllib.error.HTTPError for error
+        statuses and ThrottledError for throttled GraphQL responses.
+        """
+        api = api_name(url)
+        bucket = self.bucket(api)
+        stats = self._stats_for(api)
+        stats.add(requests=1)
+
+        attempt = 0
+        while True:
+            stats.add(queue_wait=bucket.acquire(), attempts=1)
+            started = time.monotonic()
+            retry_after = None
+            try:
+                result = send()
+                stats.add(wire_time=time.monotonic() - started)
+                bucket.succeeded()
+                return result
+            except urllib.error.HTTPError as e:
+                stats.add(wire_time=time.monotonic() - started)
+                if e.code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    stats.add(failures=1)
+                    raise
+                if e.code == 429:
+                    stats.add(throttled=1)
+                    bucket.throttled()
+                retry_after = parse_retry_after(e.headers.get("Retry-After") if e.headers else None)
+            except ThrottledError:
+                stats.add(wire_time=time.monotonic() - started)
+                stats.add(throttled=1)
+                bucket.throttled()
+                if attempt >= self.max_retries:
+                    stats.add(failures=1)
+                    raise
+            except (ConnectionError, TimeoutError):
+                stats.add(wire_time=time.monotonic() - started)
+                if attempt >= self.max_retries:
+                    stats.add(failures=1)
+                    raise
+
+            delay = self.backoff_delay(attempt)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+                bucket.pause(retry_after)
+            stats.add(retries=1, backoff_wait=delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of per-API request statistics."""
+        with self._lock:
+            return {api: stats.as_dict() for api, stats in self._stats.items()}
+
+    def print_stats(self):
+        """Print queue wait vs. wire time per API."""
+        stats = self.stats()
+        if not stats:
+            return
+        print("📈 Request Stats:")
+        for api, s in sorted(stats.items()):
+            requests = max(s["requests"], 1)
+            print(f"  {api}: {s['requests']} requests, {s['retries']} retries, "
+                  f"{s['throttled']} throttled, {s['failures']} failed")
+            print(f"     Queue wait: {s['queue_wait']:.2f}s (avg {s['queue_wait'] / requests * 1000:.0f} ms) | "
+                  f"Backoff: {s['backoff_wait']:.2f}s | "
+                  f"Wire: {s['wire_time']:.2f}s (avg {s['wire_time'] / requests * 1000:.0f} ms)")
+
+# Scheduler shared by every client in the process
+scheduler = Scheduler()
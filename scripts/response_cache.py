@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+On-disk response cache for Grid.gg GraphQL queries.
+
+Responses are keyed by endpoint, a hash of the whitespace-normalised query,
+the variables and a hash of the API key. Finished series (seriesState.finished == true) and static
+catalog data never change, so they are kept forever; in-progress series get
+a short TTL and other Central Data a longer one.
+
+Settings (environment variables):
+    GRID_CACHE=0          disable the cache
+    GRID_CACHE_DIR=path   cache directory (default: <project root>/.cache/graphql)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+# Default cache directory (project root, gitignored)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "graphql")
+
+# Seconds to keep an in-progress (or not yet started) series state
+LIVE_TTL = 10
+
+# Seconds to keep other Central Data responses (new series/tournaments appear over time)
+DEFAULT_TTL = 3600
+
+# Central Data fields whose results never change
+STATIC_FIELDS = {"titles", "title", "contentCatalogEntities", "contentCatalogEntity"}
+
+# Request headers that identify the caller (part of every cache key)
+CREDENTIAL_HEADERS = ("x-api-key", "authorization")
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so formatting differences don't change the cache key."""
+    return " ".join(query.split())
+
+def credentials_hash(headers: Optional[Dict[str, str]] = None) -> str:
+    """Hash of the credential headers (different API keys may see different data)."""
+    credentials = {name.lower(): value for name, value in (headers or {}).items()
+                   if name.lower() in CREDENTIAL_HEADERS}
+    return hashlib.sha256(json.dumps(credentials, sort_keys=True).encode('utf-8')).hexdigest()
+
+def cache_key(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> str:
+    """Cache key for a GraphQL request: endpoint + normalised query hash + variables + credentials."""
+    query_hash = hashlib.sha256(normalize_query(payload.get("query", "")).encode('utf-8')).hexdigest()
+    material = json.dumps({
+        "url": url,
+        "query": query_hash,
+        "variables": payload.get("variables") or {},
+        "credentials": credentials_hash(headers),
+    }, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+def response_ttl(url: str, result: Dict[str, Any]) -> Optional[float]:
+    """
+    How long a response stays valid, in seconds.
+    None means forever; 0 means don't cache (errors, empty responses).
+    """
+    if result.get("errors") or not isinstance(result.get("data"), dict):
+        return 0
+    data = result["data"]
+    if not data:
+        return 0
+
+    if "/series-state/" in url:
+        # Every series in the response must be finished (covers aliased batches too)
+        states = list(data.values())
+        if all(isinstance(state, dict) and state.get("finished") is True for state in states):
+            return None
+        return LIVE_TTL
+
+    if all(field in STATIC_FIELDS for field in data):
+        return None
+    return DEFAULT_TTL
+
+class ResponseCache:
+    """Thread-safe file-per-entry response cache with hit/miss counters."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, enabled: bool = True):
+        self.directory = directory
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.expired = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def get(self, url: str, payload: Dict[str, Any],
+            headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """Cached response for a request, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+        path = self._path(cache_key(url, payload, headers))
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+
+        expires = entry.get("expires")
+        if expires is not None and expires <= time.time():
+            self._count("expired")
+            self._count("misses")
+            return None
+        self._count("hits")
+        return entry["result"]
+
+    def put(self, url: str, payload: Dict[str, Any], result: Dict[str, Any],
+            headers: Optional[Dict[str, str]] = None):
+        """Store a response according to its TTL policy."""
+        if not self.enabled:
+            return
+        ttl = response_ttl(url, result)
+        if ttl == 0:
+            return
+        path = self._path(cache_key(url, payload, headers))
+        entry = {
+            "url": url,
+            "stored": time.time(),
+            "expires": None if ttl is None else time.time() + ttl,
+            "result": result,
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError:
+            # A cache write failure should never fail the request
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._count("stores")
+
+    def clear(self):
+        """Delete every cached response."""
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".json"):
+                    os.remove(os.path.join(root, name))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "stores": self.stores,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def print_stats(self):
+        """Print hit/miss counters (nothing if the cache was not used)."""
+        s = self.stats()
+        if not self.enabled or not (s["hits"] or s["misses"]):
+            return
+        print(f"🗄️  Response Cache: {s['hits']} hits, {s['misses']} misses "
+              f"({s['hit_rate'] * 100:.0f}% hit rate), {s['expired']} expired, {s['stores']} stored")
+
+# Cache shared by every client in the process
+cache = ResponseCache(
+    os.getenv("GRID_CACHE_DIR") or DEFAULT_CACHE_DIR,
+    enabled=os.getenv("GRID_CACHE", "1") != "0",
+)
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Scouting Report Pipeline
+Builds a report on one team from its series in a date window: record,
+side preference, champion pools per player, picks and bans, first-objective
+rates and early gold leads.
+
+Every series is reduced to a small per-series partial (the team's games
+from its point of view) that is saved under .cache/scouting/<team>/. A
+finished series never changes, so re-running the report before the next
+match day only fetches and processes the series played since the last run;
+the report itself is a cheap merge of the partials.
+
+Series states come from the Series State API (one batched request for the
+new series), and first objectives/gold leads from the events files via the
+columnar event store and timeline.py (requires NumPy; without it the report
+skips those sections).
+
+Settings (environment variables):
+    GRID_SCOUTING_DIR=path   partials directory (default: <project root>/.cache/scouting)
+"""
+
+import json
+import os
+import sys
+import time
+import urllib.error
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Iterable, List, Tuple
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+import http_client
+from api_explorer import paginate, GraphQLError
+from catalog import Catalog
+from event_store import load_events
+from file_download_api import download_file, events_file_url
+from game_state import OBJECTIVE_WORDS
+from query_builder import build_selection
+from series_models import SeriesState, GameState, decode_series_states
+from series_state_api import get_series_states
+from timeline import np, game_timelines, gold_leads, codes_matching, CS_WORDS
+from utils import get_api_key
+
+# Default directory (project root, gitignored)
+DEFAULT_SCOUTING_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    ".cache", "scouting")
+
+# Bump when the partial layout changes (older partials are rebuilt)
+PARTIAL_VERSION = 2
+
+# Default report window
+DEFAULT_DAYS = 30
+
+# Minutes at which gold leads are recorded
+LEAD_MINUTES = (10, 15)
+
+# Number of series whose events are downloaded in parallel
+DEFAULT_WORKERS = 4
+
+# First objectives: name -> words in the event type (first blood uses kill events)
+FIRST_OBJECTIVES = {
+    "first_tower": ("tower", "turret"),
+    "first_dragon": ("dragon", "drake"),
+    "first_herald": ("herald",),
+    "first_baron": ("baron",),
+}
+
+TEAM_SERIES_QUERY = """
+query TeamSeries($filter: SeriesFilter, $first: Int, $after: Cursor) {
+    allSeries(filter: $filter, orderBy: StartTimeScheduled, first: $first, after: $after) {
+        edges {
+            node {
+                id
+                startTimeScheduled
+                tournament {
+                    name
+                }
+                teams {
+                    baseInfo {
+                        id
+                        name
+                    }
+                }
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+# Series state fields a partial needs
+SCOUTING_FIELDS = [
+    "finished", "startedAt", "teams.name", "teams.won",
+    "games.sequenceNumber", "games.finished", "games.startedAt", "games.map",
+    "games.teams.name", "games.teams.side", "games.teams.won",
+    "games.teams.players.name", "games.teams.players.character",
+    "games.draftActions",
+]
+
+def team_series(team_id: str, start: str, end: str, api_key: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Series a team was scheduled to play between two ISO timestamps, oldest first."""
+    variables = {"filter": {"teamIds": {"in": [str(team_id)]},
+                            "startTimeScheduled": {"gte": start, "lte": end}}}
+    # Always fresh: a cached list could miss a series played in the last hour
+    return list(paginate(TEAM_SERIES_QUERY, "allSeries", variables, api_key, use_cache=False))
+
+def _first_events(columns, game: int, timeline, team_ids: List[str]) -> Dict[str, Optional[int]]:
+    """Index (in team_ids) of the team that got each first objective in one game, None if nobody did."""
+    rows = np.asarray(columns["game"]) == game
+    types = np.asarray(columns["type"])
+    actors = np.asarray(columns["actor"])
+    teams = np.asarray(columns["team"])
+    player_team = {player: timeline.teams[team] for player, team
+                   in zip(timeline.players, timeline.player_team.tolist()) if team >= 0}
+
+    firsts = {}
+    for name in ["first_blood"] + list(FIRST_OBJECTIVES):
+        if name == "first_blood":
+            codes = codes_matching(columns, ("kill",), exclude=CS_WORDS + OBJECTIVE_WORDS)
+        else:
+            codes = codes_matching(columns, FIRST_OBJECTIVES[name])
+        matches = np.nonzero(rows & np.isin(types, codes))[0]
+        firsts[name] = None
+        if len(matches):
+            # Rows are in event order, so the first match is the first occurrence
+            row = int(matches[0])
+            team = columns.ids.decode(int(teams[row])) or player_team.get(columns.ids.decode(int(actors[row])))
+            if team in team_ids:
+                firsts[name] = team_ids.index(team)
+    return firsts
+
+def events_by_game(events_path: str, team_ids: List[str]) -> Dict[int, Dict[str, Any]]:
+    """First objectives and gold leads (for team_ids[0]) per game number from an events file."""
+    columns = load_events(events_path)
+    timelines = game_timelines(columns, os.path.basename(events_path))
+    leads = gold_leads(timelines, LEAD_MINUTES)
+    games = {}
+    for timeline, row in zip(timelines, leads.tolist()):
+        if not set(timeline.teams[:2]) <= set(team_ids):
+            continue
+        # gold_diff is teams[0] - teams[1] of the timeline; flip it to team_ids[0]'s view
+        sign = 1.0 if timeline.teams[0] == team_ids[0] else -1.0
+        firsts = _first_events(columns, timeline.game, timeline, team_ids)
+        games[timeline.game] = {
+            "gold_lead": {str(minute): sign * value for minute, value in zip(LEAD_MINUTES, row)
+                          if value == value},
+            "first": {name: (team == 0) if team is not None else None for name, team in firsts.items()},
+        }
+    return games
+
+def game_partial(game: GameState, team_id: str) -> Optional[Dict[str, Any]]:
+    """One game from the team's point of view."""
+    ours = next((team for team in game.teams if team.id == team_id), None)
+    theirs = next((team for team in game.teams if team.id != team_id), None)
+    if ours is None or not game.finished:
+        return None
+    actions = sorted(game.draft_actions, key=lambda action: action.sequence_number)
+    first_pick = next((action for action in actions if (action.type or "").lower() == "pick"), None)
+    kinds = {"pick": [], "ban": [], "ban_against": []}
+    for action in actions:
+        kind = (action.type or "").lower()
+        name = action.draftable_name or action.draftable_id
+        if kind == "ban":
+            kinds["ban" if action.drafter_id == team_id else "ban_against"].append(name)
+        elif kind == "pick" and action.drafter_id == team_id:
+            kinds["pick"].append(name)
+    return {
+        "sequence": game.sequence_number,
+        "won": ours.won,
+        "side": ours.side,
+        "map": game.map_name,
+        "opponent": theirs.name if theirs else None,
+        "opponent_id": theirs.id if theirs else None,
+        "first_pick": first_pick is not None and first_pick.drafter_id == team_id,
+        "players": {player.name or player.id: player.character_name
+                    for player in ours.players if player.character_name},
+        "picks": kinds["pick"] or [player.character_name for player in ours.players if player.character_name],
+        "bans": kinds["ban"],
+        "bans_against": kinds["ban_against"],
+    }
+
+def series_partial(state: SeriesState, team_id: str, series: Dict[str, Any],
+                   events: Optional[Dict[int, Dict[str, Any]]] = None,
+                   events_missing: bool = False) -> Dict[str, Any]:
+    """
+    The team's games in one series, plus event-derived stats per game when available.
+    "events" is True with stats, "missing" if the series has no events file, False otherwise.
+    """
+    ours = next((team for team in state.teams if team.id == team_id), None)
+    opponent = next((team for team in state.teams if team.id != team_id), None)
+    games = []
+    for game in state.games:
+        partial = game_partial(game, team_id)
+        if partial is None:
+            continue
+        if events and game.sequence_number in events:
+            partial.update(events[game.sequence_number])
+        games.append(partial)
+    return {
+        "version": PARTIAL_VERSION,
+        "series_id": state.id,
+        "team_id": team_id,
+        "team": ours.name if ours else None,
+        "opponent": opponent.name if opponent else None,
+        "start": series.get("startTimeScheduled") or state.started_at,
+        "tournament": (series.get("tournament") or {}).get("name"),
+        "finished": state.finished,
+        "won": ours.won if ours else False,
+        "events": "missing" if events_missing else events is not None,
+        "games": games,
+    }
+
+class ScoutingPipeline:
+    """
+    Fetches and caches per-series partials for one team.
+
+    Usage:
+        pipeline = ScoutingPipeline("47494", api_key)
+        partials = pipeline.run("2024-01-01T00:00:00Z", "2024-02-01T00:00:00Z")
+        print_report(build_report(partials))
+    """
+
+    def __init__(self, team_id: str, api_key: Optional[str] = None, directory: Optional[str] = None,
+                 use_events: bool = True, workers: int = DEFAULT_WORKERS):
+        self.team_id = str(team_id)
+        self.api_key = api_key
+        self.directory = directory or os.getenv("GRID_SCOUTING_DIR") or DEFAULT_SCOUTING_DIR
+        self.use_events = use_events and np is not None
+        self.workers = workers
+        self.cached = 0
+        self.processed = 0
+        self.failed: List[str] = []
+
+    def _path(self, series_id: str) -> str:
+        return os.path.join(self.directory, self.team_id, f"{series_id}.json")
+
+    def _load(self, series_id: str) -> Optional[Dict[str, Any]]:
+        """
+        A stored partial that can be reused (finished series, same layout, events if wanted).
+        Series without an events file ("events": "missing") are not retried.
+        """
+        path = self._path(series_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            partial = json.load(f)
+        if partial.get("version") != PARTIAL_VERSION or not partial.get("finished"):
+            return None
+        if self.use_events and not partial.get("events"):
+            return None
+        return partial
+
+    def _save(self, partial: Dict[str, Any]):
+        path = self._path(partial["series_id"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(partial, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def _events(self, state: SeriesState) -> Tuple[Optional[Dict[int, Dict[str, Any]]], bool]:
+        """
+        (event stats by game, no_events) for a finished series. no_events is True only
+        when the series has no events file (404); other failures are retried next run.
+        """
+        events_dir = os.path.join(self.directory, "events")
+        os.makedirs(events_dir, exist_ok=True)
+        path = os.path.join(events_dir, f"events_{state.id}_grid.jsonl.zip")
+        try:
+            if not os.path.exists(path):
+                download_file(events_file_url(state.id), self.api_key, path)
+            opponent = next((team.id for team in state.teams if team.id != self.team_id), None)
+            return events_by_game(path, [self.team_id, opponent]), False
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                print(f"  ⚠️  {state.id}: no events file")
+                return None, True
+            print(f"  ⚠️  {state.id}: no event stats ({e})")
+            return None, False
+        except Exception as e:  # corrupt/partial file, network errors - retried next run
+            print(f"  ⚠️  {state.id}: no event stats ({e})")
+            return None, False
+
+    def run(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """Partials for every series of the team in [start, end], processing only new ones."""
+        series_list = [series for series in team_series(self.team_id, start, end, self.api_key)
+                       if any((team.get("baseInfo") or {}).get("id") == self.team_id
+                              for team in series.get("teams") or [])]
+        partials: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for series in series_list:
+            partial = self._load(series["id"])
+            if partial is not None:
+                partials[series["id"]] = partial
+            else:
+                missing.append(series)
+        self.cached = len(partials)
+
+        if missing:
+            selection = build_selection(SCOUTING_FIELDS)
+            results = get_series_states([series["id"] for series in missing], self.api_key,
+                                        fields=selection.fields, fragments=selection.fragment_text)
+            states = decode_series_states(results)
+            self.failed = [series["id"] for series in missing if series["id"] not in states]
+            ready = [series for series in missing if series["id"] in states and states[series["id"]].started]
+
+            if self.use_events:
+                http_client.ensure_pool_size(self.workers)
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    events = list(executor.map(lambda series: self._events(states[series["id"]])
+                                               if states[series["id"]].finished else (None, False), ready))
+            else:
+                events = [(None, False)] * len(ready)
+
+            for series, (series_events, no_events) in zip(ready, events):
+                partial = series_partial(states[series["id"]], self.team_id, series, series_events, no_events)
+                if partial["finished"]:
+                    self._save(partial)
+                partials[series["id"]] = partial
+                self.processed += 1
+
+        return [partials[series["id"]] for series in series_list if series["id"] in partials]
+
+def _rate(count: int, total: int) -> Optional[float]:
+    return count / total if total else None
+
+def build_report(partials: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge per-series partials into the team's tendencies."""
+    partials = list(partials)
+    games = [game for partial in partials for game in partial["games"]]
+    sides: Dict[str, List[int]] = {}
+    pools: Dict[str, Dict[str, List[int]]] = {}
+    picks, bans, bans_against = Counter(), Counter(), Counter()
+    firsts: Dict[str, List[int]] = {}
+    leads: Dict[str, List[float]] = {}
+
+    for game in games:
+        won = int(game["won"])
+        record = sides.setdefault(game.get("side") or "unknown", [0, 0])
+        record[0] += 1
+        record[1] += won
+        for player, champion in game["players"].items():
+            champion_record = pools.setdefault(player, {}).setdefault(champion, [0, 0])
+            champion_record[0] += 1
+            champion_record[1] += won
+        picks.update(game["picks"])
+        bans.update(game["bans"])
+        bans_against.update(game["bans_against"])
+        for name, ours in (game.get("first") or {}).items():
+            if ours is not None:
+                counts = firsts.setdefault(name, [0, 0])
+                counts[0] += 1
+                counts[1] += int(ours)
+        for minute, lead in (game.get("gold_lead") or {}).items():
+            leads.setdefault(minute, []).append(lead)
+
+    return {
+        "team": next((p["team"] for p in partials if p.get("team")), None),
+        "series": len(partials),
+        "series_won": sum(1 for p in partials if p["finished"] and p["won"]),
+        "games": len(games),
+        "games_won": sum(1 for game in games if game["won"]),
+        "first_pick_rate": _rate(sum(1 for game in games if game.get("first_pick")), len(games)),
+        "sides": {side: {"games": n, "win_rate": _rate(w, n)} for side, (n, w) in sorted(sides.items())},
+        "champion_pools": {
+            player: sorted(({"champion": c, "games": n, "win_rate": _rate(w, n)} for c, (n, w) in pool.items()),
+                           key=lambda entry: -entry["games"])
+            for player, pool in sorted(pools.items())
+        },
+        "top_picks": picks.most_common(10),
+        "top_bans": bans.most_common(10),
+        "top_bans_against": bans_against.most_common(10),
+        "first_objectives": {name: _rate(ours, n) for name, (n, ours) in sorted(firsts.items())},
+        "gold_leads": {minute: {"mean": sum(values) / len(values),
+                                "ahead_rate": _rate(sum(1 for v in values if v > 0), len(values)),
+                                "games": len(values)}
+                       for minute, values in sorted(leads.items(), key=lambda item: int(item[0]))},
+        "matches": [{"series_id": p["series_id"], "start": p["start"], "opponent": p["opponent"],
+                     "won": p["won"], "games": len(p["games"])} for p in partials],
+    }
+
+def print_report(report: Dict[str, Any]):
+    """Print a scouting report."""
+    def percent(value: Optional[float]) -> str:
+        return f"{value * 100:.0f}%" if value is not None else "-"
+
+    print("=" * 80)
+    print(f"🔎 SCOUTING REPORT: {report['team'] or '?'}")
+    print("=" * 80)
+    print(f"📅 Series: {report['series_won']}-{report['series'] - report['series_won']}, "
+          f"games: {report['games_won']}-{report['games'] - report['games_won']}, "
+          f"first pick in {percent(report['first_pick_rate'])} of games")
+    for match in report["matches"][-5:]:
+        print(f"   {(match['start'] or '')[:10]} vs {match['opponent']}: {'✅ W' if match['won'] else '❌ L'} "
+              f"({match['games']} games)")
+
+    print("\n🗺️  Sides:")
+    for side, record in report["sides"].items():
+        print(f"   {side}: {record['games']} games, {percent(record['win_rate'])} won")
+
+    print("\n🧙 Champion pools:")
+    for player, pool in report["champion_pools"].items():
+        print(f"   {player}: " + ", ".join(f"{entry['champion']} {entry['games']} ({percent(entry['win_rate'])})"
+                                          for entry in pool[:5]))
+
+    print("\n🎯 Draft:")
+    print("   Picks: " + ", ".join(f"{name} ({count})" for name, count in report["top_picks"][:8]))
+    print("   Bans: " + ", ".join(f"{name} ({count})" for name, count in report["top_bans"][:8]))
+    print("   Banned against them: " + ", ".join(f"{name} ({count})" for name, count in report["top_bans_against"][:8]))
+
+    if report["first_objectives"]:
+        print("\n🏰 First objectives: " + ", ".join(
+            f"{name.replace('_', ' ')} {percent(rate)}" for name, rate in report["first_objectives"].items()))
+    if report["gold_leads"]:
+        print("💰 Gold lead: " + ", ".join(
+            f"@{minute}m {lead['mean']:+.0f} (ahead in {percent(lead['ahead_rate'])})"
+            for minute, lead in report["gold_leads"].items()))
+
+def resolve_team(name_or_id: str) -> Optional[str]:
+    """Team ID from a numeric ID or a name (via the local catalog)."""
+    if name_or_id.isdigit():
+        return name_or_id
+    team = Catalog().find_team(name_or_id)
+    return team["id"] if team else None
+
+def _timestamp(date: str, end_of_day: bool = False) -> str:
+    """ISO timestamp for a YYYY-MM-DD date (full timestamps pass through)."""
+    if "T" in date:
+        return date
+    return f"{date}T23:59:59Z" if end_of_day else f"{date}T00:00:00Z"
+
+def main():
+    # Get API key (prioritizes .env file, then env var, then command line)
+    api_key = get_api_key()
+
+    args = [arg for arg in sys.argv[1:] if arg != api_key]
+
+    def option(name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in args:
+            return args[args.index(name) + 1]
+        return default
+
+    if not option("--team"):
+        print("Usage: python3 scouting.py --team ID|NAME [--from YYYY-MM-DD] [--to YYYY-MM-DD] "
+              "[--no-events] [--json report.json]")
+        print(f"Default window: the last {DEFAULT_DAYS} days. Team names are looked up in the local catalog "
+              "(python3 catalog.py sync --title lol).")
+        return
+
+    team_id = resolve_team(option("--team"))
+    if team_id is None:
+        print(f"❌ Unknown team: {option('--team')}")
+        return
+    now = datetime.now(timezone.utc)
+    start = _timestamp(option("--from") or (now - timedelta(days=DEFAULT_DAYS)).strftime("%Y-%m-%d"))
+    end = _timestamp(option("--to") or now.strftime("%Y-%m-%d"), end_of_day=True)
+    if "--no-events" not in args and np is None:
+        print("ℹ️  NumPy not installed: first objectives and gold leads are skipped (pip install numpy)")
+
+    print(f"🔍 Scouting team {team_id} from {start[:10]} to {end[:10]}...")
+    started = time.perf_counter()
+    pipeline = ScoutingPipeline(team_id, api_key, use_events="--no-events" not in args)
+    try:
+        partials = pipeline.run(start, end)
+    except GraphQLError as e:
+        print(f"❌ Could not list series: {e}")
+        return
+    print(f"♻️  {pipeline.cached} series from cache, {pipeline.processed} processed, "
+          f"{len(pipeline.failed)} failed ({time.perf_counter() - started:.1f}s)")
+    print()
+
+    report = build_report(partials)
+    print_report(report)
+    if option("--json"):
+        with open(option("--json"), 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Saved to: {option('--json')}")
+
+if __name__ == "__main__":
+    main()
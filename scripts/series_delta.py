@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Series State Delta Engine
+Indexes a series state by stable IDs (teams, games, players, draft actions,
+...) and computes minimal field-level patches between successive states.
+Patches are small JSON documents that can be applied to the previous state
+to rebuild the new one, so live clients receive kilobyte patches instead of
+full states.
+
+Patch format:
+    {"from": <version>, "to": <version>, "ops": [
+        {"op": "set", "path": [...], "field": "kills", "value": 4},
+        {"op": "unset", "path": [...], "field": "kills"},
+        {"op": "add", "path": [...], "fields": {...}},
+        {"op": "remove", "path": [...]},
+        {"op": "order", "path": [..., "players"], "ids": [...]},
+    ]}
+
+A path is the list of (collection, id) pairs from the series root, e.g.
+["games", "g1", "teams", "t1", "players", "p7"]; [] is the series itself.
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Any, Optional, List, Tuple
+
+Key = Tuple[str, ...]
+
+class StateIndex:
+    """
+    Flat view of a series state.
+
+    entities maps an entity path to its scalar fields (values that are not
+    ID-bearing lists; nested objects such as character are kept as values).
+    orders maps a collection path (entity path + collection name) to its IDs in order.
+    """
+
+    def __init__(self, entities: Optional[Dict[Key, Dict[str, Any]]] = None,
+                 orders: Optional[Dict[Key, List[str]]] = None):
+        self.entities = entities if entities is not None else {}
+        self.orders = orders if orders is not None else {}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StateIndex":
+        index = cls()
+        index._add(state, ())
+        return index
+
+    def _add(self, item: Dict[str, Any], key: Key):
+        fields = {}
+        for name, value in item.items():
+            if _is_collection(value):
+                collection = key + (name,)
+                self.orders[collection] = [str(child["id"]) for child in value]
+                for child in value:
+                    self._add(child, collection + (str(child["id"]),))
+            else:
+                fields[name] = value
+        self.entities[key] = fields
+
+    def copy(self) -> "StateIndex":
+        return StateIndex({key: dict(fields) for key, fields in self.entities.items()},
+                          {key: list(ids) for key, ids in self.orders.items()})
+
+    def to_state(self) -> Dict[str, Any]:
+        """Rebuild the nested series state."""
+        collections: Dict[Key, List[Key]] = {}
+        for collection in self.orders:
+            collections.setdefault(collection[:-1], []).append(collection)
+        return self._build((), collections)
+
+    def _build(self, key: Key, collections: Dict[Key, List[Key]]) -> Dict[str, Any]:
+        item = dict(self.entities.get(key, {}))
+        for collection in collections.get(key, []):
+            item[collection[-1]] = [self._build(collection + (child_id,), collections)
+                                    for child_id in self.orders[collection]]
+        return item
+
+def _is_collection(value: Any) -> bool:
+    """Lists of objects with IDs are tracked entity by entity; anything else is a plain value."""
+    return (isinstance(value, list) and bool(value)
+            and all(isinstance(child, dict) and child.get("id") is not None for child in value))
+
+def diff(old: StateIndex, new: StateIndex) -> List[Dict[str, Any]]:
+    """
+    Minimal list of ops turning old into new.
+
+    Unchanged entities are skipped by one dict comparison each, so the Python
+    work beyond that is proportional to the number of changed fields.
+    """
+    ops: List[Dict[str, Any]] = []
+    old_entities = old.entities
+    for key, fields in new.entities.items():
+        previous = old_entities.get(key)
+        if previous is None:
+            ops.append({"op": "add", "path": list(key), "fields": fields})
+            continue
+        if previous == fields:
+            continue
+        for name, value in fields.items():
+            if name not in previous or previous[name] != value:
+                ops.append({"op": "set", "path": list(key), "field": name, "value": value})
+        for name in previous:
+            if name not in fields:
+                ops.append({"op": "unset", "path": list(key), "field": name})
+
+    for key in old_entities:
+        if key not in new.entities:
+            ops.append({"op": "remove", "path": list(key)})
+
+    for collection, ids in new.orders.items():
+        if old.orders.get(collection) != ids:
+            ops.append({"op": "order", "path": list(collection), "ids": ids})
+    for collection in old.orders:
+        if collection not in new.orders:
+            ops.append({"op": "order", "path": list(collection), "ids": []})
+    return ops
+
+def apply_ops(index: StateIndex, ops: List[Dict[str, Any]]) -> StateIndex:
+    """Apply ops to a copy of an index and return it."""
+    result = index.copy()
+    for op in ops:
+        key = tuple(op["path"])
+        kind = op["op"]
+        if kind == "set":
+            result.entities.setdefault(key, {})[op["field"]] = op["value"]
+        elif kind == "unset":
+            result.entities.get(key, {}).pop(op["field"], None)
+        elif kind == "add":
+            result.entities[key] = dict(op["fields"])
+        elif kind == "remove":
+            result.entities.pop(key, None)
+        elif kind == "order":
+            if op["ids"]:
+                result.orders[key] = list(op["ids"])
+            else:
+                result.orders.pop(key, None)
+        else:
+            raise ValueError(f"Unknown patch op: {kind}")
+    return result
+
+def make_patch(old_state: Optional[Dict[str, Any]], new_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Patch between two series states (old_state None means 'from nothing')."""
+    old = StateIndex.from_state(old_state) if old_state else StateIndex()
+    return {
+        "from": (old_state or {}).get("version"),
+        "to": new_state.get("version"),
+        "ops": diff(old, StateIndex.from_state(new_state)),
+    }
+
+def apply_patch(state: Optional[Dict[str, Any]], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the new state from the previous one and a patch."""
+    old = StateIndex.from_state(state) if state else StateIndex()
+    if state is not None and patch.get("from") is not None and state.get("version") != patch["from"]:
+        raise ValueError(f"Patch is from version {patch['from']}, state is version {state.get('version')}")
+    return apply_ops(old, patch["ops"]).to_state()
+
+class SeriesDelta:
+    """
+    Keeps the last indexed state of a series and produces patches for new ones.
+
+    Usage:
+        delta = SeriesDelta()
+        patch = delta.update(state)      # server side
+        state = client.apply(patch)      # client side (another SeriesDelta)
+    """
+
+    def __init__(self):
+        self.index = StateIndex()
+        self.version: Optional[str] = None
+
+    def update(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Index a new state and return the patch from the previous one."""
+        new_index = StateIndex.from_state(state)
+        patch = {"from": self.version, "to": state.get("version"), "ops": diff(self.index, new_index)}
+        self.index = new_index
+        self.version = state.get("version")
+        return patch
+
+    def apply(self, patch: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a patch to the tracked state and return the rebuilt state."""
+        if patch.get("from") != self.version:
+            raise ValueError(f"Patch is from version {patch.get('from')}, have version {self.version}")
+        self.index = apply_ops(self.index, patch["ops"])
+        self.version = patch.get("to")
+        return self.index.to_state()
+
+    def state(self) -> Dict[str, Any]:
+        return self.index.to_state()
+
+def main():
+    args = sys.argv[1:]
+    if len(args) != 2:
+        print("Usage: python3 series_delta.py <old_state.json> <new_state.json>")
+        print("States can be files saved by series_state_api.py --save-json.")
+        return
+
+    states = []
+    for path in args:
+        if not os.path.exists(path):
+            print(f"❌ File not found: {path}")
+            return
+        with open(path, 'r') as f:
+            data = json.load(f)
+        states.append((data.get("data") or {}).get("seriesState", data))
+
+    patch = make_patch(states[0], states[1])
+    print(json.dumps(patch, indent=2))
+    full = len(json.dumps(states[1]))
+    size = len(json.dumps(patch))
+    print(f"✅ {len(patch['ops'])} ops, {size:,} bytes (full state: {full:,} bytes)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
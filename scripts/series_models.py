@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Typed series state models
+Compact __slots__ classes decoded straight from Series State API responses:
+SeriesState, TeamState, PlayerState, GameState and DraftAction.
+
+Numeric stats (kills, deaths, damage, gold, vision, ...) live in one float64
+array per record instead of a dict entry per field (float64 keeps integer
+counts and money totals exact), and IDs/names are interned, so a season of
+series states fits in a fraction of the memory the nested dicts take. Fields missing from the response decode as 0 / None.
+
+Usage:
+    state = SeriesState.from_response(get_series_state(series_id, api_key))
+    for team in state.teams:
+        print(team.name, team.kills, team.damage_dealt)
+"""
+
+import json
+import os
+import sys
+from array import array
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+
+def _intern(value: Any) -> Optional[str]:
+    """Share one string object for repeated IDs/names (team, player and champion names repeat a lot)."""
+    if value is None:
+        return None
+    return sys.intern(str(value))
+
+def _stats_properties(cls):
+    """
+    Class decorator: cls.STATS is a tuple of (attribute, API field, int/float);
+    adds a read-only property per stat backed by the record's _stats array.
+    """
+    for index, (attribute, _, kind) in enumerate(cls.STATS):
+        def getter(self, index=index, kind=kind):
+            return kind(self._stats[index])
+        setattr(cls, attribute, property(getter))
+    return cls
+
+def _decode_stats(stats: Tuple[Tuple[str, str, type], ...], data: Dict[str, Any]) -> array:
+    return array('d', [data.get(field) or 0 for _, field, _ in stats])
+
+class _Record:
+    """Shared helpers: stat access by API name and a dict view for printing/JSON."""
+
+    __slots__ = ()
+    STATS: Tuple[Tuple[str, str, type], ...] = ()
+
+    def stat(self, field: str):
+        """Stat by attribute or API field name (e.g. "damage_dealt" or "damageDealt")."""
+        for attribute, api_field, _ in self.STATS:
+            if field in (attribute, api_field):
+                return getattr(self, attribute)
+        raise KeyError(field)
+
+    def stats(self) -> Dict[str, Any]:
+        return {attribute: getattr(self, attribute) for attribute, _, _ in self.STATS}
+
+    def __repr__(self) -> str:
+        name = getattr(self, "name", None) or getattr(self, "id", None)
+        return f"{type(self).__name__}({name!r})"
+
+@_stats_properties
+class PlayerState(_Record):
+    """A player's stats in a series or in one game."""
+
+    __slots__ = ("id", "name", "character_id", "character_name", "_stats")
+    STATS = (
+        ("kills", "kills", int),
+        ("deaths", "deaths", int),
+        ("assists", "killAssistsGiven", int),
+        ("damage_dealt", "damageDealt", int),
+        ("damage_taken", "damageTaken", int),
+        ("damage_percentage", "damagePercentage", float),
+        ("vision_score", "visionScore", float),
+        ("kda_ratio", "kdaRatio", float),
+        ("gold", "totalMoneyEarned", int),
+        ("gold_per_minute", "moneyPerMinute", float),
+        ("damage_per_minute", "damagePerMinute", float),
+    )
+
+    def __init__(self, id: Optional[str], name: Optional[str], character_id: Optional[str] = None,
+                 character_name: Optional[str] = None, stats: Optional[array] = None):
+        self.id = id
+        self.name = name
+        self.character_id = character_id
+        self.character_name = character_name
+        self._stats = stats if stats is not None else array('d', bytes(8 * len(self.STATS)))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PlayerState":
+        character = data.get("character") or {}
+        return cls(_intern(data.get("id")), _intern(data.get("name")),
+                   _intern(character.get("id")), _intern(character.get("name")),
+                   _decode_stats(cls.STATS, data))
+
+    @property
+    def kda(self) -> float:
+        """(kills + assists) / max(deaths, 1), computed from the counts."""
+        return (self.kills + self.assists) / max(self.deaths, 1)
+
+@_stats_properties
+class TeamState(_Record):
+    """A team's result and stats in a series or in one game."""
+
+    __slots__ = ("id", "name", "side", "won", "players", "_stats")
+    STATS = (
+        ("score", "score", int),
+        ("kills", "kills", int),
+        ("deaths", "deaths", int),
+        ("damage_dealt", "damageDealt", int),
+        ("damage_taken", "damageTaken", int),
+        ("vision_score", "visionScore", float),
+        ("kda_ratio", "kdaRatio", float),
+        ("gold", "totalMoneyEarned", int),
+    )
+
+    def __init__(self, id: Optional[str], name: Optional[str], side: Optional[str] = None, won: bool = False,
+                 players: Tuple[PlayerState, ...] = (), stats: Optional[array] = None):
+        self.id = id
+        self.name = name
+        self.side = side
+        self.won = won
+        self.players = players
+        self._stats = stats if stats is not None else array('d', bytes(8 * len(self.STATS)))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TeamState":
+        return cls(_intern(data.get("id")), _intern(data.get("name")), _intern(data.get("side")),
+                   bool(data.get("won")),
+                   tuple(PlayerState.from_dict(player) for player in data.get("players") or []),
+                   _decode_stats(cls.STATS, data))
+
+class DraftAction(_Record):
+    """One pick or ban."""
+
+    __slots__ = ("id", "type", "sequence_number", "drafter_id", "drafter_type",
+                 "draftable_id", "draftable_type", "draftable_name")
+
+    def __init__(self, id: Optional[str], type: Optional[str], sequence_number: int,
+                 drafter_id: Optional[str], drafter_type: Optional[str],
+                 draftable_id: Optional[str], draftable_type: Optional[str], draftable_name: Optional[str]):
+        self.id = id
+        self.type = type
+        self.sequence_number = sequence_number
+        self.drafter_id = drafter_id
+        self.drafter_type = drafter_type
+        self.draftable_id = draftable_id
+        self.draftable_type = draftable_type
+        self.draftable_name = draftable_name
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DraftAction":
+        drafter = data.get("drafter") or {}
+        draftable = data.get("draftable") or {}
+        return cls(_intern(data.get("id")), _intern(data.get("type")), int(data.get("sequenceNumber") or 0),
+                   _intern(drafter.get("id")), _intern(drafter.get("type")),
+                   _intern(draftable.get("id")), _intern(draftable.get("type")), _intern(draftable.get("name")))
+
+    def __repr__(self) -> str:
+        return f"DraftAction({self.sequence_number}, {self.type!r}, {self.draftable_name!r})"
+
+class GameState(_Record):
+    """One game of a series."""
+
+    __slots__ = ("id", "sequence_number", "started", "finished", "started_at", "duration",
+                 "map_name", "teams", "draft_actions")
+
+    def __init__(self, id: Optional[str], sequence_number: int, started: bool = False, finished: bool = False,
+                 started_at: Optional[str] = None, duration: Optional[str] = None, map_name: Optional[str] = None,
+                 teams: Tuple[TeamState, ...] = (), draft_actions: Tuple[DraftAction, ...] = ()):
+        self.id = id
+        self.sequence_number = sequence_number
+        self.started = started
+        self.finished = finished
+        self.started_at = started_at
+        self.duration = duration
+        self.map_name = map_name
+        self.teams = teams
+        self.draft_actions = draft_actions
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GameState":
+        return cls(_intern(data.get("id")), int(data.get("sequenceNumber") or 0),
+                   bool(data.get("started")), bool(data.get("finished")),
+                   data.get("startedAt"), data.get("duration"), _intern((data.get("map") or {}).get("name")),
+                   tuple(TeamState.from_dict(team) for team in data.get("teams") or []),
+                   tuple(DraftAction.from_dict(action) for action in data.get("draftActions") or []))
+
+    def __repr__(self) -> str:
+        return f"GameState({self.sequence_number}, {self.map_name!r})"
+
+class SeriesState(_Record):
+    """A series with its teams (series totals) and games."""
+
+    __slots__ = ("id", "version", "title", "format", "started", "finished", "forfeited", "valid",
+                 "started_at", "duration", "teams", "games")
+
+    def __init__(self, id: Optional[str], version: Optional[str] = None, title: Optional[str] = None,
+                 format: Optional[str] = None, started: bool = False, finished: bool = False,
+                 forfeited: bool = False, valid: bool = True, started_at: Optional[str] = None,
+                 duration: Optional[str] = None, teams: Tuple[TeamState, ...] = (),
+                 games: Tuple[GameState, ...] = ()):
+        self.id = id
+        self.version = version
+        self.title = title
+        self.format = format
+        self.started = started
+        self.finished = finished
+        self.forfeited = forfeited
+        self.valid = valid
+        self.started_at = started_at
+        self.duration = duration
+        self.teams = teams
+        self.games = games
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SeriesState":
+        """Decode a seriesState object (the value under data.seriesState)."""
+        title = data.get("title")
+        if isinstance(title, dict):
+            title = title.get("nameShortened")
+        return cls(_intern(data.get("id")), data.get("version"), _intern(title), _intern(data.get("format")),
+                   bool(data.get("started")), bool(data.get("finished")), bool(data.get("forfeited")),
+                   data.get("valid") is not False, data.get("startedAt"), data.get("duration"),
+                   tuple(TeamState.from_dict(team) for team in data.get("teams") or []),
+                   tuple(GameState.from_dict(game) for game in data.get("games") or []))
+
+    @classmethod
+    def from_response(cls, result: Dict[str, Any]) -> Optional["SeriesState"]:
+        """Decode a query_graphql result; None if it has errors or no series."""
+        if result.get("errors"):
+            return None
+        data = (result.get("data") or {}).get("seriesState")
+        return cls.from_dict(data) if data else None
+
+    def players(self) -> Iterator[Tuple[TeamState, PlayerState]]:
+        """(team, player) pairs with series totals."""
+        for team in self.teams:
+            for player in team.players:
+                yield team, player
+
+    def __repr__(self) -> str:
+        teams = " vs ".join(team.name or "?" for team in self.teams)
+        return f"SeriesState({self.id!r}, {teams!r})"
+
+def decode_series_states(results: Dict[str, Dict[str, Any]]) -> Dict[str, SeriesState]:
+    """Decode the {series_id: result} mapping returned by get_series_states, skipping failures."""
+    states = {}
+    for series_id, result in results.items():
+        state = SeriesState.from_response(result)
+        if state is not None:
+            states[series_id] = state
+    return states
+
+def deep_size(obj: Any, seen: Optional[set] = None) -> int:
+    """Approximate memory footprint of an object graph in bytes (dicts, lists, records)."""
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif isinstance(obj, _Record):
+        for cls in type(obj).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(obj, name):
+                    size += deep_size(getattr(obj, name), seen)
+    return size
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        print("Usage: python3 series_models.py <series_state_<id>.json> [...]")
+        print("Files can be saved with: python3 series_state_api.py <series-id> --save-json")
+        return
+
+    dict_size = model_size = 0
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"❌ File not found: {path}")
+            continue
+        with open(path, 'r') as f:
+            result = json.load(f)
+        state = SeriesState.from_response(result)
+        if state is None:
+            print(f"⚠️  No series state in {path}")
+            continue
+        dict_size += deep_size(result["data"]["seriesState"])
+        model_size += deep_size(state)
+        print(f"✅ {state!r}: {len(state.games)} games, {sum(1 for _ in state.players())} players")
+
+    if model_size:
+        print(f"\n📦 Memory: {dict_size:,} bytes as dicts, {model_size:,} bytes as models "
+              f"({dict_size / model_size:.1f}x smaller)")
+
+if __name__ == "__main__":
+    main()
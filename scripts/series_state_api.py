@@ -5,19 +5,27 @@ Queries the Series State API to get match results, player stats, and game data.
 """
 
 import json
-import urllib.request
-import urllib.parse
-import ssl
-from typing import Dict, Any, Optional
+import re
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List
 import os
 import sys
 
 # Series State API endpoint
 SERIES_STATE_API_URL = "https://api-op.grid.gg/live-data-feed/series-state/graphql"
 
+# Batched fetches: max series per request, and max estimated fields per request
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_COMPLEXITY = 2500
+
 # Import shared utilities
 sys.path.insert(0, os.path.dirname(__file__))
 from utils import get_api_key
+from response_cache import cache
+import http_client
+import query_builder
+from series_models import SeriesState
 
 def get_headers(api_key: Optional[str] = None) -> Dict[str, str]:
     """Get request headers with API key."""
@@ -28,44 +36,22 @@ def get_headers(api_key: Optional[str] = None) -> Dict[str, str]:
         headers["x-api-key"] = api_key
     return headers
 
-def query_graphql(query: str, variables: Optional[Dict] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
+def query_graphql(query: str, variables: Optional[Dict] = None, api_key: Optional[str] = None,
+                  use_cache: bool = True) -> Dict[str, Any]:
     """Execute a GraphQL query against Series State API."""
     payload = {"query": query}
     if variables:
         payload["variables"] = variables
     
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(
-        SERIES_STATE_API_URL,
-        data=data,
-        headers=get_headers(api_key),
-        method='POST'
-    )
-    
-    ssl_context = ssl.create_default_context()
-    
     try:
-        with urllib.request.urlopen(req, context=ssl_context) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return result
-    except (ssl.SSLError, urllib.error.URLError) as e:
-        if 'CERTIFICATE_VERIFY_FAILED' in str(e) or 'certificate' in str(e).lower():
-            ssl_context = ssl._create_unverified_context()
-            with urllib.request.urlopen(req, context=ssl_context) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                return result
-        else:
-            raise
+        return http_client.post_json(SERIES_STATE_API_URL, payload, get_headers(api_key), use_cache)
     except urllib.error.HTTPError as e:
         error_body = e.read().decode('utf-8')
         print(f"HTTP Error {e.code}: {error_body}")
         raise
 
-def get_series_state(series_id: str, api_key: Optional[str] = None) -> Dict[str, Any]:
-    """Get complete series state for a Series ID."""
-    query = """
-    query SeriesState($seriesId: ID!) {
-        seriesState(id: $seriesId) {
+# Selection set of a full series state (shared by single and batched queries)
+SERIES_STATE_FIELDS = """
             id
             version
             title {
@@ -166,12 +152,110 @@ def get_series_state(series_id: str, api_key: Optional[str] = None) -> Dict[str,
                     }
                 }
             }
+"""
+
+def get_series_state(series_id: str, api_key: Optional[str] = None) -> Dict[str, Any]:
+    """Get complete series state for a Series ID."""
+    query = """
+    query SeriesState($seriesId: ID!) {
+        seriesState(id: $seriesId) {%s
         }
     }
-    """
+    """ % SERIES_STATE_FIELDS
     variables = {"seriesId": series_id}
     return query_graphql(query, variables, api_key)
 
+def get_series_state_fields(series_id: str, fields: List[str], api_key: Optional[str] = None,
+                            title: Optional[str] = "lol") -> Dict[str, Any]:
+    """
+    Get only the requested fields of a series state (see query_builder).
+
+    Example:
+        get_series_state_fields(series_id, query_builder.SCORE_FIELDS)
+    """
+    query = query_builder.series_state_query(fields, title)
+    return query_graphql(query, {"seriesId": series_id}, api_key)
+
+def selection_complexity(fields: str) -> int:
+    """Rough query cost of a selection set: the number of fields it selects."""
+    return sum(1 for token in re.findall(r'\.\.\.\s*on\s+\w+|[A-Za-z_]\w*', fields)
+               if not token.startswith('...'))
+
+def plan_batches(series_ids: List[str], fields: str = SERIES_STATE_FIELDS,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_complexity: int = DEFAULT_MAX_COMPLEXITY) -> List[List[str]]:
+    """Split series IDs into batches bounded by both size and estimated complexity."""
+    per_series = max(selection_complexity(fields), 1)
+    size = max(1, min(batch_size, max_complexity // per_series))
+    return [series_ids[i:i + size] for i in range(0, len(series_ids), size)]
+
+def build_batch_query(count: int, fields: str = SERIES_STATE_FIELDS, fragments: str = "") -> str:
+    """A query selecting seriesState once per alias s0..s<count-1>, each with its own $idN variable."""
+    params = ", ".join(f"$id{i}: ID!" for i in range(count))
+    selections = "\n".join(f"        s{i}: seriesState(id: $id{i}) {{{fields}\n        }}" for i in range(count))
+    query = f"query SeriesStates({params}) {{\n{selections}\n    }}"
+    if fragments:
+        query += "\n" + fragments
+    return query
+
+def split_batch_result(series_ids: List[str], result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Split an aliased batch response into one get_series_state-shaped result per series.
+    Errors are attributed to the alias in their path; errors without a path go to every series.
+    """
+    data = result.get("data") or {}
+    shared_errors = []
+    alias_errors: Dict[str, List[Dict[str, Any]]] = {}
+    for error in result.get("errors") or []:
+        path = error.get("path") or []
+        if path and isinstance(path[0], str) and re.fullmatch(r"s\d+", path[0]):
+            alias_errors.setdefault(path[0], []).append(error)
+        else:
+            shared_errors.append(error)
+
+    results = {}
+    for i, series_id in enumerate(series_ids):
+        alias = f"s{i}"
+        series_result: Dict[str, Any] = {"data": {"seriesState": data.get(alias)}}
+        errors = alias_errors.get(alias, []) + shared_errors
+        if errors:
+            series_result["errors"] = errors
+        results[series_id] = series_result
+    return results
+
+def fetch_batch(series_ids: List[str], api_key: Optional[str] = None,
+                fields: str = SERIES_STATE_FIELDS, fragments: str = "") -> Dict[str, Dict[str, Any]]:
+    """Fetch several series states in one aliased request."""
+    query = build_batch_query(len(series_ids), fields, fragments)
+    variables = {f"id{i}": series_id for i, series_id in enumerate(series_ids)}
+    try:
+        result = query_graphql(query, variables, api_key)
+    except Exception as e:
+        # A failed request only fails the series in this batch
+        return {series_id: {"data": {"seriesState": None}, "errors": [{"message": str(e)}]}
+                for series_id in series_ids}
+    return split_batch_result(series_ids, result)
+
+def get_series_states(series_ids: List[str], api_key: Optional[str] = None,
+                      batch_size: int = DEFAULT_BATCH_SIZE,
+                      max_complexity: int = DEFAULT_MAX_COMPLEXITY,
+                      fields: str = SERIES_STATE_FIELDS, workers: int = 4,
+                      fragments: str = "") -> Dict[str, Dict[str, Any]]:
+    """
+    Get series states for many Series IDs, packing them into aliased batch queries.
+    fields/fragments can come from query_builder.build_selection() to fetch less.
+
+    Returns:
+        {series_id: result}, where each result has the same shape as get_series_state()
+    """
+    series_ids = list(dict.fromkeys(series_ids))
+    batches = plan_batches(series_ids, fields, batch_size, max_complexity)
+    results: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as executor:
+        for batch_results in executor.map(lambda batch: fetch_batch(batch, api_key, fields, fragments), batches):
+            results.update(batch_results)
+    return {series_id: results[series_id] for series_id in series_ids}
+
 def get_latest_series_by_player(player_id: str, api_key: Optional[str] = None) -> Dict[str, Any]:
     """Get latest series state for a player."""
     query = """
@@ -210,84 +294,79 @@ def print_series_summary(series_state: Dict[str, Any]):
             print(f"   - {error.get('message', 'Unknown error')}")
         return
     
-    data = series_state.get("data", {}).get("seriesState")
-    if not data:
+    state = SeriesState.from_response(series_state)
+    if state is None:
         print("❌ No series data found")
         return
     
     print("=" * 70)
-    print(f"📊 Series: {data.get('id')}")
+    print(f"📊 Series: {state.id}")
     print("=" * 70)
-    print(f"Title: {data.get('title', {}).get('nameShortened', 'Unknown')}")
-    print(f"Format: {data.get('format', 'Unknown')}")
-    print(f"Status: {'✅ Finished' if data.get('finished') else '⏳ In Progress' if data.get('started') else '⏸️  Not Started'}")
-    if data.get('startedAt'):
-        print(f"Started: {data.get('startedAt')}")
-    if data.get('duration'):
-        print(f"Duration: {data.get('duration')}")
+    print(f"Title: {state.title or 'Unknown'}")
+    print(f"Format: {state.format or 'Unknown'}")
+    print(f"Status: {'✅ Finished' if state.finished else '⏳ In Progress' if state.started else '⏸️  Not Started'}")
+    if state.started_at:
+        print(f"Started: {state.started_at}")
+    if state.duration:
+        print(f"Duration: {state.duration}")
     print()
     
     # Teams summary
-    teams = data.get("teams", [])
-    if teams:
+    if state.teams:
         print("🏆 Teams:")
-        for team in teams:
-            won_emoji = "🏅" if team.get("won") else ""
-            print(f"  {won_emoji} {team.get('name', 'Unknown')}")
-            print(f"     Score: {team.get('score', 0)}")
-            print(f"     Kills: {team.get('kills', 0)} | Deaths: {team.get('deaths', 0)}")
-            if team.get('damageDealt'):
-                print(f"     Damage: {team.get('damageDealt'):,} dealt | {team.get('damageTaken', 0):,} taken")
-            if team.get('visionScore'):
-                print(f"     Vision Score: {team.get('visionScore'):.1f}")
+        for team in state.teams:
+            won_emoji = "🏅" if team.won else ""
+            print(f"  {won_emoji} {team.name or 'Unknown'}")
+            print(f"     Score: {team.score}")
+            print(f"     Kills: {team.kills} | Deaths: {team.deaths}")
+            if team.damage_dealt:
+                print(f"     Damage: {team.damage_dealt:,} dealt | {team.damage_taken:,} taken")
+            if team.vision_score:
+                print(f"     Vision Score: {team.vision_score:.1f}")
             print()
     
     # Games summary
-    games = data.get("games", [])
-    if games:
-        print(f"🎮 Games ({len(games)}):")
-        for game in games:
-            game_num = game.get("sequenceNumber", "?")
-            map_name = game.get("map", {}).get("name", "Unknown Map")
-            print(f"  Game {game_num}: {map_name}")
-            print(f"     Status: {'✅ Finished' if game.get('finished') else '⏳ In Progress' if game.get('started') else '⏸️  Not Started'}")
+    if state.games:
+        print(f"🎮 Games ({len(state.games)}):")
+        for game in state.games:
+            print(f"  Game {game.sequence_number or '?'}: {game.map_name or 'Unknown Map'}")
+            print(f"     Status: {'✅ Finished' if game.finished else '⏳ In Progress' if game.started else '⏸️  Not Started'}")
             
-            game_teams = game.get("teams", [])
-            for team in game_teams:
-                won_emoji = "🏅" if team.get("won") else ""
-                print(f"     {won_emoji} {team.get('name', 'Unknown')} ({team.get('side', 'Unknown')}): Score {team.get('score', 0)}")
+            for team in game.teams:
+                won_emoji = "🏅" if team.won else ""
+                print(f"     {won_emoji} {team.name or 'Unknown'} ({team.side or 'Unknown'}): Score {team.score}")
             print()
     
     # Top players
-    if teams:
+    if state.teams:
         print("⭐ Top Players (by KDA):")
-        all_players = []
-        for team in teams:
-            for player in team.get("players", []):
-                kills = player.get("kills", 0)
-                deaths = player.get("deaths", 0)
-                assists = player.get("killAssistsGiven", 0)
-                kda = (kills + assists) / max(deaths, 1)
-                all_players.append({
-                    "name": player.get("name", "Unknown"),
-                    "team": team.get("name", "Unknown"),
-                    "kills": kills,
-                    "deaths": deaths,
-                    "assists": assists,
-                    "kda": kda,
-                    "character": player.get("character", {}).get("name", "Unknown")
-                })
-        
-        all_players.sort(key=lambda x: x["kda"], reverse=True)
-        for i, player in enumerate(all_players[:5], 1):
-            print(f"  {i}. {player['name']} ({player['character']}) - {player['team']}")
-            print(f"     K/D/A: {player['kills']}/{player['deaths']}/{player['assists']} (KDA: {player['kda']:.2f})")
+        top = sorted(state.players(), key=lambda pair: pair[1].kda, reverse=True)
+        for i, (team, player) in enumerate(top[:5], 1):
+            print(f"  {i}. {player.name or 'Unknown'} ({player.character_name or 'Unknown'}) - {team.name or 'Unknown'}")
+            print(f"     K/D/A: {player.kills}/{player.deaths}/{player.assists} (KDA: {player.kda:.2f})")
 
 def main():
     # Get API key from multiple sources
     # Get API key (prioritizes .env file, then env var, then command line)
     api_key = get_api_key()
     
+    # Several Series IDs - fetch them with batched queries
+    series_ids = [arg for arg in sys.argv[1:] if arg.isdigit()]
+    if len(series_ids) > 1:
+        print(f"🔍 Querying Series State API for {len(series_ids)} series (batched)...")
+        print()
+        results = get_series_states(series_ids, api_key)
+        for series_id, result in results.items():
+            print_series_summary(result)
+            print()
+            if "--save-json" in sys.argv:
+                filename = f"series_state_{series_id}.json"
+                with open(filename, 'w') as f:
+                    json.dump(result, f, indent=2)
+                print(f"💾 Full JSON saved to: {filename}")
+        cache.print_stats()
+        return
+    
     # Get series ID (now first argument since API key is optional)
     if len(sys.argv) > 1:
         # Check if first arg looks like a series ID (numeric) or API key
@@ -318,6 +397,9 @@ def main():
             with open(filename, 'w') as f:
                 json.dump(result, f, indent=2)
             print(f"\n💾 Full JSON saved to: {filename}")
+        
+        print()
+        cache.print_stats()
     
     except Exception as e:
         print(f"❌ Error: {e}")
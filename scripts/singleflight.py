@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Request coalescing ("singleflight") for the shared HTTP transport.
+
+When an identical request (same method, endpoint, query hash, variables and
+API key) is already in flight, later callers wait for that request's result
+instead of sending their own. Each waiter gets its own copy of the result.
+
+Settings (environment variables):
+    GRID_SINGLEFLIGHT=0   disable coalescing
+"""
+
+import copy
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+import urllib.error
+from typing import Dict, Any, Optional, Callable, TypeVar
+
+sys.path.insert(0, os.path.dirname(__file__))
+from response_cache import cache_key, credentials_hash
+
+T = TypeVar("T")
+
+def request_key(method: str, url: str, payload: Optional[Dict[str, Any]] = None,
+                headers: Optional[Dict[str, str]] = None) -> str:
+    """Key for a request: method + endpoint + normalised query hash + variables + credentials."""
+    # Different API keys may see different data, so they never share a result
+    material = json.dumps({
+        "method": method,
+        "request": cache_key(url, payload, headers) if payload is not None else url,
+        "credentials": credentials_hash(headers),
+    }, sort_keys=True)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+def _copy_error(error: BaseException) -> BaseException:
+    """HTTPError bodies can only be read once; give each waiter its own."""
+    if isinstance(error, urllib.error.HTTPError) and isinstance(error.fp, io.BytesIO):
+        return urllib.error.HTTPError(error.url, error.code, error.msg, error.hdrs,
+                                      io.BytesIO(error.fp.getvalue()))
+    return error
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+class SingleFlight:
+    """Thread-safe in-flight request table with executed/coalesced counters."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """
+        Run func, or wait for the identical call already running under key.
+        Exceptions from the shared call are raised in every caller.
+        """
+        if not self.enabled:
+            return func()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise _copy_error(call.error)
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        # Waiters copy the result, so the leader can hand out the original
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.executed + self.coalesced
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "saved": self.coalesced / total if total else 0.0,
+            }
+
+    def print_stats(self):
+        """Print coalescing counters (nothing if no request was coalesced)."""
+        s = self.stats()
+        if not s["coalesced"]:
+            return
+        print(f"🔀 Singleflight: {s['executed']} requests sent, {s['coalesced']} coalesced "
+              f"({s['saved'] * 100:.0f}% of calls)")
+
+# In-flight table shared by every client in the process
+inflight = SingleFlight(enabled=os.getenv("GRID_SINGLEFLIGHT", "1") != "0")
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Per-minute Game Timelines
+Buckets the events of one or many series (via the columnar event_store)
+into per-minute NumPy matrices per player and per team: gold, XP, damage,
+CS, kills, deaths and objectives. Derived curves such as the gold difference
+and the gold lead at 10/15/20 minutes are computed for whole batches of
+games at once.
+
+Every matrix is built with np.bincount over (row, minute) indexes, so the
+only Python loop is over games.
+
+Requires NumPy (optional dependency: pip install numpy).
+"""
+
+import os
+import sys
+import time
+from typing import Dict, Any, Optional, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+from event_store import EventColumns, load_events
+from game_state import OBJECTIVE_WORDS
+
+# Minutes at which gold leads are reported by default
+DEFAULT_LEAD_MINUTES = (10, 15, 20)
+
+# Event types containing one of these words are creep score (minion/monster kills)
+CS_WORDS = ("minion", "creep", "monster", "jungle")
+
+# Numeric columns summed per player and minute
+SUM_METRICS = ("gold", "xp", "damage")
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("timeline requires NumPy: pip install numpy")
+
+def codes_matching(columns: EventColumns, words: Iterable[str], exclude: Iterable[str] = ()) -> List[int]:
+    """Type codes whose name contains one of the words (and none of exclude)."""
+    return [code for code, name in enumerate(columns.types.values)
+            if any(word in name for word in words) and not any(word in name for word in exclude)]
+
+class MinuteTimeline:
+    """
+    Per-minute matrices for one game.
+
+    Player matrices are (players x minutes), team matrices (teams x minutes);
+    column m covers game time [m, m + 1) minutes.
+    """
+
+    def __init__(self, series: str, game: int, players: List[str], teams: List[str],
+                 player_team, matrices: Dict[str, Any], objectives: Dict[str, Any]):
+        self.series = series
+        self.game = game
+        self.players = players
+        self.teams = teams
+        self.player_team = player_team          # team index of each player (-1 unknown)
+        self.matrices = matrices                # metric -> (players x minutes)
+        self.objectives = objectives            # objective type -> (teams x minutes) counts
+
+    @property
+    def minutes(self) -> int:
+        return self.matrices["gold"].shape[1]
+
+    def player(self, metric: str, cumulative: bool = False):
+        matrix = self.matrices[metric]
+        return np.cumsum(matrix, axis=1) if cumulative else matrix
+
+    def team(self, metric: str, cumulative: bool = False):
+        """Team totals of a player metric (teams x minutes)."""
+        one_hot = np.zeros((len(self.teams), len(self.players)), dtype=np.float64)
+        known = self.player_team >= 0
+        one_hot[self.player_team[known], np.nonzero(known)[0]] = 1.0
+        matrix = one_hot @ self.matrices[metric]
+        return np.cumsum(matrix, axis=1) if cumulative else matrix
+
+    def team_objectives(self, cumulative: bool = False):
+        """All objectives per team and minute."""
+        total = np.zeros((len(self.teams), self.minutes), dtype=np.float64)
+        for matrix in self.objectives.values():
+            total += matrix
+        return np.cumsum(total, axis=1) if cumulative else total
+
+    def gold_diff(self):
+        """Cumulative gold of teams[0] minus teams[1] at the end of each minute."""
+        gold = self.team("gold", cumulative=True)
+        if gold.shape[0] < 2:
+            return np.zeros(self.minutes, dtype=np.float64)
+        return gold[0] - gold[1]
+
+def game_timelines(columns: EventColumns, series: Optional[str] = None) -> List[MinuteTimeline]:
+    """Build the timeline of every game in one series' columns."""
+    _require_numpy()
+    series = series or columns.meta.get("source", "")
+    minutes = columns.game_minutes()
+    games = np.asarray(columns["game"])
+    codes = {
+        "kill": codes_matching(columns, ("kill",), exclude=CS_WORDS + OBJECTIVE_WORDS),
+        "cs": codes_matching(columns, CS_WORDS),
+        "objective": codes_matching(columns, OBJECTIVE_WORDS),
+    }
+
+    timelines = []
+    for game in np.unique(games[games >= 0]).tolist():
+        rows = (games == game) & ~np.isnan(minutes)
+        if not rows.any():
+            continue
+        selected = {name: np.asarray(columns[name])[rows]
+                    for name in ("actor", "target", "team", "type") + SUM_METRICS}
+        selected["minute"] = minutes[rows].astype(np.int64)
+        timelines.append(_game_timeline(series, game, columns, selected, codes))
+    return timelines
+
+def _game_timeline(series: str, game: int, columns: EventColumns, rows: Dict[str, Any],
+                   codes: Dict[str, List[int]]) -> MinuteTimeline:
+    minute, actor, target, team, types = rows["minute"], rows["actor"], rows["target"], rows["team"], rows["type"]
+    n_minutes = int(minute.max()) + 1
+    n_ids = len(columns.ids.values)
+
+    # Teams: every ID seen in the team column; players: every other actor.
+    # Lookup tables have one extra slot so code -1 maps to "none".
+    team_codes = np.unique(team[team >= 0])
+    is_team = np.zeros(n_ids + 1, dtype=bool)
+    is_team[team_codes] = True
+    player_codes = np.unique(actor[(actor >= 0) & ~is_team[actor]])
+    n_players, n_teams = len(player_codes), len(team_codes)
+
+    player_index = np.full(n_ids + 1, -1, dtype=np.int64)
+    player_index[player_codes] = np.arange(n_players)
+    team_index = np.full(n_ids + 1, -1, dtype=np.int64)
+    team_index[team_codes] = np.arange(n_teams)
+
+    # Each player's team is the one most often reported alongside them
+    player_team = np.full(n_players, -1, dtype=np.int64)
+    known = (player_index[actor] >= 0) & (team >= 0)
+    if known.any():
+        pairs = player_index[actor[known]] * n_teams + team_index[team[known]]
+        counts = np.bincount(pairs, minlength=n_players * n_teams).reshape(n_players, n_teams)
+        has_team = counts.sum(axis=1) > 0
+        player_team[has_team] = counts[has_team].argmax(axis=1)
+
+    def matrix(index, n_rows: int, weights=None):
+        """(n_rows x n_minutes) sums of weights (or counts) at flat row*n_minutes+minute indexes."""
+        counts = np.bincount(index, weights=weights, minlength=n_rows * n_minutes)
+        return counts.astype(np.float64).reshape(n_rows, n_minutes)
+
+    p = player_index[actor]
+    is_player = p >= 0
+    flat = p[is_player] * n_minutes + minute[is_player]
+    player_types = types[is_player]
+
+    matrices = {metric: matrix(flat, n_players, rows[metric][is_player].astype(np.float64))
+                for metric in SUM_METRICS}
+    kills = np.isin(player_types, codes["kill"])
+    matrices["kills"] = matrix(flat[kills], n_players)
+    cs = np.isin(player_types, codes["cs"])
+    matrices["cs"] = matrix(flat[cs], n_players)
+
+    victim = player_index[target]
+    died = (victim >= 0) & np.isin(types, codes["kill"])
+    matrices["deaths"] = matrix(victim[died] * n_minutes + minute[died], n_players)
+
+    # Objectives go to the actor's team (the team column, or the player's own team)
+    objective_team = team_index[team]
+    from_player = (objective_team < 0) & is_player
+    objective_team[from_player] = player_team[p[from_player]]
+    objectives = {}
+    for code in codes["objective"]:
+        taken = (types == code) & (objective_team >= 0)
+        if taken.any():
+            objectives[columns.types.values[code]] = matrix(
+                objective_team[taken] * n_minutes + minute[taken], n_teams)
+
+    return MinuteTimeline(series, game, [columns.ids.values[c] for c in player_codes.tolist()],
+                        [columns.ids.values[c] for c in team_codes.tolist()], player_team, matrices, objectives)
+
+def stack_curves(timelines: List[MinuteTimeline], curve: str = "gold_diff"):
+    """
+    Stack one per-minute curve of many games into a (games x max minutes)
+    matrix, padding shorter games with NaN.
+    """
+    _require_numpy()
+    curves = [getattr(timeline, curve)() for timeline in timelines]
+    width = max((len(c) for c in curves), default=0)
+    stacked = np.full((len(curves), width), np.nan, dtype=np.float64)
+    for row, values in enumerate(curves):
+        stacked[row, :len(values)] = values
+    return stacked
+
+def gold_leads(timelines: List[MinuteTimeline], at: Iterable[int] = DEFAULT_LEAD_MINUTES):
+    """
+    Gold lead of teams[0] over teams[1] at the given minutes for every game
+    ((games x len(at)), NaN where a game ended earlier).
+    """
+    _require_numpy()
+    at = list(at)
+    stacked = stack_curves(timelines, "gold_diff")
+    leads = np.full((len(timelines), len(at)), np.nan, dtype=np.float64)
+    for column, minute in enumerate(at):
+        # The lead at minute m is the cumulative total after minutes [0, m)
+        if 0 < minute <= stacked.shape[1]:
+            leads[:, column] = stacked[:, minute - 1]
+    return leads
+
+def load_timelines(paths: Iterable[str]) -> List[MinuteTimeline]:
+    """Timelines of every game in many series' events files (stores are converted on first use)."""
+    timelines = []
+    for path in paths:
+        timelines.extend(game_timelines(load_events(path), os.path.basename(path)))
+    return timelines
+
+def main():
+    args = sys.argv[1:]
+    at = DEFAULT_LEAD_MINUTES
+    if "--at" in args:
+        index = args.index("--at")
+        at = tuple(int(m) for m in args[index + 1].split(","))
+        del args[index:index + 2]
+
+    if not args:
+        print("Usage: python3 timeline.py <events_<id>_grid.jsonl[.zip]> [...] [--at 10,15,20]")
+        return
+
+    if np is None:
+        print("❌ NumPy is required: pip install numpy")
+        return
+
+    started = time.perf_counter()
+    timelines = load_timelines(path for path in args if os.path.exists(path))
+    leads = gold_leads(timelines, at)
+    elapsed = time.perf_counter() - started
+
+    header = " | ".join(f"@{m:>2}m" for m in at)
+    print(f"📈 Gold lead (first team - second team): {header}")
+    for timeline, row in zip(timelines, leads):
+        teams = " vs ".join(timeline.teams[:2]) or "?"
+        values = " | ".join(f"{value:>+6.0f}" if not np.isnan(value) else "     -" for value in row)
+        print(f"  {timeline.series} game {timeline.game} ({teams}, {timeline.minutes} min): {values}")
+    print(f"✅ {len(timelines)} games in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Tournament Tree Crawler
+Walks the whole tournament hierarchy of a title (optionally only the
+sub-trees whose root name matches a region/league, e.g. "LCS") and lists
+every series in it.
+
+The tree is expanded locally from one paginated tournaments listing (each
+tournament's parent ID), then every tournament's own series list is fetched
+concurrently. Series IDs are de-duplicated and streamed as pages arrive.
+
+Series IDs go to stdout (one per line) so they can be piped into
+bulk_download.py --stdin; progress goes to stderr.
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Iterator, List, Set
+
+# Import shared functions
+sys.path.insert(0, os.path.dirname(__file__))
+import http_client
+from api_explorer import paginate, paginate_pages, GraphQLError, DEFAULT_PAGE_SIZE
+from catalog import Catalog
+from rate_limiter import scheduler
+from utils import get_api_key
+
+# Default number of tournaments fetched in parallel
+DEFAULT_WORKERS = 8
+
+TREE_QUERY = """
+query TournamentTree($filter: TournamentFilter, $first: Int, $after: Cursor) {
+    tournaments(filter: $filter, first: $first, after: $after) {
+        edges {
+            node {
+                id
+                name
+                parent {
+                    id
+                }
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+# Series of exactly one tournament; the crawler expands children itself
+TOURNAMENT_SERIES_QUERY = """
+query TournamentSeries($tournamentId: [ID!]!, $first: Int, $after: Cursor) {
+    allSeries(
+        filter: { tournament: { id: { in: $tournamentId }, includeChildren: { equals: false } } }
+        orderBy: StartTimeScheduled
+        first: $first
+        after: $after
+    ) {
+        edges {
+            node {
+                id
+                startTimeScheduled
+                format {
+                    nameShortened
+                }
+                teams {
+                    baseInfo {
+                        id
+                        name
+                    }
+                }
+            }
+        }
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+    }
+}
+"""
+
+def tournament_tree(title_id: str, api_key: Optional[str] = None, root_name: Optional[str] = None,
+                    page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+    """
+    Tournaments of a title, parents before children. With root_name, only the
+    sub-trees under tournaments whose name contains it (case-insensitive).
+    """
+    variables = {"filter": {"title": {"id": {"in": [title_id]}}}}
+    tournaments = {}
+    children: Dict[Optional[str], List[str]] = {}
+    for node in paginate(TREE_QUERY, "tournaments", variables, api_key, page_size):
+        parent_id = (node.get("parent") or {}).get("id")
+        tournaments[node["id"]] = {"id": node["id"], "name": node.get("name", ""), "parentId": parent_id}
+        children.setdefault(parent_id, []).append(node["id"])
+
+    if root_name:
+        needle = root_name.lower()
+        matches = {t_id for t_id, t in tournaments.items() if needle in t["name"].lower()}
+        # A match nested under another match is already covered by that sub-tree
+        roots = [t_id for t_id in matches if tournaments[t_id]["parentId"] not in matches]
+    else:
+        # Tournaments whose parent is missing from the listing are roots too
+        roots = [t_id for t_id, t in tournaments.items() if t["parentId"] not in tournaments]
+
+    ordered = []
+    seen: Set[str] = set()
+    stack = sorted(roots, reverse=True)
+    while stack:
+        t_id = stack.pop()
+        if t_id in seen:
+            continue
+        seen.add(t_id)
+        ordered.append(tournaments[t_id])
+        stack.extend(sorted(children.get(t_id, []), reverse=True))
+    return ordered
+
+class TournamentCrawler:
+    """
+    Fetches the series of many tournaments concurrently.
+
+    Usage:
+        crawler = TournamentCrawler(api_key)
+        for series in crawler.crawl(tournament_tree(title_id, api_key, "LCS")):
+            print(series["id"])
+    """
+
+    def __init__(self, api_key: Optional[str] = None, workers: int = DEFAULT_WORKERS,
+                 page_size: int = DEFAULT_PAGE_SIZE, progress: bool = True):
+        self.api_key = api_key
+        self.workers = workers
+        self.page_size = page_size
+        self.progress = progress
+        self.series_seen: Set[str] = set()
+        self.duplicates = 0
+        self.pages = 0
+        self.tournaments_done = 0
+        self.failed: List[str] = []
+        self.started = 0.0
+        http_client.ensure_pool_size(workers)
+
+    def _fetch(self, tournament: Dict[str, Any], results: "queue.Queue", stop: threading.Event):
+        try:
+            variables = {"tournamentId": [tournament["id"]]}
+            for page in paginate_pages(TOURNAMENT_SERIES_QUERY, "allSeries", variables,
+                                       self.api_key, self.page_size):
+                if stop.is_set():
+                    break
+                results.put(("page", tournament, [edge["node"] for edge in page.get("edges") or []]))
+        except Exception as e:
+            # Report anything (HTTP, GraphQL, unexpected payloads) as a failed tournament
+            results.put(("error", tournament, e))
+        finally:
+            # crawl() counts "done" messages, so one must be posted whatever happens
+            results.put(("done", tournament, None))
+
+    def crawl(self, tournaments: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield each distinct series (with its tournamentId/tournamentName) as pages arrive."""
+        self.started = time.perf_counter()
+        results: "queue.Queue" = queue.Queue()
+        stop = threading.Event()
+        total = len(tournaments)
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="grid-crawl")
+        try:
+            for tournament in tournaments:
+                executor.submit(self._fetch, tournament, results, stop)
+
+            remaining = total
+            while remaining:
+                kind, tournament, payload = results.get()
+                if kind == "page":
+                    self.pages += 1
+                    for node in payload:
+                        if node["id"] in self.series_seen:
+                            self.duplicates += 1
+                            continue
+                        self.series_seen.add(node["id"])
+                        node["tournamentId"] = tournament["id"]
+                        node["tournamentName"] = tournament["name"]
+                        yield node
+                elif kind == "error":
+                    self.failed.append(tournament["id"])
+                    self._log(f"  ❌ {tournament['name']} ({tournament['id']}): {payload}")
+                else:
+                    remaining -= 1
+                    self.tournaments_done += 1
+                    self._report(total)
+        finally:
+            # Stop outstanding fetches early if the consumer stops iterating
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _report(self, total: int):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        self._log(f"  [{self.tournaments_done}/{total} tournaments] {len(self.series_seen):,} series, "
+                  f"{self.pages} pages ({len(self.series_seen) / elapsed:,.1f} series/s, "
+                  f"{self.pages / elapsed:.1f} pages/s)")
+
+    def _log(self, message: str):
+        if self.progress:
+            print(message, file=sys.stderr, flush=True)
+
+def resolve_title(name_or_id: str, api_key: Optional[str] = None) -> Optional[str]:
+    """Title ID from a numeric ID or a name (via the local catalog)."""
+    if name_or_id.isdigit():
+        return name_or_id
+    catalog = Catalog()
+    title = catalog.find_title(name_or_id)
+    if title is None:
+        catalog.sync_titles(api_key)
+        title = catalog.find_title(name_or_id)
+    return title["id"] if title else None
+
+def main():
+    # Get API key (prioritizes .env file, then env var, then command line)
+    api_key = get_api_key()
+
+    args = sys.argv[1:]
+
+    def option(name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in args:
+            return args[args.index(name) + 1]
+        return default
+
+    if not option("--title"):
+        print("Usage: python3 tournament_crawler.py --title NAME|ID [--region NAME] [--workers N] "
+              "[--output series.jsonl]", file=sys.stderr)
+        print("Example: python3 tournament_crawler.py --title lol --region LCS | "
+              "python3 bulk_download.py --stdin", file=sys.stderr)
+        return
+
+    title_id = resolve_title(option("--title"), api_key)
+    if title_id is None:
+        print(f"❌ Unknown title: {option('--title')}", file=sys.stderr)
+        return
+    region = option("--region")
+    workers = int(option("--workers", str(DEFAULT_WORKERS)))
+
+    print(f"🌳 Expanding tournament tree for title {title_id}" + (f" ({region})" if region else "") + "...",
+          file=sys.stderr)
+    try:
+        tournaments = tournament_tree(title_id, api_key, region)
+    except GraphQLError as e:
+        print(f"❌ Could not list tournaments: {e}", file=sys.stderr)
+        return
+    print(f"🔍 Crawling {len(tournaments)} tournaments with {workers} workers...", file=sys.stderr)
+
+    crawler = TournamentCrawler(api_key, workers)
+    output = open(option("--output"), 'w') if option("--output") else None
+    try:
+        for series in crawler.crawl(tournaments):
+            if output:
+                output.write(json.dumps(series) + "\n")
+            else:
+                print(series["id"], flush=True)
+    finally:
+        if output:
+            output.close()
+
+    elapsed = time.perf_counter() - crawler.started
+    print(f"✅ {len(crawler.series_seen):,} series ({crawler.duplicates} duplicates skipped) from "
+          f"{crawler.tournaments_done} tournaments in {elapsed:.1f}s; {len(crawler.failed)} failed", file=sys.stderr)
+    if output:
+        print(f"💾 Saved to: {option('--output')}", file=sys.stderr)
+        # stdout only carries series IDs when not writing a file
+        scheduler.print_stats()
+
+if __name__ == "__main__":
+    main()